@@ -0,0 +1,55 @@
+"""add active card count to columns
+
+Revision ID: 193a6262e16d
+Revises: 4ff61faf117e
+Create Date: 2026-10-17 18:21:25.517373
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "193a6262e16d"
+down_revision: Union[str, Sequence[str], None] = "4ff61faf117e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "board_columns",
+        sa.Column(
+            "active_card_count",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+    )
+    op.execute("""
+        UPDATE board_columns
+        SET active_card_count = counts.active
+        FROM (
+            SELECT column_id, count(*) AS active
+            FROM cards
+            WHERE deleted_at IS NULL
+            GROUP BY column_id
+        ) AS counts
+        WHERE board_columns.id = counts.column_id
+        """)
+    op.create_check_constraint(
+        "ck_columns_active_card_count_nonneg",
+        "board_columns",
+        "active_card_count >= 0",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "ck_columns_active_card_count_nonneg", "board_columns", type_="check"
+    )
+    op.drop_column("board_columns", "active_card_count")
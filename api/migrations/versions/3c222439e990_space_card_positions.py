@@ -0,0 +1,54 @@
+"""space card positions
+
+Revision ID: 3c222439e990
+Revises: b524acb86b7e
+Create Date: 2026-10-17 18:17:02.926511
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c222439e990"
+down_revision: Union[str, Sequence[str], None] = "b524acb86b7e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+POSITION_GAP = 1024
+
+
+def _renumber_cards(position_sql: str) -> None:
+    # Every card moves, so every board with cards gets a new revision and delta
+    # clients refetch positions instead of mixing the two numbering schemes.
+    op.drop_constraint("uq_cards_column_position", "cards", type_="unique")
+    op.execute("""
+        UPDATE boards SET revision = revision + 1
+        WHERE id IN (SELECT DISTINCT board_id FROM cards)
+        """)
+    op.execute(f"""
+        UPDATE cards
+        SET position = {position_sql}, revision = boards.revision
+        FROM (
+            SELECT id,
+                   row_number() OVER (
+                       PARTITION BY column_id ORDER BY position, id
+                   ) AS rank
+            FROM cards
+        ) AS ranked, boards
+        WHERE cards.id = ranked.id AND boards.id = cards.board_id
+        """)
+    op.create_unique_constraint(
+        "uq_cards_column_position", "cards", ["column_id", "position"]
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _renumber_cards(f"ranked.rank * {POSITION_GAP}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _renumber_cards("ranked.rank - 1")
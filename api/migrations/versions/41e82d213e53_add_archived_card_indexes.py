@@ -0,0 +1,42 @@
+"""add archived card indexes
+
+Revision ID: 41e82d213e53
+Revises: df2015148004
+Create Date: 2026-10-17 18:31:46.648818
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "41e82d213e53"
+down_revision: Union[str, Sequence[str], None] = "df2015148004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_cards_board_archived",
+        "cards",
+        ["board_id", sa.text("deleted_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+        postgresql_include=["public_id", "title", "column_id"],
+    )
+    op.create_index(
+        "ix_cards_column_archived",
+        "cards",
+        ["column_id", sa.text("deleted_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+        postgresql_include=["public_id", "title", "board_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_cards_column_archived", table_name="cards")
+    op.drop_index("ix_cards_board_archived", table_name="cards")
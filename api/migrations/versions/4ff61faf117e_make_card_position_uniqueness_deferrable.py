@@ -0,0 +1,37 @@
+"""make card position uniqueness deferrable
+
+Revision ID: 4ff61faf117e
+Revises: 3c222439e990
+Create Date: 2026-10-17 18:19:20.432157
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4ff61faf117e"
+down_revision: Union[str, Sequence[str], None] = "3c222439e990"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint("uq_cards_column_position", "cards", type_="unique")
+    op.create_unique_constraint(
+        "uq_cards_column_position",
+        "cards",
+        ["column_id", "position"],
+        deferrable=True,
+        initially="IMMEDIATE",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_cards_column_position", "cards", type_="unique")
+    op.create_unique_constraint(
+        "uq_cards_column_position", "cards", ["column_id", "position"]
+    )
@@ -0,0 +1,36 @@
+"""member listing indexes
+
+Revision ID: 6c813c13c2cd
+Revises: 88b5efc4c9ca
+Create Date: 2026-10-17 18:41:25.626620
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "6c813c13c2cd"
+down_revision: Union[str, Sequence[str], None] = "88b5efc4c9ca"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_room_members_room_role", "room_members", ["room_id", "role"])
+    op.drop_index("ix_room_members_room_id", table_name="room_members")
+    op.create_index(
+        "ix_users_sort_name",
+        "users",
+        [sa.text("lower(coalesce(display_name, name)) text_pattern_ops")],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_sort_name", table_name="users")
+    op.create_index("ix_room_members_room_id", "room_members", ["room_id"])
+    op.drop_index("ix_room_members_room_role", table_name="room_members")
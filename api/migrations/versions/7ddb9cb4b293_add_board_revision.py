@@ -0,0 +1,33 @@
+"""add board revision
+
+Revision ID: 7ddb9cb4b293
+Revises: e0a7d8f3c6aa
+Create Date: 2026-10-17 18:10:58.885980
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7ddb9cb4b293"
+down_revision: Union[str, Sequence[str], None] = "e0a7d8f3c6aa"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "boards",
+        sa.Column(
+            "revision", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("boards", "revision")
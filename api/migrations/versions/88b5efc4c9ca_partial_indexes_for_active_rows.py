@@ -0,0 +1,59 @@
+"""partial indexes for active rows
+
+Revision ID: 88b5efc4c9ca
+Revises: 41e82d213e53
+Create Date: 2026-10-17 18:33:28.568000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "88b5efc4c9ca"
+down_revision: Union[str, Sequence[str], None] = "41e82d213e53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ACTIVE_INDEXES = (
+    ("ix_cards_board_active", "cards", ["board_id", "column_id", "position"]),
+    ("ix_cards_column_active", "cards", ["column_id", "position"]),
+    ("ix_board_columns_board_active", "board_columns", ["board_id", "position"]),
+    ("ix_boards_room_active", "boards", ["room_id"]),
+    ("ix_invites_room_active", "invites", ["room_id", "created_at"]),
+)
+DELETED_AT_TABLES = ("cards", "board_columns", "boards", "invites")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in ACTIVE_INDEXES:
+        op.create_index(
+            name, table, columns, postgresql_where=sa.text("deleted_at IS NULL")
+        )
+    op.drop_index("ix_cards_board_column_position", table_name="cards")
+    # Superseded by ix_board_columns_board_active for active reads and by
+    # ix_board_columns_board_revision for everything else.
+    op.drop_index("ix_board_columns_board_id", table_name="board_columns")
+    # Board lookups by room only ever want active boards.
+    op.drop_index("ix_boards_room_id", table_name="boards")
+    for table in DELETED_AT_TABLES:
+        op.drop_index(f"ix_{table}_deleted_at", table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in DELETED_AT_TABLES:
+        op.create_index(f"ix_{table}_deleted_at", table, ["deleted_at"])
+    op.create_index("ix_boards_room_id", "boards", ["room_id"])
+    op.create_index("ix_board_columns_board_id", "board_columns", ["board_id"])
+    op.create_index(
+        "ix_cards_board_column_position",
+        "cards",
+        ["board_id", "column_id", "position"],
+    )
+    for name, table, _ in reversed(ACTIVE_INDEXES):
+        op.drop_index(name, table_name=table)
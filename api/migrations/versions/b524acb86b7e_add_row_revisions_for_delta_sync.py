@@ -0,0 +1,61 @@
+"""add row revisions for delta sync
+
+Revision ID: b524acb86b7e
+Revises: 7ddb9cb4b293
+Create Date: 2026-10-17 18:11:58.379938
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b524acb86b7e"
+down_revision: Union[str, Sequence[str], None] = "7ddb9cb4b293"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "boards",
+        sa.Column(
+            "purged_revision",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "board_columns",
+        sa.Column(
+            "revision", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+    op.add_column(
+        "cards",
+        sa.Column(
+            "revision", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+    op.create_index(
+        "ix_board_columns_board_revision",
+        "board_columns",
+        ["board_id", "revision"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_cards_board_revision", "cards", ["board_id", "revision"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_cards_board_revision", table_name="cards")
+    op.drop_index("ix_board_columns_board_revision", table_name="board_columns")
+    op.drop_column("cards", "revision")
+    op.drop_column("board_columns", "revision")
+    op.drop_column("boards", "purged_revision")
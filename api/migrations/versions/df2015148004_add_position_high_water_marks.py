@@ -0,0 +1,66 @@
+"""add position high water marks
+
+Revision ID: df2015148004
+Revises: 193a6262e16d
+Create Date: 2026-10-17 18:23:36.905044
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "df2015148004"
+down_revision: Union[str, Sequence[str], None] = "193a6262e16d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "boards",
+        sa.Column(
+            "next_column_position",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "board_columns",
+        sa.Column(
+            "next_card_position",
+            sa.Integer(),
+            server_default=sa.text("1024"),
+            nullable=False,
+        ),
+    )
+    op.execute("""
+        UPDATE boards
+        SET next_column_position = GREATEST(marks.highest + 1, marks.total)
+        FROM (
+            SELECT board_id, max(position) AS highest, count(*) AS total
+            FROM board_columns
+            GROUP BY board_id
+        ) AS marks
+        WHERE boards.id = marks.board_id
+        """)
+    op.execute("""
+        UPDATE board_columns
+        SET next_card_position = marks.highest + 1024
+        FROM (
+            SELECT column_id, max(position) AS highest
+            FROM cards
+            GROUP BY column_id
+        ) AS marks
+        WHERE board_columns.id = marks.column_id
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("board_columns", "next_card_position")
+    op.drop_column("boards", "next_column_position")
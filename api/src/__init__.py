@@ -1,12 +1,16 @@
 import logging
 from flask import Flask, jsonify, request
-from sqlalchemy.exc import IntegrityError
+from psycopg.errors import LockNotAvailable, QueryCanceled
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from werkzeug.exceptions import HTTPException
 from werkzeug.middleware.proxy_fix import ProxyFix
 
 from .config import DevConfig, ProdConfig
 from .domain.exceptions import AppError
 from .extensions import db
+from .jobs import register_jobs
+from .persistence.engine import install_request_timeouts
 
 handlers: list[logging.Handler] = [logging.StreamHandler()]
 try:
@@ -43,11 +47,13 @@ def register_cors(app: Flask) -> None:
 
 def register_blueprints(app: Flask) -> None:
     from .healthz import bp as health_bp
+    from .internal import bp as internal_bp
     from .routes import api_bp
     from .routes.auth import auth_bp
     from .routes.users import account_bp
 
     app.register_blueprint(health_bp)
+    app.register_blueprint(internal_bp)
     app.register_blueprint(auth_bp)
     app.register_blueprint(account_bp)
     app.register_blueprint(api_bp)
@@ -61,12 +67,25 @@ def register_request_hook(app: Flask) -> None:
         load_current_user()
 
 
+def check_database_config(app: Flask) -> None:
+    # LISTEN is session state, which a transaction pooler does not keep.
+    if app.config["DB_POOLER_MODE"] == "transaction" and not app.config.get(
+        "BOARD_EVENTS_DATABASE_URL"
+    ):
+        raise RuntimeError(
+            "DB_POOLER_MODE=transaction requires BOARD_EVENTS_DATABASE_URL "
+            "to point at Postgres directly."
+        )
+
+
 def register_error_handlers(app: Flask) -> None:
 
     @app.errorhandler(AppError)
     def handle_app_error(e: AppError):
         body = e.to_problem(instance=request.path)
-        return jsonify(body), e.status_code
+        retry_after = getattr(e, "retry_after", None)
+        headers = {"Retry-After": str(retry_after)} if retry_after else {}
+        return jsonify(body), e.status_code, headers
 
     @app.errorhandler(HTTPException)
     def handle_http_exception(e: HTTPException):
@@ -92,6 +111,26 @@ def register_error_handlers(app: Flask) -> None:
         }
         return jsonify(body), 409
 
+    @app.errorhandler(OperationalError)
+    @app.errorhandler(PoolTimeoutError)
+    def handle_database_busy(e):
+        # Timeouts (statement, lock or pool checkout) mean the database is
+        # saturated, not that the request is wrong; ask the client to retry.
+        if isinstance(e, OperationalError) and not isinstance(
+            e.orig, (QueryCanceled, LockNotAvailable)
+        ):
+            return handle_unexpected(e)
+        app.logger.warning("Database timeout on %s: %s", request.path, e)
+        db.session.rollback()
+        body = {
+            "type": "https://httpstatuses.com/503",
+            "title": "Service Unavailable",
+            "status": 503,
+            "detail": "The database is busy. Please try again shortly.",
+            "instance": request.path,
+        }
+        return jsonify(body), 503, {"Retry-After": "1"}
+
     @app.errorhandler(Exception)
     def handle_unexpected(e: Exception):
         logger.error(f"Unexpected error: {str(e)}", exc_info=True)
@@ -110,6 +149,7 @@ def create_app():
     from os import getenv
     cfg = ProdConfig if getenv("FLASK_ENV", "").lower() == "production" else DevConfig
     app.config.from_object(cfg)
+    check_database_config(app)
 
     app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_port=1)
     db.init_app(app)
@@ -119,5 +159,7 @@ def create_app():
     register_blueprints(app)
     register_request_hook(app)
     register_error_handlers(app)
+    install_request_timeouts(db.session)
+    register_jobs(app)
 
     return app
@@ -10,17 +10,98 @@ def _parse_origins() -> List[str]:
     ]
 
 
+def pooler_connect_args(mode: str) -> dict:
+    """
+    psycopg connect arguments for how DATABASE_URL is pooled. Behind a
+    transaction pooler (PgBouncer pool_mode=transaction) consecutive
+    transactions may run on different server connections, so psycopg must not
+    prepare statements server-side.
+    """
+    if mode == "session":
+        return {}
+    if mode == "transaction":
+        return {"prepare_threshold": None}
+    raise ValueError(
+        f"DB_POOLER_MODE must be 'session' or 'transaction', not {mode!r}."
+    )
+
+
 class BaseConfig:
     SECRET_KEY = os.getenv("SECRET_KEY")
 
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # "transaction" when DATABASE_URL goes through PgBouncer in transaction
+    # pooling mode. LISTEN then needs BOARD_EVENTS_DATABASE_URL pointing at
+    # Postgres directly.
+    DB_POOLER_MODE = os.getenv("DB_POOLER_MODE", "session")
+    # Must match the gunicorn flags in docker/scripts/entrypoint.sh. Each
+    # worker gets a pool of one connection per thread plus DB_MAX_OVERFLOW for
+    # the job scheduler and event streams, so Postgres sees at most
+    # GUNICORN_WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW) app connections.
+    GUNICORN_WORKERS = int(os.getenv("GUNICORN_WORKERS", "4"))
+    GUNICORN_THREADS = int(os.getenv("GUNICORN_THREADS", "4"))
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", str(GUNICORN_THREADS))),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "2")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800")),
+        "pool_pre_ping": True,
+        "connect_args": pooler_connect_args(DB_POOLER_MODE),
+    }
+    # Per request transaction; 0 disables. Keep below gunicorn's --timeout.
+    DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000"))
+    DB_LOCK_TIMEOUT_MS = int(os.getenv("DB_LOCK_TIMEOUT_MS", "2000"))
+    # Bearer token for /internal/db-pool; the endpoint is off when unset.
+    INTERNAL_METRICS_TOKEN = os.getenv("INTERNAL_METRICS_TOKEN")
+
     SESSION_TYPE = "filesystem"
     SESSION_FILE_DIR = "/tmp/flask_session"
     SESSION_PERMANENT = False
     CORS_ALLOWED_ORIGINS = _parse_origins()
 
+    ROLE_CACHE_TTL_SECONDS = int(os.getenv("ROLE_CACHE_TTL_SECONDS", "30"))
+    ROLE_CACHE_MAX_ENTRIES = int(os.getenv("ROLE_CACHE_MAX_ENTRIES", "4096"))
+    # Reads trust the session snapshot this long; writes always check the row.
+    USER_SNAPSHOT_MAX_AGE_SECONDS = int(
+        os.getenv("USER_SNAPSHOT_MAX_AGE_SECONDS", "30")
+    )
+
+    BOARD_DELTA_MAX_REVISIONS = int(os.getenv("BOARD_DELTA_MAX_REVISIONS", "200"))
+    BOARD_DELTA_MAX_ROWS = int(os.getenv("BOARD_DELTA_MAX_ROWS", "500"))
+
+    CARD_BATCH_MAX_OPERATIONS = int(os.getenv("CARD_BATCH_MAX_OPERATIONS", "500"))
+    ROOM_MEMBERS_PAGE_SIZE = int(os.getenv("ROOM_MEMBERS_PAGE_SIZE", "50"))
+    ROOM_MEMBERS_MAX_PAGE_SIZE = int(os.getenv("ROOM_MEMBERS_MAX_PAGE_SIZE", "200"))
+    ARCHIVE_PAGE_SIZE = int(os.getenv("ARCHIVE_PAGE_SIZE", "50"))
+    ARCHIVE_MAX_PAGE_SIZE = int(os.getenv("ARCHIVE_MAX_PAGE_SIZE", "200"))
+    # Archived cards and columns older than this are purged; 0 disables.
+    ARCHIVE_RETENTION_DAYS = int(os.getenv("ARCHIVE_RETENTION_DAYS", "90"))
+    ARCHIVE_PURGE_BATCH_SIZE = int(os.getenv("ARCHIVE_PURGE_BATCH_SIZE", "1000"))
+
+    # In-process reaper for expired guests, started by wsgi.py; 0 disables.
+    GUEST_REAPER_INTERVAL_SECONDS = int(
+        os.getenv("GUEST_REAPER_INTERVAL_SECONDS", "300")
+    )
+    GUEST_REAPER_BATCH_SIZE = int(os.getenv("GUEST_REAPER_BATCH_SIZE", "50"))
+    BOARD_TRANSFER_CHUNK_SIZE = int(os.getenv("BOARD_TRANSFER_CHUNK_SIZE", "500"))
+
+    BOARD_EVENTS_DATABASE_URL = os.getenv("BOARD_EVENTS_DATABASE_URL")
+    BOARD_EVENTS_HEARTBEAT_SECONDS = int(
+        os.getenv("BOARD_EVENTS_HEARTBEAT_SECONDS", "15")
+    )
+    BOARD_EVENTS_MAX_STREAM_SECONDS = int(
+        os.getenv("BOARD_EVENTS_MAX_STREAM_SECONDS", "300")
+    )
+    # Each open stream pins a gunicorn thread; keep some free for requests.
+    BOARD_EVENTS_MAX_STREAMS_PER_WORKER = int(
+        os.getenv(
+            "BOARD_EVENTS_MAX_STREAMS_PER_WORKER",
+            str(max(1, GUNICORN_THREADS // 2)),
+        )
+    )
+
 
 class DevConfig(BaseConfig):
     SESSION_COOKIE_SAMESITE = "Lax"
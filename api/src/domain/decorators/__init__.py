@@ -1 +1,2 @@
+from .conditional import conditional_get
 from .decorator import require_permission
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import hashlib
+from functools import wraps
+from typing import Callable
+
+from flask import current_app, request
+
+
+def make_etag(version: object) -> str:
+    return hashlib.sha1(repr(version).encode("utf-8")).hexdigest()
+
+
+def conditional_get(version_fn: Callable[..., object | None]) -> Callable:
+    """
+    Answer If-None-Match with a 304 computed from `version_fn(**route_kwargs)`.
+    The version must change whenever the response body would, and should be
+    a single cheap query. Returning None skips the check (e.g. for a 404).
+    Stack below require_permission so versions are only computed for callers
+    allowed to read the resource.
+    """
+
+    def deco(fn: Callable) -> Callable:
+
+        @wraps(fn)
+        def wrapped(*args, **kwargs):
+            version = version_fn(**kwargs)
+            if version is None:
+                return fn(*args, **kwargs)
+            etag = make_etag(version)
+            if request.if_none_match.contains(etag):
+                resp = current_app.response_class(status=304)
+            else:
+                resp = current_app.make_response(fn(*args, **kwargs))
+                if resp.status_code != 200:
+                    return resp
+            resp.set_etag(etag)
+            resp.headers["Cache-Control"] = "private, no-cache"
+            return resp
+
+        return wrapped
+
+    return deco
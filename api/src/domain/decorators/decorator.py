@@ -7,7 +7,7 @@ from flask import abort, current_app, g, request
 
 from ..exceptions import ForbiddenError, ValidationError
 from ..security.permissions import ROLE_DEFAULTS, Permission
-from ..selectors.membership import get_role_in_room
+from ..selectors.membership import resolve_room
 
 
 def require_permission(
@@ -21,8 +21,10 @@ def require_permission(
             room_pid = kwargs.get(room_param)
             if not room_pid:
                 raise ValidationError(f"Missing route parameter '{room_param}'.")
-            user_role = get_role_in_room(room_pid)
-            if not permission in ROLE_DEFAULTS.get(user_role):
+            # The resolved room is memoized on the request, so services that
+            # call resolve_room() again reuse it instead of re-joining Room.
+            room = resolve_room(room_pid)
+            if not permission in ROLE_DEFAULTS.get(room.role):
                 raise ForbiddenError(
                     f"I'm sorry, {g.user.name}, I'm afraid I can't do that."
                 )
@@ -25,6 +25,16 @@ class ValidationError(AppError):
     detail = "The request had semantic errors."
 
 
+class ServiceUnavailableError(AppError):
+    status_code = 503
+    title = "Service Unavailable"
+    detail = "The service is busy. Please try again shortly."
+
+    def __init__(self, detail: str | None = None, *, retry_after: int = 1):
+        super().__init__(detail)
+        self.retry_after = retry_after
+
+
 class UnauthorizedError(AppError):
     code = 401
     title = "Unauthorized"
@@ -0,0 +1 @@
+from .positions import POSITION_GAP, position_between, spaced_positions
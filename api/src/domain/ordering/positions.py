@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+# Room left between neighbouring positions so a move can land between two
+# cards by rewriting only the moved row.
+POSITION_GAP = 1024
+
+
+def position_between(lower: int | None, upper: int | None) -> int | None:
+    """
+    Pick a position strictly between two neighbours.
+    - `lower` / `upper` are the positions before and after the slot, or None
+      at either end of the list
+    - Returns None when the neighbours are adjacent and the list needs
+      rebalancing first
+    """
+    if upper is None:
+        return POSITION_GAP if lower is None else lower + POSITION_GAP
+    floor = -1 if lower is None else lower
+    if upper - floor < 2:
+        return None
+    return floor + (upper - floor) // 2
+
+
+def spaced_positions(count: int) -> list[int]:
+    """Evenly gapped positions for `count` items, starting one gap in."""
+    return [POSITION_GAP * (index + 1) for index in range(count)]
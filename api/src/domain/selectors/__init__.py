@@ -1,2 +1,7 @@
 from .authorship import is_card_author, is_comment_author
-from .membership import get_role_in_room
+from .membership import (
+    ResolvedRoom,
+    get_role_in_room,
+    invalidate_room_roles,
+    resolve_room,
+)
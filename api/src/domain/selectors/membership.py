@@ -1,24 +1,120 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from flask import current_app, g
 from sqlalchemy import select
 
 from ...extensions import db
 from ...persistence.models import Room, RoomMember
+from ..cache import TTLCache
 from ..exceptions import ForbiddenError
+from ..security.permissions import RoleType, RoomType
 from ..validators import validate_user_logged_in
 
+ROLE_CACHE_EXTENSION = "room_role_cache"
+
+
+@dataclass(frozen=True)
+class ResolvedRoom:
+    """The room a request targets, together with the caller's role in it."""
+
+    id: int
+    public_id: str
+    owner_id: int
+    room_type: RoomType
+    role: RoleType
+
+
+def _room_key(room_public_id) -> str:
+    return str(room_public_id).strip().lower()
+
+
+def _shared_role_cache() -> TTLCache:
+    """
+    Cross-request cache of (user id, room public id) -> ResolvedRoom, one per app.
+    Each gunicorn worker holds its own copy, so invalidation is local to the
+    worker that made the change and ROLE_CACHE_TTL_SECONDS bounds how long
+    the other workers can serve a stale role.
+    """
+    cache = current_app.extensions.get(ROLE_CACHE_EXTENSION)
+    if cache is None:
+        cache = TTLCache(
+            current_app.config.get("ROLE_CACHE_TTL_SECONDS", 0),
+            max_entries=current_app.config.get("ROLE_CACHE_MAX_ENTRIES", 4096),
+        )
+        current_app.extensions[ROLE_CACHE_EXTENSION] = cache
+    return cache
+
+
+def _request_role_cache() -> dict:
+    if "room_roles" not in g:
+        g.room_roles = {}
+    return g.room_roles
 
-def get_role_in_room(room_public_id: str) -> str:
+
+def resolve_room(room_public_id: str) -> ResolvedRoom:
     """
-    Return the role of a user in a room, or None if not a member.
+    Resolve a room and the caller's role in it, or raise ForbiddenError if the
+    caller is not a member. The result is memoized for the request and for
+    ROLE_CACHE_TTL_SECONDS across requests; non-membership is never cached.
     """
     user_id = validate_user_logged_in()
-    subquery_room_id = (
-        select(Room.id).where(Room.public_id == room_public_id).scalar_subquery()
-    )
-    statement = select(RoomMember.role).where(
-        RoomMember.user_id == user_id,
-        RoomMember.room_id == subquery_room_id,
-    )
-    role_in_room = db.session.execute(statement).scalar_one_or_none()
-    if not role_in_room:
-        raise ForbiddenError()
-    return role_in_room
+    key = (user_id, _room_key(room_public_id))
+    request_cache = _request_role_cache()
+    if key in request_cache:
+        return request_cache[key]
+
+    shared_cache = _shared_role_cache()
+    resolved = shared_cache.get(key)
+    if resolved is None:
+        statement = (
+            select(
+                Room.id, Room.public_id, Room.owner_id, Room.room_type, RoomMember.role
+            )
+            .join(RoomMember, RoomMember.room_id == Room.id)
+            .where(
+                Room.public_id == room_public_id,
+                RoomMember.user_id == user_id,
+            )
+        )
+        row = db.session.execute(statement).one_or_none()
+        if row is None:
+            raise ForbiddenError()
+        resolved = ResolvedRoom(
+            id=row.id,
+            public_id=str(row.public_id),
+            owner_id=row.owner_id,
+            room_type=row.room_type,
+            role=row.role,
+        )
+        shared_cache.set(key, resolved)
+
+    request_cache[key] = resolved
+    return resolved
+
+
+def get_role_in_room(room_public_id: str) -> RoleType:
+    """
+    Return the role of a user in a room, or raise ForbiddenError if not a member.
+    """
+    return resolve_room(room_public_id).role
+
+
+def invalidate_room_roles(room_public_id, user_id: int | None = None) -> None:
+    """
+    Drop cached roles for a room, either for one member or for everyone.
+    Call after any change to room membership.
+    """
+    room_key = _room_key(room_public_id)
+
+    def matches(key: tuple[int, str]) -> bool:
+        cached_user_id, cached_room_key = key
+        return cached_room_key == room_key and (
+            user_id is None or cached_user_id == user_id
+        )
+
+    _shared_role_cache().pop_where(matches)
+    request_cache = _request_role_cache()
+    for key in [key for key in request_cache if matches(key)]:
+        del request_cache[key]
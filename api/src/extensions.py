@@ -1,3 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
 
-db = SQLAlchemy()
+from .persistence.engine import TimedQueuePool
+
+db = SQLAlchemy(engine_options={"poolclass": TimedQueuePool})
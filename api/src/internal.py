@@ -0,0 +1,39 @@
+import hmac
+
+from flask import Blueprint, abort, current_app, jsonify, request
+
+from .extensions import db
+
+bp = Blueprint("internal", __name__, url_prefix="/internal")
+
+
+@bp.before_request
+def require_metrics_token():
+    token = current_app.config.get("INTERNAL_METRICS_TOKEN")
+    if not token:
+        abort(404)
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        abort(401)
+
+
+@bp.get("/db-pool")
+def db_pool():
+    """Connection pool gauges and counters of the worker answering."""
+    config = current_app.config
+    options = config["SQLALCHEMY_ENGINE_OPTIONS"]
+    pool = db.engine.pool
+    per_worker = options["pool_size"] + options["max_overflow"]
+    return jsonify(
+        {
+            "pool": pool.stats() if hasattr(pool, "stats") else None,
+            "limits": {
+                "workers": config["GUNICORN_WORKERS"],
+                "threads": config["GUNICORN_THREADS"],
+                "connections_per_worker": per_worker,
+                "connections_max": per_worker * config["GUNICORN_WORKERS"],
+                "statement_timeout_ms": config["DB_STATEMENT_TIMEOUT_MS"],
+                "lock_timeout_ms": config["DB_LOCK_TIMEOUT_MS"],
+            },
+        }
+    )
@@ -0,0 +1,10 @@
+from flask import Flask
+
+
+def register_jobs(app: Flask) -> None:
+    """Expose maintenance jobs as `flask <command>` for cron or one-off runs."""
+    from .guests import reap_guests_command
+    from .retention import purge_archived_command
+
+    app.cli.add_command(purge_archived_command)
+    app.cli.add_command(reap_guests_command)
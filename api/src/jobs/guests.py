@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import exists, func, true
+
+from ..domain.security.permissions import RoomType
+from ..domain.selectors import invalidate_room_roles
+from ..extensions import db
+from ..persistence.models import Room, RoomMember, User
+
+# Shared by every worker so only one of them reaps at a time.
+GUEST_REAPER_LOCK_KEY = 0x6D71_0001
+
+
+@dataclass
+class ReapResult:
+    rooms: int = 0
+    users: int = 0
+    locked_out: bool = False
+
+
+def _expired_guest_rooms(limit: int):
+    # Uses ix_rooms_expiring_active (expires_at WHERE room_type = 'GUEST').
+    return (
+        db.select(Room.id)
+        .where(Room.room_type == RoomType.GUEST, Room.expires_at < func.now())
+        .order_by(Room.expires_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+
+def _expired_guest_users(limit: int):
+    # Uses ix_users_expiring_guests_active (expires_at WHERE is_guest).
+    # Guests still owning a room wait until that room has been reaped, since
+    # rooms.owner_id restricts deletes.
+    return (
+        db.select(User.id)
+        .where(
+            User.is_guest == true(),
+            User.expires_at < func.now(),
+            ~exists().where(Room.owner_id == User.id),
+        )
+        .order_by(User.expires_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+
+def _touch_member_rooms(user_ids: list[int]) -> list:
+    """
+    Bump updated_at on every room the users are members of, since deleting
+    them cascades to those rooms' member lists. Returns the rooms' public ids.
+    """
+    return (
+        db.session.execute(
+            db.update(Room)
+            .where(
+                Room.id.in_(
+                    db.select(RoomMember.room_id).where(
+                        RoomMember.user_id.in_(user_ids)
+                    )
+                )
+            )
+            .values(updated_at=func.now())
+            .returning(Room.public_id)
+            .execution_options(synchronize_session=False)
+        )
+        .scalars()
+        .all()
+    )
+
+
+def _reap_batch(model, expired) -> int | None:
+    """
+    Delete one batch in its own transaction, or return None when another
+    worker holds the reaper lock. The transaction-scoped advisory lock is
+    released by the commit, so it also works through a transaction pooler.
+    Cached roles are dropped for every room that was deleted or lost members.
+    """
+    acquired = db.session.execute(
+        db.select(func.pg_try_advisory_xact_lock(GUEST_REAPER_LOCK_KEY))
+    ).scalar_one()
+    if not acquired:
+        db.session.rollback()
+        return None
+    ids = db.session.execute(expired).scalars().all()
+    if not ids:
+        db.session.rollback()
+        return 0
+    stale_rooms = _touch_member_rooms(ids) if model is User else []
+    deleted = (
+        db.session.execute(
+            db.delete(model)
+            .where(model.id.in_(ids))
+            .returning(model.public_id)
+            .execution_options(synchronize_session=False)
+        )
+        .scalars()
+        .all()
+    )
+    db.session.commit()
+    if model is Room:
+        stale_rooms = deleted
+    for room_public_id in stale_rooms:
+        invalidate_room_roles(room_public_id)
+    return len(deleted)
+
+
+def reap_expired_guests(*, batch_size: int) -> ReapResult:
+    """
+    Delete expired guest rooms, then expired guest users, `batch_size` rows
+    per transaction. Each room delete cascades to its boards, columns and
+    cards, so small batches keep every transaction and its locks short.
+    Stops early (locked_out) if another worker is already reaping.
+    """
+    result = ReapResult()
+    for model, expired, field in (
+        (Room, _expired_guest_rooms, "rooms"),
+        (User, _expired_guest_users, "users"),
+    ):
+        while True:
+            deleted = _reap_batch(model, expired(batch_size))
+            if deleted is None:
+                result.locked_out = True
+                return result
+            setattr(result, field, getattr(result, field) + deleted)
+            if deleted < batch_size:
+                break
+    return result
+
+
+@click.command("reap-guests")
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Rows per transaction; defaults to GUEST_REAPER_BATCH_SIZE.",
+)
+@with_appcontext
+def reap_guests_command(batch_size: int | None) -> None:
+    """Delete expired guest rooms and guest users."""
+    result = reap_expired_guests(
+        batch_size=batch_size or current_app.config["GUEST_REAPER_BATCH_SIZE"]
+    )
+    if result.locked_out:
+        click.echo("Another process is reaping guests; try again later.")
+    click.echo(f"Deleted {result.rooms} guest rooms and {result.users} guest users.")
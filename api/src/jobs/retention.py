@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import exists
+
+from ..extensions import db
+from ..persistence.models import Board, BoardColumn, Card
+from ..routes.boards.revisions import bump_board_revision
+
+
+@dataclass
+class PurgeResult:
+    boards: int = 0
+    cards: int = 0
+    columns: int = 0
+
+
+def _expired_cards(board_id: int, cutoff: datetime, limit: int):
+    return (
+        db.select(Card.id)
+        .where(
+            Card.board_id == board_id,
+            Card.deleted_at.is_not(None),
+            Card.deleted_at < cutoff,
+        )
+        .order_by(Card.deleted_at.desc(), Card.id.desc())
+        .limit(limit)
+    )
+
+
+def _expired_columns(board_id: int, cutoff: datetime, limit: int):
+    # Archived columns only hold archived cards, which expire no later than
+    # the column; the NOT EXISTS keeps the cascade from ever removing a card
+    # that is still within retention.
+    return (
+        db.select(BoardColumn.id)
+        .where(
+            BoardColumn.board_id == board_id,
+            BoardColumn.deleted_at.is_not(None),
+            BoardColumn.deleted_at < cutoff,
+            ~exists().where(Card.column_id == BoardColumn.id),
+        )
+        .order_by(BoardColumn.id.asc())
+        .limit(limit)
+    )
+
+
+def _purge_batch(board_id: int, model, expired) -> int:
+    """
+    Delete one bounded batch and commit. The board row is locked first, the
+    same order every card and column writer takes, so the purge never
+    deadlocks with them and holds its locks for a single short batch.
+    """
+    bump_board_revision(board_id, purged=True)
+    deleted = db.session.execute(
+        db.delete(model)
+        .where(model.id.in_(expired))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if deleted:
+        db.session.commit()
+    else:
+        db.session.rollback()
+    return deleted
+
+
+def purge_archived(
+    *, older_than: timedelta, batch_size: int, dry_run: bool = False
+) -> PurgeResult:
+    """
+    Hard-delete cards and columns archived longer than `older_than` ago, in
+    batches of at most `batch_size` rows per transaction. Boards are visited
+    one at a time and every batch bumps the board's purged revision so
+    delta clients fall back to a snapshot. With `dry_run` nothing is deleted
+    and only the boards that would be purged are counted.
+    """
+    cutoff = datetime.now(timezone.utc) - older_than
+    board_ids = (
+        db.session.execute(
+            db.select(Board.id)
+            .where(
+                exists(_expired_cards(Board.id, cutoff, 1))
+                | exists(
+                    db.select(BoardColumn.id).where(
+                        BoardColumn.board_id == Board.id,
+                        BoardColumn.deleted_at.is_not(None),
+                        BoardColumn.deleted_at < cutoff,
+                    )
+                )
+            )
+            .order_by(Board.id.asc())
+        )
+        .scalars()
+        .all()
+    )
+    db.session.rollback()
+
+    result = PurgeResult(boards=len(board_ids))
+    if dry_run:
+        return result
+    for board_id in board_ids:
+        while deleted := _purge_batch(
+            board_id, Card, _expired_cards(board_id, cutoff, batch_size)
+        ):
+            result.cards += deleted
+            if deleted < batch_size:
+                break
+        while deleted := _purge_batch(
+            board_id, BoardColumn, _expired_columns(board_id, cutoff, batch_size)
+        ):
+            result.columns += deleted
+            if deleted < batch_size:
+                break
+    return result
+
+
+@click.command("purge-archived")
+@click.option(
+    "--days",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Retention in days; defaults to ARCHIVE_RETENTION_DAYS.",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Rows per transaction; defaults to ARCHIVE_PURGE_BATCH_SIZE.",
+)
+@click.option("--dry-run", is_flag=True, help="Only count the affected boards.")
+@with_appcontext
+def purge_archived_command(
+    days: int | None, batch_size: int | None, dry_run: bool
+) -> None:
+    """Hard-delete archived cards and columns past the retention period."""
+    retention_days = days or current_app.config.get("ARCHIVE_RETENTION_DAYS")
+    if not retention_days:
+        click.echo("Archive retention is disabled (ARCHIVE_RETENTION_DAYS=0).")
+        return
+    result = purge_archived(
+        older_than=timedelta(days=retention_days),
+        batch_size=batch_size or current_app.config["ARCHIVE_PURGE_BATCH_SIZE"],
+        dry_run=dry_run,
+    )
+    if dry_run:
+        click.echo(f"{result.boards} boards have archived rows to purge.")
+    else:
+        click.echo(
+            f"Purged {result.cards} cards and {result.columns} columns "
+            f"from {result.boards} boards."
+        )
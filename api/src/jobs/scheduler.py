@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import logging
+import random
+import threading
+
+from flask import Flask
+
+from ..extensions import db
+from .guests import reap_expired_guests
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_EXTENSION = "job_scheduler"
+
+
+def start_job_scheduler(app: Flask) -> threading.Thread | None:
+    """
+    Run the guest reaper every GUEST_REAPER_INTERVAL_SECONDS on a daemon
+    thread of this process; 0 disables it. Every gunicorn worker starts one,
+    and the reaper's advisory lock lets only one of them work at a time, so
+    the interval is jittered to spread the attempts out.
+    """
+    interval = app.config.get("GUEST_REAPER_INTERVAL_SECONDS", 0)
+    if interval <= 0 or SCHEDULER_EXTENSION in app.extensions:
+        return None
+    stopped = threading.Event()
+
+    def run() -> None:
+        while not stopped.wait(interval * random.uniform(0.8, 1.2)):
+            with app.app_context():
+                try:
+                    result = reap_expired_guests(
+                        batch_size=app.config["GUEST_REAPER_BATCH_SIZE"]
+                    )
+                    if result.rooms or result.users:
+                        logger.info(
+                            "Reaped %s guest rooms and %s guest users.",
+                            result.rooms,
+                            result.users,
+                        )
+                except Exception:
+                    db.session.rollback()
+                    logger.exception("Guest reaper run failed.")
+                finally:
+                    db.session.remove()
+
+    thread = threading.Thread(target=run, name="guest-reaper", daemon=True)
+    app.extensions[SCHEDULER_EXTENSION] = stopped
+    thread.start()
+    return thread
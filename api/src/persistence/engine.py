@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from flask import current_app, has_request_context
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that also records how long checkouts wait for a connection and
+    how many gave up after pool_timeout. Counters are per process and reset
+    when the pool is recreated.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self._checkouts += 1
+                self._timeouts += timed_out
+                self._wait_seconds_total += waited
+                self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            checkouts = self._checkouts
+            timeouts = self._timeouts
+            wait_total = self._wait_seconds_total
+            wait_max = self._wait_seconds_max
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            # QueuePool counts overflow from -pool_size; only report extras.
+            "overflow": max(self.overflow(), 0),
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "wait_ms_avg": (
+                round(wait_total / checkouts * 1000, 3) if checkouts else 0.0
+            ),
+            "wait_ms_max": round(wait_max * 1000, 3),
+        }
+
+
+def _set_request_timeouts(_session, _transaction, connection) -> None:
+    if not has_request_context():
+        # CLI jobs batch their own work and are not bound by request budgets.
+        return
+    settings = {
+        name: f"{current_app.config[key]}ms"
+        for name, key in (
+            ("statement_timeout", "DB_STATEMENT_TIMEOUT_MS"),
+            ("lock_timeout", "DB_LOCK_TIMEOUT_MS"),
+        )
+        if current_app.config.get(key, 0) > 0
+    }
+    if settings:
+        connection.exec_driver_sql(
+            "SELECT "
+            + ", ".join(f"set_config('{name}', %({name})s, true)" for name in settings),
+            settings,
+        )
+
+
+def install_request_timeouts(session) -> None:
+    """
+    Bound every transaction begun inside a request by DB_STATEMENT_TIMEOUT_MS
+    and DB_LOCK_TIMEOUT_MS. Both are set with set_config(..., true), the SET
+    LOCAL equivalent, so they end with the transaction and never leak to the
+    next user of the pooled connection.
+    """
+    if not event.contains(session, "after_begin", _set_request_timeouts):
+        event.listen(session, "after_begin", _set_request_timeouts)
@@ -29,13 +29,23 @@ from ..orm.mixins import DeletedAtMixin, PublicIdMixin, SurrogatePK, TimestampMi
 
 class Board(db.Model, SurrogatePK, PublicIdMixin, TimestampMixin, DeletedAtMixin):
     __tablename__ = "boards"
+    # Indexed by ix_boards_room_active below.
     room_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("rooms.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     name: Mapped[str] = mapped_column(String(128), nullable=False)
+    revision: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    purged_revision: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    # Position the next appended column receives.
+    next_column_position: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
     room: Mapped["Room"] = relationship("Room", back_populates="boards")
     columns: Mapped[list["BoardColumn"]] = relationship(
         "BoardColumn",
@@ -52,6 +62,14 @@ class Board(db.Model, SurrogatePK, PublicIdMixin, TimestampMixin, DeletedAtMixin
         order_by="Card.position",
     )
 
+    __table_args__ = (
+        Index(
+            "ix_boards_room_active",
+            "room_id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+
 
 @declared_attr.directive
 def __table_args__(cls):
@@ -68,11 +86,11 @@ def __table_args__(cls):
 class BoardColumn(db.Model, SurrogatePK, TimestampMixin, DeletedAtMixin):
     __tablename__ = "board_columns"
 
+    # Indexed by ix_board_columns_board_active and ..._board_revision below.
     board_id: Mapped[int] = mapped_column(
         db.Integer,
         ForeignKey("boards.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     parent_id: Mapped[int] = mapped_column(Integer, nullable=True)
     title: Mapped[str] = mapped_column(String(128), nullable=False)
@@ -83,6 +101,19 @@ class BoardColumn(db.Model, SurrogatePK, TimestampMixin, DeletedAtMixin):
     column_type: Mapped[str] = mapped_column(
         String(128), nullable=False, server_default=text("'standard'")
     )
+    revision: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    # Active (non-archived) cards in the column, kept in step by the card
+    # services so WIP checks never count rows.
+    active_card_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    # Position the next appended card receives; always above every card
+    # position in the column, archived ones included.
+    next_card_position: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("1024")
+    )
     board: Mapped["Board"] = relationship(
         "Board",
         back_populates="columns",
@@ -97,6 +128,9 @@ class BoardColumn(db.Model, SurrogatePK, TimestampMixin, DeletedAtMixin):
 
     __table_args__ = (
         CheckConstraint("position >= 0", name="ck_columns_position_nonneg"),
+        CheckConstraint(
+            "active_card_count >= 0", name="ck_columns_active_card_count_nonneg"
+        ),
         CheckConstraint(
             "wip_limit IS NULL OR wip_limit >= 0", name="ck_columns_wip_nonneg"
         ),
@@ -104,4 +138,11 @@ class BoardColumn(db.Model, SurrogatePK, TimestampMixin, DeletedAtMixin):
             "parent_id IS NULL OR parent_id <> id", name="ck_columns_no_self_parent"
         ),
         UniqueConstraint("id", "board_id", name="uq_columns_id_board"),
+        Index("ix_board_columns_board_revision", "board_id", "revision"),
+        Index(
+            "ix_board_columns_board_active",
+            "board_id",
+            "position",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
@@ -36,17 +36,58 @@ class Card(db.Model, SurrogatePK, PublicIdMixin, TimestampMixin, DeletedAtMixin)
     position: Mapped[int] = mapped_column(
         Integer, nullable=False, server_default=text("0")
     )
+    revision: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
 
     board: Mapped["Board"] = relationship("Board", back_populates="cards")
     column: Mapped["BoardColumn"] = relationship("BoardColumn", back_populates="cards")
 
     __table_args__ = (
         CheckConstraint("position >= 0", name="ck_cards_position_nonneg"),
-        UniqueConstraint("column_id", "position", name="uq_cards_column_position"),
+        # Deferrable so bulk renumbering can check uniqueness at commit.
+        UniqueConstraint(
+            "column_id",
+            "position",
+            name="uq_cards_column_position",
+            deferrable=True,
+            initially="IMMEDIATE",
+        ),
+        # Active cards of a board in display order (board reads).
         Index(
-            "ix_cards_board_column_position",
+            "ix_cards_board_active",
             "board_id",
             "column_id",
             "position",
+            postgresql_where=text("deleted_at IS NULL"),
         ),
+        # Active cards of one column (WIP counts, column moves).
+        Index(
+            "ix_cards_column_active",
+            "column_id",
+            "position",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index("ix_cards_board_revision", "board_id", "revision"),
     )
+
+
+# Archive listing pages through archived cards newest first, keyed on
+# (deleted_at, id); the partial indexes hold only archived rows and cover the
+# listed columns so each page is an index-only range scan.
+Index(
+    "ix_cards_board_archived",
+    Card.board_id,
+    Card.deleted_at.desc(),
+    Card.id.desc(),
+    postgresql_where=Card.deleted_at.is_not(None),
+    postgresql_include=["public_id", "title", "column_id"],
+)
+Index(
+    "ix_cards_column_archived",
+    Card.column_id,
+    Card.deleted_at.desc(),
+    Card.id.desc(),
+    postgresql_where=Card.deleted_at.is_not(None),
+    postgresql_include=["public_id", "title", "board_id"],
+)
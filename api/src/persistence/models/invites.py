@@ -7,10 +7,12 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -60,6 +62,12 @@ class Invite(db.Model, SurrogatePK, PublicIdMixin, TimestampMixin, DeletedAtMixi
         CheckConstraint(
             "redemption_max >= 1", name="ck_invites_redemption_max_positive"
         ),
+        Index(
+            "ix_invites_room_active",
+            "room_id",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
 
 
@@ -98,6 +98,8 @@ class RoomMember(db.Model, TimestampMixin):
 
     __table_args__ = (
         UniqueConstraint("room_id", "user_id", name="uq_room_members_unique"),
-        Index("ix_room_members_room_id", "room_id"),
+        # role_type sorts OWNER, ADMIN, MEMBER, VIEWER, so this index returns a
+        # room's members already grouped by role priority.
+        Index("ix_room_members_room_role", "room_id", "role"),
         Index("ix_room_members_user_id", "user_id"),
     )
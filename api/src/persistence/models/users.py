@@ -77,6 +77,13 @@ class User(db.Model, SurrogatePK, PublicIdMixin, TimestampMixin):
             "(is_guest = false) OR (expires_at IS NOT NULL)",
             name="ck_users_guest_requires_expires_at",
         ),
+        # Members are listed and searched by this key; text_pattern_ops lets
+        # prefix LIKE use the index whatever the database collation is.
+        Index(
+            "ix_users_sort_name",
+            func.lower(func.coalesce(display_name, name)).label("sort_name"),
+            postgresql_ops={"sort_name": "text_pattern_ops"},
+        ),
         Index(
             "ix_users_expiring_guests_active",
             "expires_at",
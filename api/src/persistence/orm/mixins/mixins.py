@@ -50,9 +50,13 @@ def _ensure_aware(dt: datetime) -> datetime:
 
 
 class DeletedAtMixin:
-    """Soft delete support. Null = active; Non-null = soft-deleted."""
+    """
+    Soft delete support. Null = active; Non-null = soft-deleted.
+    deleted_at is deliberately not indexed on its own: models declare partial
+    indexes WHERE deleted_at IS NULL on the parent keys they are read by.
+    """
 
-    deleted_at = Column(DateTime(timezone=True), index=True)
+    deleted_at = Column(DateTime(timezone=True))
     deleted_by_id = Column(Integer, nullable=True, index=True)
 
     @property
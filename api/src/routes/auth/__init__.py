@@ -2,5 +2,5 @@ from flask import Blueprint
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 from . import routes
-from .utils.utils import load_current_user, sanitize_next_path
+from .utils.utils import load_current_user, sanitize_next_path, store_user_snapshot
 from .types.domain_types import Tokens, UserProfile
\ No newline at end of file
@@ -2,6 +2,7 @@ from flask import jsonify, make_response, redirect, request, session
 
 from ...domain.validators import validate_str, validate_user_logged_in
 from . import auth_bp as bp
+from .utils.utils import USER_SNAPSHOT_KEY, store_user_snapshot
 from .service import (
     bootstrap,
     finish_login,
@@ -28,6 +29,7 @@ def callback_google():
         user, nxt = finish_login(request.args)
         session.clear()
         session["public_id"] = str(user.public_id)
+        store_user_snapshot(user)
         # session.permanent = True
         target = nxt
         fb = frontend_base()
@@ -51,6 +53,7 @@ def set_profile():
 @bp.post("/logout")
 def logout():
     session.pop("public_id", None)
+    session.pop(USER_SNAPSHOT_KEY, None)
     resp = make_response({"ok": True})
     resp.headers["Cache-Control"] = "no-store"
     return resp
@@ -10,7 +10,7 @@ from ...persistence.models import Identity, User
 from .types.domain_types import UserProfile
 from .providers.google_client import GoogleClient
 from .providers.oauth2_client import OAuth2Client
-from .utils.utils import sanitize_next_path
+from .utils.utils import sanitize_next_path, store_user_snapshot
 
 _oauth: Optional[OAuth] = None
 _client: Optional[OAuth2Client] = None
@@ -90,3 +90,4 @@ def set_profile_service(user_id: int, display_name: str):
     user = db.session.get(User, user_id)
     user.display_name = display_name
     db.session.commit()
+    store_user_snapshot(user)
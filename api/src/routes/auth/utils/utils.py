@@ -1,16 +1,93 @@
-from typing import Optional
+import time
+from typing import Any, Optional
 from urllib.parse import urlparse
-from flask import g, session
+from flask import current_app, g, request, session
 
 from ....extensions import db
 from ....persistence.models import User
 
+# Bump whenever the snapshot layout changes so old cookies are ignored.
+USER_SNAPSHOT_VERSION = 1
+USER_SNAPSHOT_KEY = "user_snapshot"
+USER_SNAPSHOT_FIELDS = ("id", "name", "display_name", "is_guest")
+# Requests that may write skip the snapshot, so a deleted or reaped user is
+# caught by the User lookup before changing anything.
+SNAPSHOT_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class CurrentUser:
+    """
+    Lazy stand-in for the logged-in User stored on g.user.
+    - Snapshot fields are answered from the session without touching the DB
+    - Any other attribute loads the User row once, on first access
+    - Loading refreshes the snapshot so the next request can skip the query
+    """
+
+    def __init__(self, public_id: str, snapshot: Optional[dict[str, Any]] = None):
+        self.public_id = public_id
+        self._snapshot = snapshot
+        self._user: Optional[User] = None
+        self._loaded = False
+
+    def _load(self) -> Optional[User]:
+        if not self._loaded:
+            self._user = db.session.execute(
+                db.select(User).where(User.public_id == self.public_id)
+            ).scalar_one_or_none()
+            self._loaded = True
+            if self._user is None:
+                self._snapshot = None
+                session.pop(USER_SNAPSHOT_KEY, None)
+            else:
+                self._snapshot = store_user_snapshot(self._user)
+        return self._user
+
+    def __getattr__(self, name: str) -> Any:
+        snapshot = self.__dict__.get("_snapshot")
+        if snapshot is not None and name in USER_SNAPSHOT_FIELDS:
+            return snapshot[name]
+        user = self._load()
+        if user is None:
+            raise AttributeError(name)
+        return getattr(user, name)
+
+    def __bool__(self) -> bool:
+        return self._snapshot is not None or self._load() is not None
+
+
+def store_user_snapshot(user: User) -> dict[str, Any]:
+    """Write the signed session snapshot for `user` and return it."""
+    snapshot = {field: getattr(user, field) for field in USER_SNAPSHOT_FIELDS}
+    session[USER_SNAPSHOT_KEY] = {
+        "v": USER_SNAPSHOT_VERSION,
+        "public_id": str(user.public_id),
+        "at": int(time.time()),
+        "user": snapshot,
+    }
+    return snapshot
+
+
+def _read_user_snapshot(public_id: str) -> Optional[dict[str, Any]]:
+    if request.method not in SNAPSHOT_SAFE_METHODS:
+        return None
+    stored = session.get(USER_SNAPSHOT_KEY)
+    if not isinstance(stored, dict):
+        return None
+    if stored.get("v") != USER_SNAPSHOT_VERSION or stored.get("public_id") != public_id:
+        return None
+    max_age = current_app.config.get("USER_SNAPSHOT_MAX_AGE_SECONDS", 0)
+    if time.time() - stored.get("at", 0) > max_age:
+        return None
+    return stored.get("user")
+
+
 def load_current_user():
     public_id = session.get("public_id")
     if not public_id:
         g.user = None
         return
-    g.user = db.session.query(User).filter_by(public_id=public_id).one_or_none()
+    g.user = CurrentUser(public_id, _read_user_snapshot(public_id))
+
 
 def sanitize_next_path(next_param: Optional[str], default: str = "/") -> str:
     candidate = (next_param or "").strip()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from flask import current_app
+
+from ...domain.exceptions import NotFoundError
+from ...domain.selectors import resolve_room
+from ...domain.validators import validate_int
+from ...extensions import db
+from ...persistence.models import Board, BoardColumn, Card
+from .snapshot import get_board_snapshot
+
+
+def _changed_columns(board_id: int, since: int) -> list[dict]:
+    rows = db.session.execute(
+        db.select(
+            BoardColumn.id,
+            BoardColumn.title,
+            BoardColumn.position,
+            BoardColumn.wip_limit,
+            BoardColumn.column_type,
+            BoardColumn.parent_id,
+            BoardColumn.active_card_count,
+            BoardColumn.deleted_at,
+            BoardColumn.revision,
+        )
+        .where(BoardColumn.board_id == board_id, BoardColumn.revision > since)
+        .order_by(BoardColumn.position.asc(), BoardColumn.id.asc())
+    )
+    return [
+        {
+            "id": row.id,
+            "title": row.title,
+            "position": row.position,
+            "wip_limit": row.wip_limit,
+            "column_type": row.column_type,
+            "parent_id": row.parent_id,
+            "active_card_count": row.active_card_count,
+            "archived": row.deleted_at is not None,
+            "revision": row.revision,
+        }
+        for row in rows
+    ]
+
+
+def _changed_cards(board_id: int, since: int, limit: int) -> list[dict] | None:
+    """Cards touched after `since`, or None when more than `limit` changed."""
+    rows = db.session.execute(
+        db.select(
+            Card.public_id,
+            Card.title,
+            Card.description,
+            Card.position,
+            Card.column_id,
+            Card.deleted_at,
+            Card.revision,
+        )
+        .where(Card.board_id == board_id, Card.revision > since)
+        .order_by(Card.column_id.asc(), Card.position.asc())
+        .limit(limit + 1)
+    ).all()
+    if len(rows) > limit:
+        return None
+    return [
+        {
+            "id": str(row.public_id),
+            "title": row.title,
+            "description": row.description,
+            "position": row.position,
+            "column_id": row.column_id,
+            "archived": row.deleted_at is not None,
+            "revision": row.revision,
+        }
+        for row in rows
+    ]
+
+
+def get_board_changes(
+    *, room_public_id: str, board_public_id: str, since: int | None
+) -> dict:
+    """
+    Columns and cards created, updated, moved or archived after revision
+    `since`. Falls back to a full snapshot ("mode": "snapshot") when rows were
+    hard-deleted after `since`, when the gap exceeds BOARD_DELTA_MAX_REVISIONS
+    or when more than BOARD_DELTA_MAX_ROWS cards changed.
+    """
+    since_revision = validate_int(since, "since", required=True, min_value=0)
+    room = resolve_room(room_public_id)
+    board = db.session.execute(
+        db.select(
+            Board.id,
+            Board.public_id,
+            Board.name,
+            Board.revision,
+            Board.purged_revision,
+        ).where(
+            Board.room_id == room.id,
+            Board.public_id == board_public_id,
+            Board.deleted_at.is_(None),
+        )
+    ).one_or_none()
+    if board is None:
+        raise NotFoundError(f"Board '{board_public_id}' not found.")
+
+    max_revisions = current_app.config.get("BOARD_DELTA_MAX_REVISIONS", 200)
+    max_rows = current_app.config.get("BOARD_DELTA_MAX_ROWS", 500)
+    cards = None
+    if (
+        board.purged_revision <= since_revision <= board.revision
+        and board.revision - since_revision <= max_revisions
+    ):
+        cards = _changed_cards(board.id, since_revision, max_rows)
+    if cards is None:
+        snapshot = get_board_snapshot(
+            room_public_id=room_public_id, board_public_id=board_public_id
+        )
+        return {"mode": "snapshot", "since": since_revision, **snapshot}
+
+    return {
+        "mode": "delta",
+        "since": since_revision,
+        "board": {
+            "public_id": board.public_id,
+            "name": board.name,
+            "room_id": room_public_id,
+            "revision": board.revision,
+        },
+        "columns": _changed_columns(board.id, since_revision),
+        "cards": cards,
+    }
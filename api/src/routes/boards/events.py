@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+import time
+from typing import Iterator
+
+import psycopg
+from flask import current_app
+from sqlalchemy.engine import make_url
+
+from ...domain.exceptions import AppError, NotFoundError, ServiceUnavailableError
+from ...domain.selectors import resolve_room
+from ...extensions import db
+from ...persistence.models import Board
+from .changes import get_board_changes
+from .revisions import BOARD_EVENTS_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+EVENT_HUB_EXTENSION = "board_event_hub"
+
+
+class BoardEventHub:
+    """
+    Per-process fan-out of board NOTIFY events to SSE subscribers.
+    - One background thread holds a single LISTEN connection per worker
+    - Subscribers get a queue that is woken whenever their board changes
+    - At most `max_streams` subscribers at once, since each one holds a
+      worker thread for the life of its stream
+    - The thread exits once nobody is subscribed and restarts on demand
+    - After a reconnect every subscriber is woken, since events may have
+      been missed; streams re-read the board revision, so this is harmless
+    """
+
+    def __init__(self, dsn: str, *, max_streams: int, poll_seconds: float = 5.0):
+        self._dsn = dsn
+        self._max_streams = max_streams
+        self._poll_seconds = poll_seconds
+        self._subscribers: dict[int, set[queue.SimpleQueue]] = {}
+        self._stream_count = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def _refuse_if_full(self) -> None:
+        if self._stream_count >= self._max_streams:
+            raise ServiceUnavailableError(
+                "Too many live board streams on this server.",
+                retry_after=max(1, round(self._poll_seconds)),
+            )
+
+    def check_capacity(self) -> None:
+        """Raise ServiceUnavailableError if no stream slot is free right now."""
+        with self._lock:
+            self._refuse_if_full()
+
+    def subscribe(self, board_id: int) -> queue.SimpleQueue:
+        inbox: queue.SimpleQueue = queue.SimpleQueue()
+        with self._lock:
+            self._refuse_if_full()
+            self._stream_count += 1
+            self._subscribers.setdefault(board_id, set()).add(inbox)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._listen, name="board-events", daemon=True
+                )
+                self._thread.start()
+        return inbox
+
+    def unsubscribe(self, board_id: int, inbox: queue.SimpleQueue) -> None:
+        with self._lock:
+            inboxes = self._subscribers.get(board_id)
+            if inboxes is None or inbox not in inboxes:
+                return
+            inboxes.discard(inbox)
+            self._stream_count -= 1
+            if not inboxes:
+                del self._subscribers[board_id]
+
+    def _publish(self, board_id: int | None) -> None:
+        with self._lock:
+            if board_id is None:
+                targets = [i for inboxes in self._subscribers.values() for i in inboxes]
+            else:
+                targets = list(self._subscribers.get(board_id, ()))
+        for inbox in targets:
+            inbox.put(board_id)
+
+    def _has_subscribers(self) -> bool:
+        with self._lock:
+            if self._subscribers:
+                return True
+            self._thread = None
+            return False
+
+    def _listen(self) -> None:
+        connected_before = False
+        while self._has_subscribers():
+            try:
+                with psycopg.connect(self._dsn, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {BOARD_EVENTS_CHANNEL}")
+                    if connected_before:
+                        self._publish(None)
+                    connected_before = True
+                    while self._has_subscribers():
+                        for notify in conn.notifies(timeout=self._poll_seconds):
+                            board_id, _, _revision = notify.payload.partition(":")
+                            if board_id.isdigit():
+                                self._publish(int(board_id))
+            except psycopg.Error:
+                logger.warning("Board event listener lost its connection.")
+                time.sleep(self._poll_seconds)
+            except Exception:
+                # Anything else would kill the thread and silence every stream.
+                logger.exception("Board event listener failed; restarting.")
+                time.sleep(self._poll_seconds)
+
+
+def _event_hub() -> BoardEventHub:
+    hub = current_app.extensions.get(EVENT_HUB_EXTENSION)
+    if hub is None:
+        url = current_app.config.get("BOARD_EVENTS_DATABASE_URL") or (
+            current_app.config["SQLALCHEMY_DATABASE_URI"]
+        )
+        dsn = make_url(url).set(drivername="postgresql")
+        hub = BoardEventHub(
+            dsn.render_as_string(hide_password=False),
+            max_streams=current_app.config["BOARD_EVENTS_MAX_STREAMS_PER_WORKER"],
+        )
+        current_app.extensions[EVENT_HUB_EXTENSION] = hub
+    return hub
+
+
+def _sse(event: str, data: dict, *, event_id: int | None = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.insert(0, f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def stream_board_events(
+    *, room_public_id: str, board_public_id: str, since: int | None
+) -> Iterator[str]:
+    """
+    Return an SSE generator of "changes" events for a board, each carrying
+    the get_board_changes payload since the last revision sent. The generator
+    subscribes when it starts and unsubscribes when it ends.
+    - `since` (or Last-Event-ID) resumes a stream; missing means "from now"
+    - Beyond BOARD_EVENTS_MAX_STREAMS_PER_WORKER open streams the request is
+      refused with a 503 and Retry-After; a stream that loses the last slot
+      to another between the check and its start gets an "error" event
+    - A comment line is sent every BOARD_EVENTS_HEARTBEAT_SECONDS
+    - Streams end after BOARD_EVENTS_MAX_STREAM_SECONDS; EventSource clients
+      reconnect with Last-Event-ID, which also re-checks permissions
+    The board is resolved here, inside the request, so a missing board is a
+    normal 404 rather than an error halfway through a stream.
+    """
+    room = resolve_room(room_public_id)
+    board = db.session.execute(
+        db.select(Board.id, Board.revision).where(
+            Board.room_id == room.id,
+            Board.public_id == board_public_id,
+            Board.deleted_at.is_(None),
+        )
+    ).one_or_none()
+    if board is None:
+        raise NotFoundError(f"Board '{board_public_id}' not found.")
+    # Streams are long-lived; never hold a pooled connection between events.
+    db.session.close()
+
+    hub = _event_hub()
+    hub.check_capacity()
+    heartbeat = current_app.config.get("BOARD_EVENTS_HEARTBEAT_SECONDS", 15)
+    lifetime = current_app.config.get("BOARD_EVENTS_MAX_STREAM_SECONDS", 300)
+
+    def generate() -> Iterator[str]:
+        last_revision = board.revision if since is None else since
+        pending = last_revision != board.revision
+        deadline = time.monotonic() + lifetime
+        # Subscribing here, not before the response starts, means a response
+        # closed before its first chunk never holds a stream slot.
+        try:
+            inbox = hub.subscribe(board.id)
+        except ServiceUnavailableError as error:
+            yield _sse("error", error.to_problem())
+            return
+        try:
+            yield f"retry: {heartbeat * 1000}\n\n"
+            while time.monotonic() < deadline:
+                if not pending:
+                    try:
+                        inbox.get(timeout=heartbeat)
+                    except queue.Empty:
+                        yield ": heartbeat\n\n"
+                        continue
+                # Coalesce bursts into a single delta.
+                while not inbox.empty():
+                    inbox.get_nowait()
+                pending = False
+                try:
+                    changes = get_board_changes(
+                        room_public_id=room_public_id,
+                        board_public_id=board_public_id,
+                        since=last_revision,
+                    )
+                except AppError as error:
+                    yield _sse("error", error.to_problem())
+                    return
+                finally:
+                    db.session.close()
+                revision = changes["board"]["revision"]
+                if revision == last_revision and changes["mode"] == "delta":
+                    continue
+                last_revision = revision
+                yield _sse("changes", changes, event_id=revision)
+        finally:
+            hub.unsubscribe(board.id, inbox)
+
+    return generate()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from sqlalchemy import func
+
+from ...extensions import db
+from ...persistence.models import Board, BoardColumn, Card
+
+BOARD_EVENTS_CHANNEL = "board_events"
+
+
+def bump_board_revision(
+    board_id: int,
+    *,
+    touched: Iterable[Card | BoardColumn] = (),
+    purged: bool = False,
+) -> int:
+    """
+    Increment a board's revision inside the caller's transaction and return
+    the new value. Every card or column mutation calls this right before
+    committing; the row lock it takes serializes writers on the same board
+    until commit, so committed revisions are gap-free and strictly ordered.
+    - `touched` rows are stamped with the new revision for delta sync
+    - `purged` records that rows were hard-deleted, which deltas cannot express
+    The same statement queues a NOTIFY on BOARD_EVENTS_CHANNEL with
+    "<board id>:<revision>"; Postgres only delivers it once the caller commits.
+    """
+    # Keep updated_at out of it: it is the board list and room ETags' signal
+    # for board metadata changes, and card edits must not invalidate those.
+    values = {"revision": Board.revision + 1, "updated_at": Board.updated_at}
+    if purged:
+        values["purged_revision"] = Board.revision + 1
+    with db.session.no_autoflush:
+        revision = db.session.execute(
+            db.update(Board)
+            .where(Board.id == board_id)
+            .values(**values)
+            .returning(
+                Board.revision,
+                func.pg_notify(
+                    BOARD_EVENTS_CHANNEL,
+                    func.concat(Board.id, ":", Board.revision),
+                ),
+            )
+        ).one()[0]
+    for row in touched:
+        row.revision = revision
+    return revision
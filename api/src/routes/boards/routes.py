@@ -1,12 +1,17 @@
-from flask import jsonify, request, url_for
+from flask import Response, jsonify, request, stream_with_context, url_for
 
-from ...domain.decorators import require_permission
+from ...domain.decorators import conditional_get, require_permission
 from ...domain.security.permissions import Permission
+from ...domain.validators import validate_int
 from . import board_bp
+from .changes import get_board_changes
+from .events import stream_board_events
+from .snapshot import get_board_list_version, get_board_snapshot, get_board_version
+from .transfer import export_board_lines, import_board_lines
 from .services import (
     create_board,
     create_board_column,
-    get_board_with_columns,
+    duplicate_board,
     hard_delete_column,
     reorder_board_columns,
     reorder_column_cards,
@@ -25,17 +30,69 @@ from .services import (
 def create_board_route(room_public_id: str):
     data = request.get_json(silent=True) or {}
     raw_name = data.get("name")
-    board = create_board(room_public_id=room_public_id, name=raw_name)
+    board = create_board(
+        room_public_id=room_public_id, name=raw_name, template=data.get("template")
+    )
+    resp = jsonify(
+        {
+            "room_id": room_public_id,
+            "board_id": board.public_id,
+            "name": board.name,
+        }
+    )
+    resp.status_code = 201
+    resp.headers["Location"] = url_for(
+        ".get_board_route",
+        room_public_id=room_public_id,
+        board_public_id=board.public_id,
+    )
+    return resp
+
+
+@board_bp.post("/import")
+@require_permission(Permission.CREATE_BOARD)
+def import_board_route(room_public_id: str):
+    board = import_board_lines(
+        room_public_id=room_public_id,
+        lines=iter(request.stream.readline, b""),
+        name=request.args.get("name"),
+    )
+    resp = jsonify(
+        {
+            "room_id": room_public_id,
+            "board_id": board.public_id,
+            "name": board.name,
+        }
+    )
+    resp.status_code = 201
+    resp.headers["Location"] = url_for(
+        ".get_board_route",
+        room_public_id=room_public_id,
+        board_public_id=board.public_id,
+    )
+    return resp
+
+
+@board_bp.post("/<string:board_public_id>/duplicate")
+@require_permission(Permission.CREATE_BOARD)
+def duplicate_board_route(room_public_id: str, board_public_id: str):
+    data = request.get_json(silent=True) or {}
+    board, copied_cards = duplicate_board(
+        room_public_id=room_public_id,
+        board_public_id=board_public_id,
+        name=data.get("name"),
+    )
     resp = jsonify(
         {
             "room_id": room_public_id,
             "board_id": board.public_id,
             "name": board.name,
+            "copied_cards": copied_cards,
         }
     )
     resp.status_code = 201
     resp.headers["Location"] = url_for(
-        "boards.get_board_route",
+        ".get_board_route",
         room_public_id=room_public_id,
         board_public_id=board.public_id,
     )
@@ -45,7 +102,9 @@ def create_board_route(room_public_id: str):
 @board_bp.delete("/<string:board_public_id>")
 @require_permission(Permission.SOFT_DELETE_BOARD)
 def soft_delete_board_route(room_public_id: str, board_public_id: str):
-    soft_delete_board(board_public_id)
+    soft_delete_board(
+        room_public_id=room_public_id, board_public_id=board_public_id
+    )
     return (
         jsonify({"message": f"Board '{board_public_id}' has been soft deleted."}),
         200,
@@ -54,6 +113,7 @@ def soft_delete_board_route(room_public_id: str, board_public_id: str):
 
 @board_bp.get("")
 @require_permission(Permission.VIEW_BOARD)
+@conditional_get(get_board_list_version)
 def view_board_route(room_public_id: str):
     boards = view_board(room_public_id)
     return jsonify({"boards": [board.public_id for board in boards]}), 200
@@ -91,42 +151,56 @@ def create_board_column_route(room_public_id: str, board_public_id: str):
 
 @board_bp.get("/<string:board_public_id>")
 @require_permission(Permission.VIEW_BOARD)
+@conditional_get(get_board_version)
 def get_board_route(room_public_id: str, board_public_id: str):
-    board, columns = get_board_with_columns(
+    snapshot = get_board_snapshot(
         room_public_id=room_public_id, board_public_id=board_public_id
     )
-    return (
-        jsonify(
-            {
-                "board": {
-                    "public_id": board.public_id,
-                    "name": board.name,
-                    "room_id": room_public_id,
-                },
-                "columns": [
-                    {
-                        "id": column.id,
-                        "title": column.title,
-                        "position": column.position,
-                        "wip_limit": column.wip_limit,
-                        "column_type": column.column_type,
-                        "parent_id": column.parent_id,
-                        "cards": [
-                            {
-                                "id": str(card.public_id),
-                                "title": card.title,
-                                "description": card.description,
-                                "position": card.position,
-                                "column_id": card.column_id,
-                            }
-                            for card in cards
-                        ],
-                    }
-                    for column, cards in columns
-                ],
-            }
-        ),
-        200,
+    return jsonify(snapshot), 200
+
+
+@board_bp.get("/<string:board_public_id>/changes")
+@require_permission(Permission.VIEW_BOARD)
+def get_board_changes_route(room_public_id: str, board_public_id: str):
+    changes = get_board_changes(
+        room_public_id=room_public_id,
+        board_public_id=board_public_id,
+        since=request.args.get("since", type=int),
+    )
+    return jsonify(changes), 200
+
+
+@board_bp.get("/<string:board_public_id>/events")
+@require_permission(Permission.VIEW_BOARD)
+def board_events_route(room_public_id: str, board_public_id: str):
+    since = request.args.get("since", type=int)
+    if since is None:
+        since = request.headers.get("Last-Event-ID", type=int)
+    stream = stream_board_events(
+        room_public_id=room_public_id,
+        board_public_id=board_public_id,
+        since=validate_int(since, "since", required=False, min_value=0),
+    )
+    return Response(
+        stream_with_context(stream),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@board_bp.get("/<string:board_public_id>/export")
+@require_permission(Permission.VIEW_BOARD)
+def export_board_route(room_public_id: str, board_public_id: str):
+    lines = export_board_lines(
+        room_public_id=room_public_id, board_public_id=board_public_id
+    )
+    return Response(
+        stream_with_context(lines),
+        mimetype="application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="board-{board_public_id}.jsonl"',
+            "X-Accel-Buffering": "no",
+        },
     )
 
 
@@ -287,6 +361,10 @@ def hard_delete_board_column_route(
 @require_permission(Permission.VIEW_BOARD)
 def get_board_archive(room_public_id: str, board_public_id: str):
     data = list_archived_items(
-        room_public_id=room_public_id, board_public_id=board_public_id
+        room_public_id=room_public_id,
+        board_public_id=board_public_id,
+        cursor=request.args.get("cursor"),
+        limit=request.args.get("limit", type=int),
+        column_id=request.args.get("column_id", type=int),
     )
     return jsonify(data), 200
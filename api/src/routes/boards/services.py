@@ -1,33 +1,36 @@
+import base64
+import uuid
+from datetime import datetime
 from enum import StrEnum
 
-from flask import g
-from sqlalchemy import func
+from flask import current_app, g
+from sqlalchemy import Integer, func, insert, literal, tuple_, values
+from sqlalchemy import column as sql_column
 from sqlalchemy.orm import selectinload
 
 from ...domain.exceptions import ConflictError, NotFoundError, ValidationError
+from ...domain.ordering import POSITION_GAP
+from ...domain.selectors import resolve_room
 from ...domain.validators import validate_display_text, validate_in_enum, validate_int
 from ...extensions import db
-from ...persistence.models import Board, BoardColumn, Card, Room
+from ...persistence.models import Board, BoardColumn, Card
+from ..cards.positions import respace_column_cards
+from .revisions import bump_board_revision
+from .templates import apply_board_template, resolve_board_template
 
 
 class ColumnType(StrEnum):
     STANDARD = "STANDARD"
 
 
-def create_board(*, room_public_id: int, raw_name: str) -> Board:
-    cleaned_name = validate_display_text(raw_name, "name", min_len=3, max_len=64)
-    room = db.session.execute(
-        db.select(Room).where(
-            Room.public_id == room_public_id, Room.deleted_at.is_(None)
-        )
-    ).scalar_one_or_none()
-    if not room:
-        raise NotFoundError("Room: '{room_public_id}' was not found.")
+def add_board(*, room_id: int, name: str | None) -> Board:
+    """Validate the name and stage a new, empty board without committing."""
+    cleaned_name = validate_display_text(name, "name", min_len=3, max_len=64)
     exists = db.session.execute(
         db.select(func.count())
         .select_from(Board)
         .where(
-            Board.room_id == room.id,
+            Board.room_id == room_id,
             Board.name == cleaned_name,
             Board.deleted_at.is_(None),
         )
@@ -35,29 +38,137 @@ def create_board(*, room_public_id: int, raw_name: str) -> Board:
     if exists:
         raise ConflictError("Board name must be unique.")  # 409
 
-    board = Board(room_id=room.id, name=cleaned_name)
-    with db.session.begin():
-        db.session.add(board)
-        db.session.flush()
+    board = Board(room_id=room_id, name=cleaned_name)
+    db.session.add(board)
+    return board
+
+
+def create_board(
+    *, room_public_id: str, name: str | None, template: str | None = None
+) -> Board:
+    """Create a board, empty or laid out from a named board template."""
+    board_template = resolve_board_template(template) if template else None
+    room = resolve_room(room_public_id)
+    board = add_board(room_id=room.id, name=name)
+    if board_template is not None:
+        apply_board_template(board, board_template)
+    db.session.commit()
     return board
 
 
-def soft_delete_board(board_id: str):
+def duplicate_board(
+    *, room_public_id: str, board_public_id: str, name: str | None = None
+) -> tuple[Board, int]:
+    """
+    Copy a board's active columns and active cards into a new board in the
+    same room, entirely in SQL. A CTE draws the new column ids from the
+    sequence up front, so columns (with their parent links) and cards are
+    copied by one INSERT ... SELECT statement whatever the board's size.
+    Returns the new board and the number of cards copied.
+    """
+    room = resolve_room(room_public_id)
+    source = db.session.execute(
+        db.select(Board.id, Board.name, Board.next_column_position).where(
+            Board.room_id == room.id,
+            Board.public_id == board_public_id,
+            Board.deleted_at.is_(None),
+        )
+    ).one_or_none()
+    if source is None:
+        raise NotFoundError(f"Board '{board_public_id}' not found.")
+
+    board = add_board(room_id=room.id, name=name or f"{source.name} (copy)")
+    board.next_column_position = source.next_column_position
+    db.session.flush()
+
+    column_ids = (
+        db.select(
+            BoardColumn.id.label("old_id"),
+            func.nextval(func.pg_get_serial_sequence("board_columns", "id")).label(
+                "new_id"
+            ),
+        )
+        .where(BoardColumn.board_id == source.id, BoardColumn.deleted_at.is_(None))
+        .cte("column_ids")
+    )
+    parent_ids = column_ids.alias("parent_ids")
+    copied_columns = (
+        insert(BoardColumn)
+        .from_select(
+            [
+                "id",
+                "board_id",
+                "parent_id",
+                "title",
+                "position",
+                "wip_limit",
+                "column_type",
+                "active_card_count",
+                "next_card_position",
+            ],
+            db.select(
+                column_ids.c.new_id,
+                literal(board.id),
+                parent_ids.c.new_id,
+                BoardColumn.title,
+                BoardColumn.position,
+                BoardColumn.wip_limit,
+                BoardColumn.column_type,
+                BoardColumn.active_card_count,
+                BoardColumn.next_card_position,
+            )
+            .join(column_ids, column_ids.c.old_id == BoardColumn.id)
+            .outerjoin(parent_ids, parent_ids.c.old_id == BoardColumn.parent_id),
+        )
+        .returning(BoardColumn.id)
+        .cte("copied_columns")
+    )
+    copied_cards = (
+        insert(Card)
+        .from_select(
+            ["public_id", "board_id", "column_id", "title", "description", "position"],
+            db.select(
+                func.gen_random_uuid(),
+                literal(board.id),
+                column_ids.c.new_id,
+                Card.title,
+                Card.description,
+                Card.position,
+            )
+            .join(column_ids, column_ids.c.old_id == Card.column_id)
+            .where(Card.deleted_at.is_(None)),
+        )
+        .returning(Card.id)
+        .cte("copied_cards")
+    )
+    # Both inserts run as data-modifying CTEs of this one statement.
+    copied_card_count = db.session.execute(
+        db.select(func.count()).select_from(copied_cards).add_cte(copied_columns)
+    ).scalar_one()
+
+    db.session.commit()
+    return board, copied_card_count
+
+
+def soft_delete_board(*, room_public_id: str, board_public_id: str):
+    room = resolve_room(room_public_id)
     stmt = db.select(Board).where(
-        Board.public_id == board_id, Board.deleted_at.is_(None)
+        Board.room_id == room.id,
+        Board.public_id == board_public_id,
+        Board.deleted_at.is_(None),
     )
     board = db.session.scalar(stmt)
     if board is None:
-        raise NotFoundError(f"Board '{board_id}' not found.")
+        raise NotFoundError(f"Board '{board_public_id}' not found.")
     board.soft_delete(g.user.id)
+    bump_board_revision(board.id)
     db.session.commit()
 
 
 def view_board(room_public_id: str):
-    stmt = (
-        db.select(Board)
-        .join(Room, Room.id == Board.room_id)
-        .where(Board.deleted_at.is_(None), Room.public_id == room_public_id)
+    room = resolve_room(room_public_id)
+    stmt = db.select(Board).where(
+        Board.deleted_at.is_(None), Board.room_id == room.id
     )
 
     boards = db.session.scalars(stmt).all()
@@ -91,14 +202,11 @@ def create_board_column(
         else ColumnType.STANDARD.value.lower()
     )
 
-    board_stmt = (
-        db.select(Board)
-        .join(Room, Room.id == Board.room_id)
-        .where(
-            Board.public_id == board_public_id,
-            Board.deleted_at.is_(None),
-            Room.public_id == room_public_id,
-        )
+    room = resolve_room(room_public_id)
+    board_stmt = db.select(Board).where(
+        Board.public_id == board_public_id,
+        Board.deleted_at.is_(None),
+        Board.room_id == room.id,
     )
     board = db.session.execute(board_stmt).scalar_one_or_none()
     if board is None:
@@ -118,19 +226,15 @@ def create_board_column(
                 f"Parent column '{parent_ref}' was not found on this board."
             )
 
-    position_query = (
-        db.select(func.coalesce(func.max(BoardColumn.position), -1))
-        .select_from(BoardColumn)
-        .where(
-            BoardColumn.board_id == board.id,
-            BoardColumn.deleted_at.is_(None),
-        )
-    )
-    if parent_column is None:
-        position_query = position_query.where(BoardColumn.parent_id.is_(None))
-    else:
-        position_query = position_query.where(BoardColumn.parent_id == parent_column.id)
-    next_position = db.session.execute(position_query).scalar_one() + 1
+    # Columns append at the board's high-water mark; writers serialize on the
+    # board row instead of scanning for MAX(position).
+    next_position = db.session.execute(
+        db.update(Board)
+        .where(Board.id == board.id)
+        .values(next_column_position=Board.next_column_position + 1)
+        .returning(Board.next_column_position - 1)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
 
     column = BoardColumn(
         board_id=board.id,
@@ -141,50 +245,19 @@ def create_board_column(
         column_type=normalized_type,
     )
     db.session.add(column)
+    bump_board_revision(board.id, touched=[column])
     db.session.commit()
     return column
 
 
-def get_board_with_columns(
-    *, room_public_id: str, board_public_id: str
-) -> tuple[Board, list[tuple[BoardColumn, list[Card]]]]:
-    stmt = (
-        db.select(Board)
-        .options(
-            selectinload(Board.columns).selectinload(BoardColumn.cards),
-        )
-        .join(Room, Room.id == Board.room_id)
-        .where(
-            Board.public_id == board_public_id,
-            Board.deleted_at.is_(None),
-            Room.public_id == room_public_id,
-        )
-    )
-    board = db.session.execute(stmt).unique().scalar_one_or_none()
-    if board is None:
-        raise NotFoundError(f"Board '{board_public_id}' not found.")
-
-    column_payload: list[tuple[BoardColumn, list[Card]]] = []
-    for column in sorted(board.columns, key=lambda c: c.position):
-        if column.deleted_at:
-            continue
-        active_cards = sorted(
-            (card for card in column.cards if not card.deleted_at),
-            key=lambda c: c.position,
-        )
-        column_payload.append((column, active_cards))
-    return board, column_payload
-
-
 def update_board(
     *, room_public_id: str, board_public_id: str, name: str | None
 ) -> Board:
     cleaned_name = validate_display_text(name, "name", min_len=3, max_len=64)
+    room = resolve_room(room_public_id)
     board = db.session.execute(
-        db.select(Board)
-        .join(Room, Room.id == Board.room_id)
-        .where(
-            Room.public_id == room_public_id,
+        db.select(Board).where(
+            Board.room_id == room.id,
             Board.public_id == board_public_id,
             Board.deleted_at.is_(None),
         )
@@ -193,6 +266,7 @@ def update_board(
         raise NotFoundError(f"Board '{board_public_id}' not found.")
 
     board.name = cleaned_name
+    bump_board_revision(board.id)
     db.session.commit()
     return board
 
@@ -217,12 +291,12 @@ def update_board_column(
         else None
     )
 
+    room = resolve_room(room_public_id)
     column = db.session.execute(
         db.select(BoardColumn)
         .join(Board, Board.id == BoardColumn.board_id)
-        .join(Room, Room.id == Board.room_id)
         .where(
-            Room.public_id == room_public_id,
+            Board.room_id == room.id,
             Board.public_id == board_public_id,
             BoardColumn.id == column_id,
             BoardColumn.deleted_at.is_(None),
@@ -236,6 +310,7 @@ def update_board_column(
     if wip_limit_provided:
         column.wip_limit = limit
 
+    bump_board_revision(column.board_id, touched=[column])
     db.session.commit()
     return column
 
@@ -245,7 +320,7 @@ def reorder_board_columns(
     room_public_id: str,
     board_public_id: str,
     column_ids: list[int] | None,
-) -> list[BoardColumn]:
+) -> list:
     if not isinstance(column_ids, list) or not column_ids:
         raise ValidationError("column_ids must be a non-empty list.")
 
@@ -258,40 +333,77 @@ def reorder_board_columns(
         seen.add(normalized)
         normalized_ids.append(normalized)
 
-    board = db.session.execute(
-        db.select(Board)
-        .options(selectinload(Board.columns))
-        .join(Room, Room.id == Board.room_id)
-        .where(
-            Room.public_id == room_public_id,
+    room = resolve_room(room_public_id)
+    board_id = db.session.execute(
+        db.select(Board.id).where(
+            Board.room_id == room.id,
             Board.public_id == board_public_id,
             Board.deleted_at.is_(None),
         )
     ).scalar_one_or_none()
-    if board is None:
+    if board_id is None:
         raise NotFoundError(f"Board '{board_public_id}' not found.")
 
-    active_columns = {
-        column.id: column
-        for column in board.columns
-        if column.deleted_at is None
-    }
-    if not active_columns:
+    # Every active column is renumbered in one UPDATE ... FROM (VALUES ...):
+    # listed columns first, in request order, then any the request left out,
+    # which the checks below reject.
+    wanted = values(
+        sql_column("column_id", Integer),
+        sql_column("ordinal", Integer),
+        name="wanted",
+    ).data([(column_id, index) for index, column_id in enumerate(normalized_ids)])
+    ranked = (
+        db.select(
+            BoardColumn.id.label("column_id"),
+            wanted.c.ordinal.label("requested"),
+            func.row_number()
+            .over(
+                order_by=(
+                    wanted.c.ordinal.is_(None),
+                    wanted.c.ordinal.asc(),
+                    BoardColumn.position.asc(),
+                    BoardColumn.id.asc(),
+                )
+            )
+            .label("rank"),
+        )
+        .outerjoin(wanted, wanted.c.column_id == BoardColumn.id)
+        .where(BoardColumn.board_id == board_id, BoardColumn.deleted_at.is_(None))
+        .subquery()
+    )
+    revision = bump_board_revision(board_id)
+    columns = db.session.execute(
+        db.update(BoardColumn)
+        .where(BoardColumn.id == ranked.c.column_id)
+        .values(position=ranked.c.rank - 1, revision=revision)
+        .returning(
+            BoardColumn.id,
+            BoardColumn.title,
+            BoardColumn.position,
+            ranked.c.requested,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    if not columns:
+        db.session.rollback()
         raise ValidationError("This board has no active columns to reorder.")
 
-    missing = [col_id for col_id in normalized_ids if col_id not in active_columns]
+    found = {row.id for row in columns}
+    missing = [col_id for col_id in normalized_ids if col_id not in found]
     if missing:
+        db.session.rollback()
         raise ValidationError(
             f"column_ids contains invalid ids for this board: {', '.join(map(str, missing))}."
         )
-    if len(active_columns) != len(normalized_ids):
-        raise ValidationError("column_ids must include every active column exactly once.")
-
-    for position, column_id in enumerate(normalized_ids):
-        active_columns[column_id].position = position
+    if len(columns) != len(normalized_ids):
+        db.session.rollback()
+        raise ValidationError(
+            "column_ids must include every active column exactly once."
+        )
 
     db.session.commit()
-    return [active_columns[column_id] for column_id in normalized_ids]
+    return sorted(columns, key=lambda row: row.position)
 
 
 def reorder_column_cards(
@@ -300,11 +412,12 @@ def reorder_column_cards(
     board_public_id: str,
     column_id: int,
     card_ids: list[str] | None,
-) -> list[Card]:
+) -> list:
     if not isinstance(card_ids, list) or not card_ids:
         raise ValidationError("card_ids must be a non-empty list.")
 
     normalized_ids: list[str] = []
+    public_ids: list[uuid.UUID] = []
     seen: set[str] = set()
     for raw_id in card_ids:
         if not isinstance(raw_id, str):
@@ -314,122 +427,109 @@ def reorder_column_cards(
             raise ValidationError("card_ids cannot contain empty values.")
         if normalized in seen:
             raise ValidationError("card_ids must be unique.")
+        try:
+            public_ids.append(uuid.UUID(normalized))
+        except ValueError:
+            raise ValidationError(
+                f"card_ids contains invalid ids for this column: {normalized}."
+            )
         seen.add(normalized)
         normalized_ids.append(normalized)
 
-    column = (
-        db.session.execute(
-            db.select(BoardColumn)
-            .options(selectinload(BoardColumn.cards))
-            .join(Board, Board.id == BoardColumn.board_id)
-            .join(Room, Room.id == Board.room_id)
-            .where(
-                Room.public_id == room_public_id,
-                Board.public_id == board_public_id,
-                BoardColumn.id == column_id,
-                BoardColumn.deleted_at.is_(None),
-            )
-            .with_for_update()
-        ).scalar_one_or_none()
-    )
+    room = resolve_room(room_public_id)
+    column = db.session.execute(
+        db.select(BoardColumn.id, BoardColumn.board_id)
+        .join(Board, Board.id == BoardColumn.board_id)
+        .where(
+            Board.room_id == room.id,
+            Board.public_id == board_public_id,
+            BoardColumn.id == column_id,
+            BoardColumn.deleted_at.is_(None),
+        )
+    ).one_or_none()
     if column is None:
         raise NotFoundError(f"Column '{column_id}' not found on this board.")
 
-    active_cards = {
-        str(card.public_id): card for card in column.cards if card.deleted_at is None
-    }
+    revision = bump_board_revision(column.board_id)
+    cards = respace_column_cards(
+        column.id, revision=revision, leading_public_ids=public_ids
+    )
+    active_cards = [card for card in cards if card.deleted_at is None]
     if not active_cards:
+        db.session.rollback()
         raise ValidationError("This column has no active cards to reorder.")
 
-    missing = [card_id for card_id in normalized_ids if card_id not in active_cards]
+    found = {card.public_id for card in active_cards if card.requested is not None}
+    missing = [
+        card_id
+        for card_id, public_id in zip(normalized_ids, public_ids)
+        if public_id not in found
+    ]
     if missing:
+        db.session.rollback()
         missing_display = ", ".join(missing)
         raise ValidationError(
             f"card_ids contains invalid ids for this column: {missing_display}."
         )
     if len(active_cards) != len(normalized_ids):
+        db.session.rollback()
         raise ValidationError("card_ids must include every active card exactly once.")
 
-    ordered_active_cards = [active_cards[card_id] for card_id in normalized_ids]
-    archived_cards = sorted(
-        (card for card in column.cards if card.deleted_at is not None),
-        key=lambda c: c.position,
-    )
-    ordered_cards = ordered_active_cards + archived_cards
-
-    current_max_position = (
-        max((card.position for card in ordered_cards), default=-1)
-        if ordered_cards
-        else -1
-    )
-    temp_offset = current_max_position + len(ordered_cards) + 1
-    for idx, card in enumerate(ordered_cards):
-        card.position = temp_offset + idx
-
-    db.session.flush()
-
-    db.session.execute(
-        db.update(Card)
-        .where(Card.column_id == column.id)
-        .values(position=Card.position - temp_offset)
-    )
-
-    db.session.flush()
-    for card in ordered_active_cards:
-        db.session.refresh(card, attribute_names=["position"])
-
     db.session.commit()
-    return ordered_active_cards
+    return active_cards
 
 
 def soft_delete_column(
     *, room_public_id: str, board_public_id: str, column_id: int
 ) -> None:
+    room = resolve_room(room_public_id)
     column = db.session.execute(
         db.select(BoardColumn)
         .join(Board, Board.id == BoardColumn.board_id)
-        .join(Room, Room.id == Board.room_id)
         .where(
-            Room.public_id == room_public_id,
+            Board.room_id == room.id,
             Board.public_id == board_public_id,
             BoardColumn.id == column_id,
             BoardColumn.deleted_at.is_(None),
         )
-        .options(selectinload(BoardColumn.cards))
     ).scalar_one_or_none()
     if column is None:
         raise NotFoundError(f"Column '{column_id}' not found on this board.")
 
-    column.soft_delete(
-        getattr(g, "user", None).id if getattr(g, "user", None) else None
+    actor_id = getattr(g, "user", None).id if getattr(g, "user", None) else None
+    column.soft_delete(actor_id)
+    column.active_card_count = 0
+    revision = bump_board_revision(column.board_id, touched=[column])
+    # Only the active cards change; already archived ones are not loaded.
+    db.session.execute(
+        db.update(Card)
+        .where(Card.column_id == column.id, Card.deleted_at.is_(None))
+        .values(deleted_at=func.now(), deleted_by_id=actor_id, revision=revision)
+        .execution_options(synchronize_session=False)
     )
-    for card in column.cards:
-        card.soft_delete(
-            getattr(g, "user", None).id if getattr(g, "user", None) else None
-        )
     db.session.commit()
 
 
 def restore_column(
     *, room_public_id: str, board_public_id: str, column_id: int
 ) -> BoardColumn:
+    room = resolve_room(room_public_id)
     column = db.session.execute(
         db.select(BoardColumn)
         .join(Board, Board.id == BoardColumn.board_id)
-        .join(Room, Room.id == Board.room_id)
         .where(
-            Room.public_id == room_public_id,
+            Board.room_id == room.id,
             Board.public_id == board_public_id,
             BoardColumn.id == column_id,
             BoardColumn.deleted_at.is_not(None),
         )
-        .options(selectinload(BoardColumn.cards))
     ).scalar_one_or_none()
     if column is None:
         raise NotFoundError(f"Archived column '{column_id}' was not found.")
 
     column.restore()
 
+    bump_board_revision(column.board_id, touched=[column])
     db.session.commit()
     return column
 
@@ -441,12 +541,12 @@ def hard_delete_column(
     column_id: int,
     force: bool = False,
 ) -> None:
+    room = resolve_room(room_public_id)
     column = db.session.execute(
         db.select(BoardColumn)
         .join(Board, Board.id == BoardColumn.board_id)
-        .join(Room, Room.id == Board.room_id)
         .where(
-            Room.public_id == room_public_id,
+            Board.room_id == room.id,
             Board.public_id == board_public_id,
             BoardColumn.id == column_id,
             BoardColumn.deleted_at.is_not(None),
@@ -463,6 +563,7 @@ def hard_delete_column(
         )
 
     cards_to_move = sorted(column.cards, key=lambda c: (c.position, c.id))
+    touched = list(cards_to_move)
     fallback_column = None
     if cards_to_move:
         fallback_column = (
@@ -482,72 +583,116 @@ def hard_delete_column(
             raise ConflictError(
                 "Cannot hard delete this column because the board has no active columns to receive its archived cards. Create or restore a column first."
             )
-        next_position = (
-            db.session.execute(
-                db.select(func.coalesce(func.max(Card.position), -1)).where(
-                    Card.column_id == fallback_column.id
-                )
-            ).scalar_one()
-            + 1
-        )
+        span = len(cards_to_move) * POSITION_GAP
+        next_position = db.session.execute(
+            db.update(BoardColumn)
+            .where(BoardColumn.id == fallback_column.id)
+            .values(next_card_position=BoardColumn.next_card_position + span)
+            .returning(BoardColumn.next_card_position - span)
+            .execution_options(synchronize_session=False)
+        ).scalar_one()
         for card in cards_to_move:
             card.column = fallback_column
             card.position = next_position
-            next_position += 1
+            next_position += POSITION_GAP
+        if active_cards:
+            fallback_column.active_card_count = (
+                BoardColumn.active_card_count + len(active_cards)
+            )
+            touched.append(fallback_column)
 
+    bump_board_revision(column.board_id, touched=touched, purged=True)
     db.session.delete(column)
     db.session.commit()
 
 
+def _encode_archive_cursor(deleted_at: datetime, card_id: int) -> str:
+    raw = f"{deleted_at.isoformat()}|{card_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_archive_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        deleted_at, card_id = (
+            base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        )
+        return datetime.fromisoformat(deleted_at), int(card_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationError("'cursor' is not a valid archive cursor.")
+
+
 def list_archived_items(
-    *, room_public_id: str, board_public_id: str
-) -> dict[str, list]:
-    board = db.session.execute(
-        db.select(Board)
-        .join(Room, Room.id == Board.room_id)
-        .where(
-            Room.public_id == room_public_id,
+    *,
+    room_public_id: str,
+    board_public_id: str,
+    cursor: str | None = None,
+    limit: int | None = None,
+    column_id: int | None = None,
+) -> dict:
+    """
+    One page of a board's archived cards, newest first, keyed on
+    (deleted_at, id) so every page is an index range scan on
+    ix_cards_board_archived however deep the archive is. Pass the returned
+    `next_cursor` back to get the following page; it is None on the last
+    page. Archived columns are few and come with the first page only.
+    """
+    max_page_size = current_app.config.get("ARCHIVE_MAX_PAGE_SIZE", 200)
+    page_size = validate_int(
+        limit if limit is not None else current_app.config.get("ARCHIVE_PAGE_SIZE", 50),
+        "limit",
+        required=True,
+        min_value=1,
+        max_value=max_page_size,
+    )
+    column_filter = validate_int(column_id, "column_id", required=False, min_value=1)
+    after = _decode_archive_cursor(cursor) if cursor else None
+
+    room = resolve_room(room_public_id)
+    board_id = db.session.execute(
+        db.select(Board.id).where(
+            Board.room_id == room.id,
             Board.public_id == board_public_id,
             Board.deleted_at.is_(None),
         )
     ).scalar_one_or_none()
-    if board is None:
+    if board_id is None:
         raise NotFoundError(f"Board '{board_public_id}' not found.")
 
-    archived_columns = (
-        db.session.execute(
-            db.select(BoardColumn)
+    archived_columns = []
+    if after is None:
+        archived_columns = db.session.execute(
+            db.select(BoardColumn.id, BoardColumn.title, BoardColumn.deleted_at)
             .where(
-                BoardColumn.board_id == board.id,
+                BoardColumn.board_id == board_id,
                 BoardColumn.deleted_at.is_not(None),
             )
-            .order_by(BoardColumn.deleted_at.desc())
-        )
-        .scalars()
-        .all()
-    )
-
-    archived_cards = (
-        db.session.execute(
-            db.select(Card)
-            .where(
-                Card.board_id == board.id,
-                Card.deleted_at.is_not(None),
-            )
-            .order_by(Card.deleted_at.desc())
-        )
-        .scalars()
-        .all()
-    )
+            .order_by(BoardColumn.deleted_at.desc(), BoardColumn.id.desc())
+        ).all()
+
+    cards_stmt = db.select(
+        Card.id, Card.public_id, Card.title, Card.column_id, Card.deleted_at
+    ).where(Card.board_id == board_id, Card.deleted_at.is_not(None))
+    if column_filter is not None:
+        cards_stmt = cards_stmt.where(Card.column_id == column_filter)
+    if after is not None:
+        cards_stmt = cards_stmt.where(tuple_(Card.deleted_at, Card.id) < tuple_(*after))
+    archived_cards = db.session.execute(
+        cards_stmt.order_by(Card.deleted_at.desc(), Card.id.desc()).limit(page_size + 1)
+    ).all()
+
+    next_cursor = None
+    if len(archived_cards) > page_size:
+        archived_cards = archived_cards[:page_size]
+        last = archived_cards[-1]
+        next_cursor = _encode_archive_cursor(last.deleted_at, last.id)
 
     return {
         "columns": [
             {
                 "id": column.id,
                 "title": column.title,
-                "deleted_at": (
-                    column.deleted_at.isoformat() if column.deleted_at else None
-                ),
+                "deleted_at": column.deleted_at.isoformat(),
             }
             for column in archived_columns
         ],
@@ -556,8 +701,9 @@ def list_archived_items(
                 "public_id": str(card.public_id),
                 "title": card.title,
                 "column_id": card.column_id,
-                "deleted_at": card.deleted_at.isoformat() if card.deleted_at else None,
+                "deleted_at": card.deleted_at.isoformat(),
             }
             for card in archived_cards
         ],
+        "next_cursor": next_cursor,
     }
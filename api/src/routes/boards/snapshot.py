@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from sqlalchemy import and_, func
+
+from ...domain.exceptions import NotFoundError
+from ...domain.selectors import resolve_room
+from ...extensions import db
+from ...persistence.models import Board, BoardColumn, Card
+
+
+def _snapshot_statement(room_id: int, board_public_id: str):
+    """
+    One round-trip for the whole board: active columns and active cards are
+    filtered and ordered by Postgres, cards walking ix_cards_board_active.
+    Rows are plain tuples; no ORM instances are hydrated.
+    """
+    return (
+        db.select(
+            Board.public_id.label("board_public_id"),
+            Board.name.label("board_name"),
+            Board.revision.label("board_revision"),
+            BoardColumn.id.label("column_id"),
+            BoardColumn.title.label("column_title"),
+            BoardColumn.position.label("column_position"),
+            BoardColumn.wip_limit,
+            BoardColumn.column_type,
+            BoardColumn.parent_id,
+            BoardColumn.active_card_count,
+            Card.public_id.label("card_public_id"),
+            Card.title.label("card_title"),
+            Card.description.label("card_description"),
+            Card.position.label("card_position"),
+        )
+        .select_from(Board)
+        .outerjoin(
+            BoardColumn,
+            and_(
+                BoardColumn.board_id == Board.id,
+                BoardColumn.deleted_at.is_(None),
+            ),
+        )
+        .outerjoin(
+            Card,
+            and_(
+                Card.board_id == Board.id,
+                Card.column_id == BoardColumn.id,
+                Card.deleted_at.is_(None),
+            ),
+        )
+        .where(
+            Board.room_id == room_id,
+            Board.public_id == board_public_id,
+            Board.deleted_at.is_(None),
+        )
+        .order_by(
+            BoardColumn.position.asc(),
+            BoardColumn.id.asc(),
+            Card.position.asc(),
+        )
+    )
+
+
+def build_board_snapshot(rows, *, room_public_id: str) -> dict | None:
+    board_payload = None
+    columns: list[dict] = []
+    current_column = None
+    for row in rows:
+        if board_payload is None:
+            board_payload = {
+                "public_id": row.board_public_id,
+                "name": row.board_name,
+                "room_id": room_public_id,
+                "revision": row.board_revision,
+            }
+        if row.column_id is None:
+            continue
+        if current_column is None or current_column["id"] != row.column_id:
+            current_column = {
+                "id": row.column_id,
+                "title": row.column_title,
+                "position": row.column_position,
+                "wip_limit": row.wip_limit,
+                "column_type": row.column_type,
+                "parent_id": row.parent_id,
+                "active_card_count": row.active_card_count,
+                "cards": [],
+            }
+            columns.append(current_column)
+        if row.card_public_id is not None:
+            current_column["cards"].append(
+                {
+                    "id": str(row.card_public_id),
+                    "title": row.card_title,
+                    "description": row.card_description,
+                    "position": row.card_position,
+                    "column_id": row.column_id,
+                }
+            )
+    if board_payload is None:
+        return None
+    return {"board": board_payload, "columns": columns}
+
+
+def load_board_snapshot(
+    *, room_id: int, room_public_id: str, board_public_id: str
+) -> dict | None:
+    """Snapshot of a board in an already resolved room, or None if missing."""
+    rows = db.session.execute(_snapshot_statement(room_id, board_public_id))
+    return build_board_snapshot(rows, room_public_id=room_public_id)
+
+
+def get_board_snapshot(*, room_public_id: str, board_public_id: str) -> dict:
+    room = resolve_room(room_public_id)
+    snapshot = load_board_snapshot(
+        room_id=room.id,
+        room_public_id=room_public_id,
+        board_public_id=board_public_id,
+    )
+    if snapshot is None:
+        raise NotFoundError(f"Board '{board_public_id}' not found.")
+    return snapshot
+
+
+def get_board_version(*, room_public_id: str, board_public_id: str) -> tuple | None:
+    """
+    Every mutation that changes the snapshot bumps Board.revision, so the
+    revision alone identifies a snapshot.
+    """
+    room = resolve_room(room_public_id)
+    row = db.session.execute(
+        db.select(Board.id, Board.revision).where(
+            Board.room_id == room.id,
+            Board.public_id == board_public_id,
+            Board.deleted_at.is_(None),
+        )
+    ).one_or_none()
+    return tuple(row) if row is not None else None
+
+
+def get_board_list_version(*, room_public_id: str) -> tuple:
+    room = resolve_room(room_public_id)
+    newest, count = db.session.execute(
+        db.select(func.max(Board.updated_at), func.count()).where(
+            Board.room_id == room.id
+        )
+    ).one()
+    return (room.id, newest, count)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy import insert
+
+from ...domain.exceptions import ValidationError
+from ...domain.ordering import POSITION_GAP, spaced_positions
+from ...domain.validators import validate_str
+from ...extensions import db
+from ...persistence.models import Board, BoardColumn, Card
+
+
+@dataclass(frozen=True)
+class CardTemplate:
+    title: str
+    description: str | None = None
+
+
+@dataclass(frozen=True)
+class ColumnTemplate:
+    title: str
+    wip_limit: int | None = None
+    cards: tuple[CardTemplate, ...] = ()
+
+
+@dataclass(frozen=True)
+class BoardTemplate:
+    key: str
+    board_name: str
+    columns: tuple[ColumnTemplate, ...]
+
+
+ADVENTURE_TEMPLATE = BoardTemplate(
+    key="adventure",
+    board_name="Adventure Roadmap",
+    columns=(
+        ColumnTemplate(
+            title="Quest Backlog · Incoming Ideas",
+            wip_limit=6,
+            cards=(
+                CardTemplate(
+                    "Capture Guild Requests",
+                    "List ideas, bug reports, or enhancements as soon as they appear so the guild never forgets them.",
+                ),
+                CardTemplate(
+                    "Prioritize This Week's Adventures",
+                    "Choose which quests move forward next and drag them into Active Quests when you're ready to work.",
+                ),
+            ),
+        ),
+        ColumnTemplate(
+            title="Active Quests · In Progress",
+            wip_limit=4,
+            cards=(
+                CardTemplate(
+                    "Craft the Perfect Story Card",
+                    "Use the description to explain the why, who, and victory condition for the quest you're tackling.",
+                ),
+                CardTemplate(
+                    "Co-op Sync",
+                    "Leave notes or links teammates will need while you collaborate on this adventure.",
+                ),
+            ),
+        ),
+        ColumnTemplate(
+            title="Hall of Legends · Completed",
+            cards=(
+                CardTemplate(
+                    "Celebrate a Win",
+                    "Move quests here when you finish them and jot down what went well so future heroes learn from it.",
+                ),
+            ),
+        ),
+    ),
+)
+
+KANBAN_TEMPLATE = BoardTemplate(
+    key="kanban",
+    board_name="Kanban",
+    columns=(
+        ColumnTemplate(title="To Do"),
+        ColumnTemplate(title="Doing", wip_limit=3),
+        ColumnTemplate(title="Done"),
+    ),
+)
+
+SPRINT_TEMPLATE = BoardTemplate(
+    key="sprint",
+    board_name="Sprint Board",
+    columns=(
+        ColumnTemplate(title="Sprint Backlog"),
+        ColumnTemplate(title="In Progress", wip_limit=5),
+        ColumnTemplate(title="In Review", wip_limit=3),
+        ColumnTemplate(title="Done"),
+    ),
+)
+
+BOARD_TEMPLATES: dict[str, BoardTemplate] = {
+    template.key: template
+    for template in (ADVENTURE_TEMPLATE, KANBAN_TEMPLATE, SPRINT_TEMPLATE)
+}
+DEFAULT_BOARD_TEMPLATE = ADVENTURE_TEMPLATE.key
+
+
+def resolve_board_template(key: str | None) -> BoardTemplate:
+    if isinstance(key, str) and not key.strip():
+        key = None
+    key = validate_str(key, "template", required=False, min_len=1)
+    template = BOARD_TEMPLATES.get((key or DEFAULT_BOARD_TEMPLATE).lower())
+    if template is None:
+        raise ValidationError(
+            f"'template' must be one of: {', '.join(BOARD_TEMPLATES)}."
+        )
+    return template
+
+
+def apply_board_template(board: Board, template: BoardTemplate) -> None:
+    """
+    Fill a new, still empty board with the template's columns and cards.
+    The board is flushed if pending, then columns go in with one multi-row
+    INSERT ... RETURNING id and cards with one more, so the cost does not
+    grow with the template. The board's counters are set from the template.
+    """
+    board.next_column_position = len(template.columns)
+    db.session.flush()
+    if not template.columns:
+        return
+
+    column_ids = db.session.execute(
+        insert(BoardColumn).returning(BoardColumn.id, sort_by_parameter_order=True),
+        [
+            {
+                "board_id": board.id,
+                "title": column.title,
+                "position": position,
+                "wip_limit": column.wip_limit,
+                "column_type": "standard",
+                "active_card_count": len(column.cards),
+                "next_card_position": POSITION_GAP * (len(column.cards) + 1),
+            }
+            for position, column in enumerate(template.columns)
+        ],
+        # Keep NULL wip_limits in the row so all rows share one INSERT.
+        execution_options={"render_nulls": True},
+    ).scalars()
+
+    card_rows = [
+        {
+            "board_id": board.id,
+            "column_id": column_id,
+            "title": card.title,
+            "description": card.description,
+            "position": position,
+        }
+        for column_id, column in zip(column_ids, template.columns)
+        for position, card in zip(spaced_positions(len(column.cards)), column.cards)
+    ]
+    if card_rows:
+        db.session.execute(insert(Card).values(card_rows))
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
+
+from flask import current_app
+from sqlalchemy import Integer, cast, insert, values
+from sqlalchemy import column as sql_column
+
+from ...domain.exceptions import AppError, NotFoundError, ValidationError
+from ...domain.ordering import POSITION_GAP
+from ...domain.selectors import resolve_room
+from ...domain.validators import (
+    validate_display_text,
+    validate_int,
+    validate_multiline_text,
+)
+from ...extensions import db
+from ...persistence.models import Board, BoardColumn, Card
+from .services import ColumnType, add_board
+
+# Bump when the line layout changes; the importer rejects other versions.
+BOARD_EXPORT_FORMAT = 1
+
+
+def _chunk_size() -> int:
+    return current_app.config.get("BOARD_TRANSFER_CHUNK_SIZE", 500)
+
+
+def export_board_lines(*, room_public_id: str, board_public_id: str) -> Iterator[str]:
+    """
+    Stream a board as JSON Lines: one "board" header, then every column, then
+    every card (archived ones included), cards grouped by column in position
+    order. Cards are read through a server-side cursor in chunks of
+    BOARD_TRANSFER_CHUNK_SIZE, so memory stays flat however large the board.
+    The board is resolved before streaming so a missing board is a normal 404.
+    """
+    room = resolve_room(room_public_id)
+    board = db.session.execute(
+        db.select(Board.id, Board.name).where(
+            Board.room_id == room.id,
+            Board.public_id == board_public_id,
+            Board.deleted_at.is_(None),
+        )
+    ).one_or_none()
+    if board is None:
+        raise NotFoundError(f"Board '{board_public_id}' not found.")
+
+    def line(record: dict) -> str:
+        return json.dumps(record, separators=(",", ":")) + "\n"
+
+    def generate() -> Iterator[str]:
+        yield line({"type": "board", "format": BOARD_EXPORT_FORMAT, "name": board.name})
+        columns = db.session.execute(
+            db.select(
+                BoardColumn.id,
+                BoardColumn.parent_id,
+                BoardColumn.title,
+                BoardColumn.position,
+                BoardColumn.wip_limit,
+                BoardColumn.column_type,
+                BoardColumn.deleted_at,
+            )
+            .where(BoardColumn.board_id == board.id)
+            .order_by(BoardColumn.id.asc())
+        )
+        yield "".join(
+            line(
+                {
+                    "type": "column",
+                    "ref": row.id,
+                    "parent_ref": row.parent_id,
+                    "title": row.title,
+                    "position": row.position,
+                    "wip_limit": row.wip_limit,
+                    "column_type": row.column_type,
+                    "archived": row.deleted_at is not None,
+                }
+            )
+            for row in columns
+        )
+        cards = db.session.execute(
+            db.select(
+                Card.column_id,
+                Card.title,
+                Card.description,
+                Card.position,
+                Card.deleted_at,
+            )
+            .where(Card.board_id == board.id)
+            .order_by(Card.column_id.asc(), Card.position.asc())
+            .execution_options(yield_per=_chunk_size())
+        )
+        for partition in cards.partitions():
+            yield "".join(
+                line(
+                    {
+                        "type": "card",
+                        "column_ref": row.column_id,
+                        "title": row.title,
+                        "description": row.description,
+                        "position": row.position,
+                        "archived": row.deleted_at is not None,
+                    }
+                )
+                for row in partition
+            )
+        db.session.close()
+
+    return generate()
+
+
+def _records(lines: Iterable[bytes | str]) -> Iterator[tuple[int, dict]]:
+    for number, raw in enumerate(lines, start=1):
+        text = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError:
+            raise ValidationError(f"Line {number} is not valid JSON.")
+        if not isinstance(record, dict):
+            raise ValidationError(f"Line {number} must be a JSON object.")
+        yield number, record
+
+
+def _archived_at(record: dict, imported_at: datetime) -> datetime | None:
+    # A plain value rather than now(): column rows go through executemany,
+    # where SQL expressions cannot be bound as parameters.
+    return imported_at if record.get("archived") else None
+
+
+def _column_type(record: dict) -> str:
+    column_type = record.get("column_type") or ColumnType.STANDARD.value
+    allowed = [item.value for item in ColumnType]
+    if not isinstance(column_type, str) or column_type.upper() not in allowed:
+        raise ValidationError(f"'column_type' must be one of: {', '.join(allowed)}.")
+    return column_type.lower()
+
+
+class _ImportedColumn:
+    def __init__(self, record: dict, imported_at: datetime):
+        self.ref = record.get("ref")
+        self.parent_ref = record.get("parent_ref")
+        self.position = validate_int(
+            record.get("position"), "position", required=True, min_value=0
+        )
+        self.row = {
+            "title": validate_display_text(
+                record.get("title"), "title", min_len=3, max_len=64
+            ),
+            "position": self.position,
+            "wip_limit": validate_int(
+                record.get("wip_limit"),
+                "wip_limit",
+                required=False,
+                min_value=0,
+                max_value=999,
+            ),
+            "column_type": _column_type(record),
+            "deleted_at": _archived_at(record, imported_at),
+        }
+        self.id: int | None = None
+        self.active_card_count = 0
+        self.next_card_position = POSITION_GAP
+
+
+def import_board_lines(
+    *, room_public_id: str, lines: Iterable[bytes | str], name: str | None = None
+) -> Board:
+    """
+    Create a new board in the room from an export_board_lines stream.
+    - Lines are consumed as they arrive; nothing holds the whole file
+    - Columns and cards are inserted with multi-row INSERTs of
+      BOARD_TRANSFER_CHUNK_SIZE rows
+    - Column counters and parent links are fixed up in one final UPDATE
+    The import is one transaction, so a bad line leaves no partial board.
+    `name` overrides the exported board name, e.g. to import a second copy.
+    """
+    room = resolve_room(room_public_id)
+    chunk_size = _chunk_size()
+    records = _records(lines)
+    imported_at = datetime.now(timezone.utc)
+
+    header = next(records, None)
+    if header is None or header[1].get("type") != "board":
+        raise ValidationError("The first line must be the board header.")
+    if header[1].get("format") != BOARD_EXPORT_FORMAT:
+        raise ValidationError(
+            f"Unsupported export format; expected {BOARD_EXPORT_FORMAT}."
+        )
+    board = add_board(room_id=room.id, name=name or header[1].get("name"))
+    db.session.flush()
+
+    columns: dict = {}
+    pending_columns: list[_ImportedColumn] = []
+    pending_cards: list[dict] = []
+    cards_started = False
+
+    def flush_columns() -> None:
+        if not pending_columns:
+            return
+        new_ids = db.session.execute(
+            insert(BoardColumn).returning(BoardColumn.id, sort_by_parameter_order=True),
+            [{"board_id": board.id, **column.row} for column in pending_columns],
+            execution_options={"render_nulls": True},
+        ).scalars()
+        for column, new_id in zip(pending_columns, new_ids):
+            column.id = new_id
+        pending_columns.clear()
+
+    def flush_cards() -> None:
+        if pending_cards:
+            db.session.execute(insert(Card).values(pending_cards))
+            pending_cards.clear()
+
+    for number, record in records:
+        try:
+            kind = record.get("type")
+            if kind == "column":
+                if cards_started:
+                    raise ValidationError("Columns must come before cards.")
+                column = _ImportedColumn(record, imported_at)
+                if column.ref is None or column.ref in columns:
+                    raise ValidationError("Each column needs a unique 'ref'.")
+                columns[column.ref] = column
+                pending_columns.append(column)
+                if len(pending_columns) >= chunk_size:
+                    flush_columns()
+            elif kind == "card":
+                cards_started = True
+                flush_columns()
+                column = columns.get(record.get("column_ref"))
+                if column is None:
+                    raise ValidationError("'column_ref' does not match any column.")
+                position = validate_int(
+                    record.get("position"), "position", required=True, min_value=0
+                )
+                if not record.get("archived"):
+                    column.active_card_count += 1
+                column.next_card_position = max(
+                    column.next_card_position, position + POSITION_GAP
+                )
+                pending_cards.append(
+                    {
+                        "board_id": board.id,
+                        "column_id": column.id,
+                        "title": validate_display_text(
+                            record.get("title"), "title", min_len=1, max_len=255
+                        ),
+                        "description": validate_multiline_text(
+                            record.get("description"),
+                            "description",
+                            required=False,
+                            max_len=4000,
+                        ),
+                        "position": position,
+                        "deleted_at": _archived_at(record, imported_at),
+                    }
+                )
+                if len(pending_cards) >= chunk_size:
+                    flush_cards()
+            else:
+                raise ValidationError("'type' must be 'column' or 'card'.")
+        except AppError as error:
+            raise ValidationError(f"Line {number}: {error.detail}")
+    flush_columns()
+    flush_cards()
+
+    if columns:
+        missing_parents = [
+            column.ref
+            for column in columns.values()
+            if column.parent_ref is not None and column.parent_ref not in columns
+        ]
+        if missing_parents:
+            raise ValidationError(
+                f"Columns reference unknown parents: {', '.join(map(str, missing_parents))}."
+            )
+        wanted = values(
+            sql_column("column_id", Integer),
+            sql_column("parent_id", Integer),
+            sql_column("active_card_count", Integer),
+            sql_column("next_card_position", Integer),
+            name="wanted",
+        ).data(
+            [
+                (
+                    column.id,
+                    (
+                        columns[column.parent_ref].id
+                        if column.parent_ref is not None
+                        else None
+                    ),
+                    column.active_card_count,
+                    column.next_card_position,
+                )
+                for column in columns.values()
+            ]
+        )
+        db.session.execute(
+            db.update(BoardColumn)
+            .where(BoardColumn.id == wanted.c.column_id)
+            .values(
+                # An all-NULL VALUES column would otherwise be typed as text.
+                parent_id=cast(wanted.c.parent_id, Integer),
+                active_card_count=wanted.c.active_card_count,
+                next_card_position=wanted.c.next_card_position,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        board.next_column_position = max(
+            max(column.position for column in columns.values()) + 1, len(columns)
+        )
+
+    db.session.commit()
+    return board
@@ -6,4 +6,10 @@ card_bp = Blueprint(
     url_prefix="/rooms/<string:room_public_id>/boards/<string:board_public_id>/columns/<int:column_id>/cards",
 )
 
+card_batch_bp = Blueprint(
+    "card_batches",
+    __name__,
+    url_prefix="/rooms/<string:room_public_id>/boards/<string:board_public_id>/cards",
+)
+
 from . import routes  # noqa: E402,F401
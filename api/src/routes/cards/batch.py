@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+from flask import current_app, g
+from sqlalchemy import Boolean, Integer, case, func, insert, values
+from sqlalchemy import column as sql_column
+
+from ...domain.exceptions import (
+    AppError,
+    ConflictError,
+    NotFoundError,
+    ValidationError,
+)
+from ...domain.ordering import POSITION_GAP
+from ...domain.selectors import resolve_room
+from ...domain.validators import (
+    validate_display_text,
+    validate_int,
+    validate_multiline_text,
+)
+from ...extensions import db
+from ...persistence.models import Board, BoardColumn, Card
+from ..boards.revisions import bump_board_revision
+
+BATCH_OPERATIONS = ("create", "move", "archive")
+
+
+class CardBatchError(AppError):
+    """At least one operation failed, so none of the batch was applied."""
+
+    title = "Batch Failed"
+    detail = "No operations were applied because at least one of them failed."
+
+    def __init__(self, results: list[dict], status_code: int):
+        super().__init__()
+        self.results = results
+        self.status_code = status_code
+
+    def to_problem(self, instance: str | None = None) -> dict:
+        problem = super().to_problem(instance)
+        problem["results"] = self.results
+        return problem
+
+
+@dataclass
+class _ColumnState:
+    id: int
+    title: str
+    wip_limit: int | None
+    active_card_count: int
+    next_card_position: int
+    changed: bool = False
+
+    def append(self) -> int:
+        position = self.next_card_position
+        self.next_card_position += POSITION_GAP
+        self.changed = True
+        return position
+
+
+@dataclass
+class _CardState:
+    id: int | None
+    public_id: uuid.UUID
+    title: str
+    description: str | None
+    column_id: int
+    position: int
+    archived: bool = False
+    changed: bool = False
+
+
+def _parse_operation(raw) -> dict:
+    if not isinstance(raw, dict):
+        raise ValidationError("Each operation must be an object.")
+    op = raw.get("op")
+    if op not in BATCH_OPERATIONS:
+        raise ValidationError(f"'op' must be one of: {', '.join(BATCH_OPERATIONS)}.")
+    if op == "create":
+        return {
+            "op": op,
+            "column_id": validate_int(
+                raw.get("column_id"), "column_id", required=True, min_value=1
+            ),
+            "title": validate_display_text(
+                raw.get("title"), "title", min_len=1, max_len=120
+            ),
+            "description": validate_multiline_text(
+                raw.get("description"), "description", required=False, max_len=4000
+            ),
+        }
+    card_id = raw.get("card_id")
+    try:
+        public_id = uuid.UUID(str(card_id))
+    except ValueError:
+        raise ValidationError(f"'card_id' is not a valid card id: {card_id}.")
+    parsed = {"op": op, "card_id": public_id}
+    if op == "move":
+        parsed["column_id"] = validate_int(
+            raw.get("column_id"), "column_id", required=True, min_value=1
+        )
+    return parsed
+
+
+def _error_result(index: int, op, error: AppError) -> dict:
+    return {
+        "index": index,
+        "op": op,
+        "status": "error",
+        "code": error.status_code,
+        "detail": error.detail,
+    }
+
+
+def _raise_if_failed(results: list[dict]) -> None:
+    failures = [result for result in results if result["status"] == "error"]
+    if not failures:
+        return
+    db.session.rollback()
+    for result in results:
+        if result["status"] == "ok":
+            result["status"] = "not_applied"
+            result.pop("card", None)
+    raise CardBatchError(results, failures[0]["code"])
+
+
+def _card_payload(card: _CardState) -> dict:
+    return {
+        "id": str(card.public_id),
+        "title": card.title,
+        "description": card.description,
+        "position": card.position,
+        "column_id": card.column_id,
+        "archived": card.archived,
+    }
+
+
+def apply_card_batch(
+    *, room_public_id: str, board_public_id: str, operations: list | None
+) -> list[dict]:
+    """
+    Apply create/move/archive operations to one board in a single transaction.
+    - All operations are validated before anything is written
+    - Affected columns are locked once, in id order, and WIP limits and
+      append positions are tracked in memory across the whole batch
+    - Writes are one INSERT for new cards and one UPDATE ... FROM (VALUES ...)
+      each for existing cards and columns
+    Either every operation is applied or CardBatchError reports per-item
+    results and nothing is.
+    """
+    max_operations = current_app.config.get("CARD_BATCH_MAX_OPERATIONS", 500)
+    if not isinstance(operations, list) or not operations:
+        raise ValidationError("operations must be a non-empty list.")
+    if len(operations) > max_operations:
+        raise ValidationError(
+            f"A batch can contain at most {max_operations} operations."
+        )
+
+    results: list[dict] = []
+    parsed: list[dict | None] = []
+    for index, raw in enumerate(operations):
+        op = raw.get("op") if isinstance(raw, dict) else None
+        try:
+            parsed.append(_parse_operation(raw))
+            results.append({"index": index, "op": op, "status": "ok"})
+        except AppError as error:
+            parsed.append(None)
+            results.append(_error_result(index, op, error))
+    _raise_if_failed(results)
+
+    room = resolve_room(room_public_id)
+    board_id = db.session.execute(
+        db.select(Board.id).where(
+            Board.room_id == room.id,
+            Board.public_id == board_public_id,
+            Board.deleted_at.is_(None),
+        )
+    ).scalar_one_or_none()
+    if board_id is None:
+        raise NotFoundError(f"Board '{board_public_id}' not found.")
+
+    # The revision bump takes the board row lock, so no other writer can touch
+    # these cards or columns until this transaction ends.
+    revision = bump_board_revision(board_id)
+
+    card_ids = {item["card_id"] for item in parsed if "card_id" in item}
+    cards: dict[uuid.UUID, _CardState] = {}
+    if card_ids:
+        for row in db.session.execute(
+            db.select(
+                Card.id,
+                Card.public_id,
+                Card.title,
+                Card.description,
+                Card.column_id,
+                Card.position,
+            ).where(
+                Card.board_id == board_id,
+                Card.public_id.in_(card_ids),
+                Card.deleted_at.is_(None),
+            )
+        ):
+            cards[row.public_id] = _CardState(**row._mapping)
+
+    column_ids = {item["column_id"] for item in parsed if "column_id" in item}
+    column_ids.update(card.column_id for card in cards.values())
+    columns = {
+        row.id: _ColumnState(**row._mapping)
+        for row in db.session.execute(
+            db.select(
+                BoardColumn.id,
+                BoardColumn.title,
+                BoardColumn.wip_limit,
+                BoardColumn.active_card_count,
+                BoardColumn.next_card_position,
+            )
+            .where(
+                BoardColumn.board_id == board_id,
+                BoardColumn.id.in_(column_ids),
+                BoardColumn.deleted_at.is_(None),
+            )
+            .order_by(BoardColumn.id.asc())
+            .with_for_update()
+        )
+    }
+
+    def target_column(column_id: int) -> _ColumnState:
+        column = columns.get(column_id)
+        if column is None:
+            raise NotFoundError(f"Column '{column_id}' was not found on this board.")
+        if (
+            column.wip_limit is not None
+            and column.active_card_count >= column.wip_limit
+        ):
+            raise ConflictError(
+                f"WIP limit reached for column '{column.title}'. Move or complete an existing card first."
+            )
+        return column
+
+    def active_card(public_id: uuid.UUID) -> _CardState:
+        card = cards.get(public_id)
+        if card is None or card.archived:
+            raise NotFoundError(f"Card '{public_id}' not found.")
+        return card
+
+    new_cards: list[_CardState] = []
+    for item, result in zip(parsed, results):
+        try:
+            if item["op"] == "create":
+                column = target_column(item["column_id"])
+                column.active_card_count += 1
+                card = _CardState(
+                    id=None,
+                    public_id=uuid.uuid4(),
+                    title=item["title"],
+                    description=item["description"],
+                    column_id=column.id,
+                    position=column.append(),
+                )
+                new_cards.append(card)
+                result["card"] = card
+                continue
+
+            card = active_card(item["card_id"])
+            source = columns[card.column_id]
+            if item["op"] == "move":
+                if item["column_id"] == card.column_id:
+                    card.position = source.append()
+                else:
+                    column = target_column(item["column_id"])
+                    column.active_card_count += 1
+                    source.active_card_count -= 1
+                    source.changed = True
+                    card.column_id = column.id
+                    card.position = column.append()
+            else:
+                card.archived = True
+                source.active_card_count -= 1
+                source.changed = True
+            card.changed = True
+            result["card"] = card
+        except AppError as error:
+            result.update(_error_result(result["index"], item["op"], error))
+    _raise_if_failed(results)
+
+    if new_cards:
+        db.session.execute(
+            insert(Card).values(
+                [
+                    {
+                        "public_id": card.public_id,
+                        "board_id": board_id,
+                        "column_id": card.column_id,
+                        "title": card.title,
+                        "description": card.description,
+                        "position": card.position,
+                        "revision": revision,
+                    }
+                    for card in new_cards
+                ]
+            )
+        )
+
+    changed_cards = [card for card in cards.values() if card.changed]
+    if changed_cards:
+        wanted = values(
+            sql_column("card_id", Integer),
+            sql_column("column_id", Integer),
+            sql_column("position", Integer),
+            sql_column("archived", Boolean),
+            name="wanted",
+        ).data(
+            [
+                (card.id, card.column_id, card.position, card.archived)
+                for card in changed_cards
+            ]
+        )
+        actor_id = g.user.id if getattr(g, "user", None) else None
+        db.session.execute(
+            db.update(Card)
+            .where(Card.id == wanted.c.card_id)
+            .values(
+                column_id=wanted.c.column_id,
+                position=wanted.c.position,
+                revision=revision,
+                deleted_at=case((wanted.c.archived, func.now()), else_=None),
+                deleted_by_id=case((wanted.c.archived, actor_id), else_=None),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    changed_columns = [column for column in columns.values() if column.changed]
+    if changed_columns:
+        wanted = values(
+            sql_column("column_id", Integer),
+            sql_column("active_card_count", Integer),
+            sql_column("next_card_position", Integer),
+            name="wanted",
+        ).data(
+            [
+                (column.id, column.active_card_count, column.next_card_position)
+                for column in changed_columns
+            ]
+        )
+        db.session.execute(
+            db.update(BoardColumn)
+            .where(BoardColumn.id == wanted.c.column_id)
+            .values(
+                active_card_count=wanted.c.active_card_count,
+                next_card_position=wanted.c.next_card_position,
+                revision=revision,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    db.session.commit()
+    for result in results:
+        result["card"] = _card_payload(result["card"])
+    return results
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import uuid
+from typing import Sequence
+
+from sqlalchemy import Integer, column, func, null, text, values
+
+from ...domain.ordering import POSITION_GAP
+from ...extensions import db
+from ...persistence.models import BoardColumn, Card
+
+
+def defer_card_position_check() -> None:
+    """
+    Check uq_cards_column_position at commit instead of per row, so a single
+    UPDATE can swap cards through each other's positions.
+    """
+    db.session.execute(text("SET CONSTRAINTS uq_cards_column_position DEFERRED"))
+
+
+def respace_column_cards(
+    column_id: int,
+    *,
+    revision: int,
+    leading_public_ids: Sequence[uuid.UUID] = (),
+) -> list:
+    """
+    Renumber every card in a column POSITION_GAP apart in one statement.
+    - Cards in `leading_public_ids` come first, in that order
+    - Every other card, archived ones included, follows in its current order
+    Returns one row per card (public_id, column_id, position, deleted_at and
+    the card's index in `leading_public_ids`, or None), ordered by position.
+    The column's append high-water mark is raised past the new last position.
+    """
+    order_by = [Card.position.asc(), Card.id.asc()]
+    requested = null()
+    ranked = db.select(Card.id.label("card_id")).where(Card.column_id == column_id)
+    if leading_public_ids:
+        wanted = values(
+            column("public_id", Card.public_id.type),
+            column("ordinal", Integer),
+            name="wanted",
+        ).data(
+            [(public_id, index) for index, public_id in enumerate(leading_public_ids)]
+        )
+        ranked = ranked.outerjoin(wanted, wanted.c.public_id == Card.public_id)
+        requested = wanted.c.ordinal
+        order_by = [wanted.c.ordinal.is_(None), wanted.c.ordinal.asc(), *order_by]
+    ranked = ranked.add_columns(
+        requested.label("requested"),
+        func.row_number().over(order_by=order_by).label("rank"),
+    ).subquery()
+
+    defer_card_position_check()
+    rows = db.session.execute(
+        db.update(Card)
+        .where(Card.id == ranked.c.card_id)
+        .values(position=ranked.c.rank * POSITION_GAP, revision=revision)
+        .returning(
+            Card.public_id,
+            Card.column_id,
+            Card.position,
+            Card.deleted_at,
+            ranked.c.requested,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+    if rows:
+        db.session.execute(
+            db.update(BoardColumn)
+            .where(BoardColumn.id == column_id)
+            .values(
+                next_card_position=func.greatest(
+                    BoardColumn.next_card_position,
+                    (len(rows) + 1) * POSITION_GAP,
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+    return sorted(rows, key=lambda row: row.position)
@@ -2,10 +2,12 @@ from flask import jsonify, request
 
 from ...domain.decorators import require_permission
 from ...domain.security.permissions import Permission
-from . import card_bp
+from . import card_batch_bp, card_bp
+from .batch import apply_card_batch
 from .services import (
     create_card,
     hard_delete_card,
+    move_card,
     restore_card,
     soft_delete_card,
     update_card,
@@ -68,6 +70,37 @@ def update_card_route(
     )
 
 
+@card_bp.post("/<string:card_public_id>/move")
+@require_permission(Permission.EDIT_CARD)
+def move_card_route(
+    room_public_id: str,
+    board_public_id: str,
+    column_id: int,
+    card_public_id: str,
+):
+    data = request.get_json(silent=True) or {}
+    card, rebalanced = move_card(
+        room_public_id=room_public_id,
+        board_public_id=board_public_id,
+        card_public_id=card_public_id,
+        column_id=data.get("column_id"),
+        before_card_id=data.get("before_id"),
+        after_card_id=data.get("after_id"),
+    )
+    return jsonify(
+        {
+            "card": {
+                "id": str(card.public_id),
+                "title": card.title,
+                "description": card.description,
+                "position": card.position,
+                "column_id": card.column_id,
+            },
+            "rebalanced": rebalanced,
+        }
+    )
+
+
 @card_bp.delete("/<string:card_public_id>")
 @require_permission(Permission.EDIT_CARD)
 def delete_card_route(
@@ -115,3 +148,16 @@ def hard_delete_card_route(
         card_public_id=card_public_id,
     )
     return jsonify({"message": "Card permanently deleted."}), 200
+
+
+@card_batch_bp.post("/batch")
+@require_permission(Permission.CREATE_CARD)
+@require_permission(Permission.EDIT_CARD)
+def card_batch_route(room_public_id: str, board_public_id: str):
+    data = request.get_json(silent=True) or {}
+    results = apply_card_batch(
+        room_public_id=room_public_id,
+        board_public_id=board_public_id,
+        operations=data.get("operations"),
+    )
+    return jsonify({"results": results}), 200
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 from flask import g, current_app
-from sqlalchemy import func
+from sqlalchemy import or_
+from sqlalchemy.orm import aliased
 
-from ...domain.exceptions import ConflictError, NotFoundError
+from ...domain.exceptions import ConflictError, NotFoundError, ValidationError
+from ...domain.ordering import POSITION_GAP, position_between
+from ...domain.selectors import resolve_room
 from ...domain.validators import (
     validate_display_text,
     validate_int,
     validate_multiline_text,
 )
 from ...extensions import db
-from ...persistence.models import Board, BoardColumn, Card, Room
+from ...persistence.models import Board, BoardColumn, Card
+from ..boards.revisions import bump_board_revision
+from .positions import respace_column_cards
 
 
 def create_card(
@@ -29,44 +34,27 @@ def create_card(
     column_identifier = validate_int(column_id, "column_id", required=True, min_value=1)
     assert column_identifier is not None
 
-    board_stmt = (
-        db.select(Board)
-        .join(Room, Room.id == Board.room_id)
-        .where(
-            Board.public_id == board_public_id,
-            Board.deleted_at.is_(None),
-            Room.public_id == room_public_id,
-        )
+    room = resolve_room(room_public_id)
+    board_stmt = db.select(Board.id).where(
+        Board.public_id == board_public_id,
+        Board.deleted_at.is_(None),
+        Board.room_id == room.id,
     )
-    board = db.session.execute(board_stmt).scalar_one_or_none()
-    if board is None:
+    board_id = db.session.execute(board_stmt).scalar_one_or_none()
+    if board_id is None:
         raise NotFoundError(f"Board '{board_public_id}' not found.")
 
-    column_stmt = (
-        db.select(BoardColumn)
-        .where(
-            BoardColumn.id == column_identifier,
-            BoardColumn.board_id == board.id,
-            BoardColumn.deleted_at.is_(None),
-        )
-        .with_for_update()
+    revision = bump_board_revision(board_id)
+    next_position = _claim_card_slot(
+        board_id=board_id, column_id=column_identifier, revision=revision
     )
-    column = db.session.execute(column_stmt).scalar_one_or_none()
-    if column is None:
-        raise NotFoundError(
-            f"Column '{column_identifier}' was not found on this board."
-        )
-
-    _assert_wip_capacity(column)
-
-    next_position = _next_card_position(column.id)
-    # current_app.logger.info(f"create: {str(next_position)}")
     card = Card(
-        board_id=board.id,
-        column_id=column.id,
+        board_id=board_id,
+        column_id=column_identifier,
         title=cleaned_title,
         description=cleaned_description,
         position=next_position,
+        revision=revision,
     )
     db.session.add(card)
     db.session.commit()
@@ -82,12 +70,12 @@ def update_card(
     description: str | None = None,
     target_column_id: int | None = None,
 ) -> Card:
+    room = resolve_room(room_public_id)
     card = db.session.execute(
         db.select(Card)
         .join(Board, Board.id == Card.board_id)
-        .join(Room, Room.id == Board.room_id)
         .where(
-            Room.public_id == room_public_id,
+            Board.room_id == room.id,
             Board.public_id == board_public_id,
             Card.public_id == card_public_id,
             Card.deleted_at.is_(None),
@@ -103,40 +91,130 @@ def update_card(
             description, "description", required=False, max_len=4000
         )
 
+    revision = bump_board_revision(card.board_id, touched=[card])
     if target_column_id is not None and target_column_id != card.column_id:
-        column = db.session.execute(
-            db.select(BoardColumn)
-            .join(Board, Board.id == BoardColumn.board_id)
-            .where(
-                BoardColumn.id == target_column_id,
-                BoardColumn.board_id == card.board_id,
-                BoardColumn.deleted_at.is_(None),
-            )
-            .with_for_update()
-        ).scalar_one_or_none()
-        if column is None:
-            raise NotFoundError(
-                f"Column '{target_column_id}' was not found on this board."
-            )
-        _assert_wip_capacity(column, exclude_card_id=card.id)
-        next_position = _next_card_position(column.id, exclude_card_id=card.id)
-        # current_app.logger.info(f"update: {str(next_position)}")
-        card.position = next_position
-        card.column_id = column.id
+        card.position = _transfer_card_slot(
+            board_id=card.board_id,
+            from_column_id=card.column_id,
+            to_column_id=target_column_id,
+            revision=revision,
+        )
+        card.column_id = target_column_id
 
     db.session.commit()
     return card
 
 
+def move_card(
+    *,
+    room_public_id: str,
+    board_public_id: str,
+    card_public_id: str,
+    column_id: int | None = None,
+    before_card_id: str | None = None,
+    after_card_id: str | None = None,
+) -> tuple[Card, bool]:
+    """
+    Place a card directly before or after another card, or at the end of
+    `column_id` when no anchor is given. Only the moved card is rewritten unless
+    its neighbours have run out of room, in which case the target column is
+    rebalanced first. Returns the card and whether a rebalance happened.
+    """
+    if before_card_id is not None and after_card_id is not None:
+        raise ValidationError("Provide either before_id or after_id, not both.")
+    anchor_id = before_card_id if before_card_id is not None else after_card_id
+    target_column_id = validate_int(
+        column_id, "column_id", required=anchor_id is None, min_value=1
+    )
+
+    room = resolve_room(room_public_id)
+    card = db.session.execute(
+        db.select(Card)
+        .join(Board, Board.id == Card.board_id)
+        .where(
+            Board.room_id == room.id,
+            Board.public_id == board_public_id,
+            Card.public_id == card_public_id,
+            Card.deleted_at.is_(None),
+        )
+    ).scalar_one_or_none()
+    if card is None:
+        raise NotFoundError(f"Card '{card_public_id}' not found.")
+
+    anchor = None
+    if anchor_id is not None:
+        if str(anchor_id) == str(card.public_id):
+            raise ValidationError("A card cannot be moved relative to itself.")
+        anchor = db.session.execute(
+            db.select(Card.column_id, Card.position).where(
+                Card.board_id == card.board_id,
+                Card.public_id == anchor_id,
+                Card.deleted_at.is_(None),
+            )
+        ).one_or_none()
+        if anchor is None:
+            raise NotFoundError(f"Card '{anchor_id}' not found.")
+        if target_column_id is not None and target_column_id != anchor.column_id:
+            raise ValidationError("column_id does not match the anchor card's column.")
+        target_column_id = anchor.column_id
+
+    revision = bump_board_revision(card.board_id, touched=[card])
+    appended_at = None
+    if target_column_id != card.column_id:
+        # Only a column change can break the WIP limit, so only then are the
+        # column rows written.
+        appended_at = _transfer_card_slot(
+            board_id=card.board_id,
+            from_column_id=card.column_id,
+            to_column_id=target_column_id,
+            revision=revision,
+        )
+
+    def slot() -> int | None:
+        lower, upper = _neighbour_positions(
+            target_column_id,
+            anchor_id,
+            before=before_card_id is not None,
+            exclude_card_id=card.id,
+        )
+        if upper is None:
+            # After the last card is an append: take the slot from the
+            # column's high-water mark so later appends cannot land on it.
+            if appended_at is not None:
+                return appended_at
+            return _reserve_card_position(target_column_id)
+        return position_between(lower, upper)
+
+    rebalanced = False
+    if anchor is None:
+        position = appended_at
+        if position is None:
+            position = _reserve_card_position(target_column_id)
+    else:
+        position = slot()
+        rebalanced = position is None
+        if rebalanced:
+            respace_column_cards(target_column_id, revision=revision)
+            # The renumbering bypasses the session, so the loaded position is
+            # stale; expire it so the new slot is written even if it matches.
+            db.session.expire(card, ["position"])
+            position = slot()
+
+    card.column_id = target_column_id
+    card.position = position
+    db.session.commit()
+    return card, rebalanced
+
+
 def soft_delete_card(
     *, room_public_id: str, board_public_id: str, card_public_id: str
 ) -> None:
+    room = resolve_room(room_public_id)
     card = db.session.execute(
         db.select(Card)
         .join(Board, Board.id == Card.board_id)
-        .join(Room, Room.id == Board.room_id)
         .where(
-            Room.public_id == room_public_id,
+            Board.room_id == room.id,
             Board.public_id == board_public_id,
             Card.public_id == card_public_id,
             Card.deleted_at.is_(None),
@@ -147,18 +225,20 @@ def soft_delete_card(
 
     actor_id = getattr(g, "user", None).id if getattr(g, "user", None) else None
     card.soft_delete(actor_id)
+    revision = bump_board_revision(card.board_id, touched=[card])
+    _release_card_slot(column_id=card.column_id, revision=revision)
     db.session.commit()
 
 
 def restore_card(
     *, room_public_id: str, board_public_id: str, card_public_id: str
 ) -> Card:
+    room = resolve_room(room_public_id)
     card = db.session.execute(
         db.select(Card)
         .join(Board, Board.id == Card.board_id)
-        .join(Room, Room.id == Board.room_id)
         .where(
-            Room.public_id == room_public_id,
+            Board.room_id == room.id,
             Board.public_id == board_public_id,
             Card.public_id == card_public_id,
             Card.deleted_at.is_not(None),
@@ -167,36 +247,31 @@ def restore_card(
     if card is None:
         raise NotFoundError(f"Archived card '{card_public_id}' was not found.")
 
-    column = db.session.execute(
-        db.select(BoardColumn)
-        .where(BoardColumn.id == card.column_id, BoardColumn.deleted_at.is_(None))
-        .with_for_update()
+    # Back into its own column if that is still active, else the first one.
+    column_id = db.session.execute(
+        db.select(BoardColumn.id)
+        .where(
+            BoardColumn.board_id == card.board_id,
+            BoardColumn.deleted_at.is_(None),
+        )
+        .order_by(
+            (BoardColumn.id != card.column_id).asc(),
+            BoardColumn.position.asc(),
+            BoardColumn.id.asc(),
+        )
+        .limit(1)
     ).scalar_one_or_none()
-    if column is None:
-        column = (
-            db.session.execute(
-                db.select(BoardColumn)
-                .where(
-                    BoardColumn.board_id == card.board_id,
-                    BoardColumn.deleted_at.is_(None),
-                )
-                .order_by(BoardColumn.position.asc(), BoardColumn.id.asc())
-                .with_for_update()
-            )
-            .scalars()
-            .first()
+    if column_id is None:
+        raise ConflictError(
+            "Cannot restore card because this board has no active columns. Create a column first."
         )
-        if column is None:
-            raise ConflictError(
-                "Cannot restore card because this board has no active columns. Create a column first."
-            )
-        card.column_id = column.id
-    _assert_wip_capacity(column)
 
+    revision = bump_board_revision(card.board_id, touched=[card])
     card.restore()
-    next_position = _next_card_position(column.id)
-    # current_app.logger.info(f"restore: {str(next_position)}")
-    card.position = next_position
+    card.position = _claim_card_slot(
+        board_id=card.board_id, column_id=column_id, revision=revision
+    )
+    card.column_id = column_id
     db.session.commit()
     return card
 
@@ -204,12 +279,12 @@ def restore_card(
 def hard_delete_card(
     *, room_public_id: str, board_public_id: str, card_public_id: str
 ) -> None:
+    room = resolve_room(room_public_id)
     card = db.session.execute(
         db.select(Card)
         .join(Board, Board.id == Card.board_id)
-        .join(Room, Room.id == Board.room_id)
         .where(
-            Room.public_id == room_public_id,
+            Board.room_id == room.id,
             Board.public_id == board_public_id,
             Card.public_id == card_public_id,
             Card.deleted_at.is_not(None),
@@ -218,33 +293,127 @@ def hard_delete_card(
     if card is None:
         raise NotFoundError(f"Archived card '{card_public_id}' was not found.")
 
+    bump_board_revision(card.board_id, purged=True)
     db.session.delete(card)
     db.session.commit()
 
 
-def _next_card_position(column_id: int, *, exclude_card_id: int | None = None) -> int:
-    stmt = db.select(func.coalesce(func.max(Card.position), -1)).where(
-        Card.column_id == column_id
-    )
-    if exclude_card_id is not None:
-        stmt = stmt.where(Card.id != exclude_card_id)
-    highest = db.session.execute(stmt).scalar_one()
-    return highest + 1
+def _reserve_card_position(column_id: int) -> int:
+    """
+    Take the next append position from the column's high-water mark. Appends
+    serialize on the column row rather than scanning for MAX(position).
+    """
+    return db.session.execute(
+        db.update(BoardColumn)
+        .where(BoardColumn.id == column_id)
+        .values(next_card_position=BoardColumn.next_card_position + POSITION_GAP)
+        .returning(BoardColumn.next_card_position - POSITION_GAP)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
 
-def _assert_wip_capacity(
-    column: BoardColumn, *, exclude_card_id: int | None = None
-) -> None:
-    if column.wip_limit is None:
-        return
-    stmt = (
-        db.select(func.count())
-        .select_from(Card)
-        .where(Card.column_id == column.id, Card.deleted_at.is_(None))
+
+def _neighbour_positions(
+    column_id: int, anchor_public_id: str, *, before: bool, exclude_card_id: int
+) -> tuple[int | None, int | None]:
+    """
+    Positions bounding the slot directly before or after the anchor card.
+    Archived cards keep their positions in the column, so they count as
+    neighbours too.
+    """
+    anchor = aliased(Card)
+    anchor_position = (
+        db.select(anchor.position)
+        .where(anchor.public_id == anchor_public_id)
+        .scalar_subquery()
     )
-    if exclude_card_id is not None:
-        stmt = stmt.where(Card.id != exclude_card_id)
-    current = db.session.execute(stmt).scalar_one()
-    if current >= column.wip_limit:
-        raise ConflictError(
-            f"WIP limit reached for column '{column.title}'. Move or complete an existing card first."
+    siblings = db.select(Card.position).where(
+        Card.column_id == column_id, Card.id != exclude_card_id
+    )
+    if before:
+        stmt = db.select(
+            siblings.where(Card.position < anchor_position)
+            .order_by(Card.position.desc())
+            .limit(1)
+            .scalar_subquery(),
+            anchor_position,
+        )
+    else:
+        stmt = db.select(
+            anchor_position,
+            siblings.where(Card.position > anchor_position)
+            .order_by(Card.position.asc())
+            .limit(1)
+            .scalar_subquery(),
         )
+    lower, upper = db.session.execute(stmt).one()
+    return lower, upper
+
+
+def _claim_card_slot(*, board_id: int, column_id: int, revision: int) -> int:
+    """
+    Count one more active card in a column and return its append position.
+    The same UPDATE checks that the column is active and below its WIP limit,
+    so concurrent writers serialize on the column row instead of counting
+    cards.
+    """
+    claimed = db.session.execute(
+        db.update(BoardColumn)
+        .where(
+            BoardColumn.id == column_id,
+            BoardColumn.board_id == board_id,
+            BoardColumn.deleted_at.is_(None),
+            or_(
+                BoardColumn.wip_limit.is_(None),
+                BoardColumn.active_card_count < BoardColumn.wip_limit,
+            ),
+        )
+        .values(
+            active_card_count=BoardColumn.active_card_count + 1,
+            next_card_position=BoardColumn.next_card_position + POSITION_GAP,
+            revision=revision,
+        )
+        .returning(BoardColumn.next_card_position - POSITION_GAP)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    if claimed is not None:
+        return claimed
+
+    title = db.session.execute(
+        db.select(BoardColumn.title).where(
+            BoardColumn.id == column_id,
+            BoardColumn.board_id == board_id,
+            BoardColumn.deleted_at.is_(None),
+        )
+    ).scalar_one_or_none()
+    if title is None:
+        raise NotFoundError(f"Column '{column_id}' was not found on this board.")
+    raise ConflictError(
+        f"WIP limit reached for column '{title}'. Move or complete an existing card first."
+    )
+
+
+def _release_card_slot(*, column_id: int, revision: int) -> None:
+    db.session.execute(
+        db.update(BoardColumn)
+        .where(BoardColumn.id == column_id)
+        .values(active_card_count=BoardColumn.active_card_count - 1, revision=revision)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _transfer_card_slot(
+    *, board_id: int, from_column_id: int, to_column_id: int, revision: int
+) -> int:
+    """
+    Move an active card's slot between columns and return its append position
+    in the target. Column rows are always written in id order so two cards
+    crossing in opposite directions cannot deadlock.
+    """
+    if from_column_id < to_column_id:
+        _release_card_slot(column_id=from_column_id, revision=revision)
+    position = _claim_card_slot(
+        board_id=board_id, column_id=to_column_id, revision=revision
+    )
+    if from_column_id > to_column_id:
+        _release_card_slot(column_id=from_column_id, revision=revision)
+    return position
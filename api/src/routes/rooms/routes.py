@@ -1,19 +1,24 @@
-from flask import jsonify, request
+from flask import g, jsonify, request
 
-from ...domain.decorators import require_permission
+from ...domain.decorators import conditional_get, require_permission
+from ...domain.exceptions import ValidationError
 from ...domain.security.permissions import Permission
 from ...domain.validators import validate_str, validate_user_logged_in
+from ..boards.templates import BOARD_TEMPLATES, DEFAULT_BOARD_TEMPLATE
 from . import room_bp
 from .services import (
     create_room,
     create_room_invite,
     delete_room,
+    get_room_bootstrap,
+    get_rooms_version,
     leave_room,
     list_room_invites,
     list_room_members,
     revoke_room_invite,
     update_room_member_role,
     view_room,
+    view_room_summaries,
     view_rooms,
 )
 
@@ -77,12 +82,31 @@ def create_room_route():
     data = request.get_json(silent=True) or {}
     field = "name"
     name = validate_str(data.get(field), field, min_len=3, max_len=30)
-    new_room = create_room(creator_user_id=id, name=name)
+    new_room = create_room(creator_user_id=id, name=name, template=data.get("template"))
     return jsonify({"public_id": new_room.public_id, "name": new_room.name}), 201
 
 
+@room_bp.get("/board-templates")
+def list_board_templates_route():
+    validate_user_logged_in()
+    return jsonify(
+        {
+            "default": DEFAULT_BOARD_TEMPLATE,
+            "templates": [
+                {
+                    "key": template.key,
+                    "board_name": template.board_name,
+                    "columns": [column.title for column in template.columns],
+                }
+                for template in BOARD_TEMPLATES.values()
+            ],
+        }
+    )
+
+
 @room_bp.get("/rooms/<string:room_public_id>")
 @require_permission(Permission.VIEW_ROOM)
+@conditional_get(get_rooms_version)
 def view_room_by_public_id(room_public_id: str):
     user_id = validate_user_logged_in()
     room = view_room(room_public_id)
@@ -91,9 +115,52 @@ def view_room_by_public_id(room_public_id: str):
     return jsonify(_serialize_room(room, current_user_id=user_id)), 200
 
 
+@room_bp.get("/rooms/<string:room_public_id>/bootstrap")
+@require_permission(Permission.VIEW_ROOM)
+def room_bootstrap_route(room_public_id: str):
+    user_id = validate_user_logged_in()
+    room, snapshot = get_room_bootstrap(
+        room_public_id=room_public_id, board_public_id=request.args.get("board")
+    )
+    return (
+        jsonify(
+            {
+                "room": _serialize_room(room, current_user_id=user_id),
+                "snapshot": snapshot,
+            }
+        ),
+        200,
+    )
+
+
+def _room_list_version() -> tuple:
+    # The full and summary views read the same rows but differ in body, so
+    # each gets its own ETag.
+    return (request.args.get("view", "full"), *get_rooms_version())
+
+
 @room_bp.get("/rooms")
+@conditional_get(_room_list_version)
 def view_rooms_route():
     user_id = validate_user_logged_in()
+    view = request.args.get("view", "full")
+    if view not in ("full", "summary"):
+        raise ValidationError("'view' must be one of: full, summary.")
+    if view == "summary":
+        payload = [
+            {
+                "public_id": row.public_id,
+                "name": row.name,
+                "member_count": row.member_count,
+                "board_count": row.board_count,
+                "membership": {
+                    "role": row.role.value,
+                    "user_public_id": str(g.user.public_id),
+                },
+            }
+            for row in view_room_summaries(user_id)
+        ]
+        return jsonify({"rooms": payload}), 200
     rooms = view_rooms(user_id)
     payload = [_serialize_room(room, current_user_id=user_id) for room in rooms]
     return jsonify({"rooms": payload}), 200
@@ -109,7 +176,12 @@ def delete_room_route(room_public_id: str):
 @room_bp.get("/rooms/<string:room_public_id>/members")
 @require_permission(Permission.VIEW_ROOM)
 def list_members_route(room_public_id: str):
-    members = list_room_members(room_public_id)
+    members, next_cursor = list_room_members(
+        room_public_id,
+        cursor=request.args.get("cursor"),
+        limit=request.args.get("limit", type=int),
+        search=request.args.get("q") or None,
+    )
     payload = []
     for member, user in members:
         payload.append(
@@ -121,7 +193,7 @@ def list_members_route(room_public_id: str):
                 "role": member.role.value,
             }
         )
-    return jsonify({"members": payload}), 200
+    return jsonify({"members": payload, "next_cursor": next_cursor}), 200
 
 
 @room_bp.patch("/rooms/<string:room_public_id>/members/<string:member_public_id>")
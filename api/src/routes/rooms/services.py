@@ -1,28 +1,34 @@
 from __future__ import annotations
 
+import base64
 import secrets
 from datetime import datetime, timedelta, timezone
 
-from flask import g
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from flask import current_app, g
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.orm import aliased, joinedload, selectinload
 
 from ...domain.exceptions import ForbiddenError, NotFoundError, ValidationError
 from ...domain.security.permissions import RoleType, RoomType
-from ...domain.validators import validate_display_text, validate_in_enum, validate_int
+from ...domain.selectors import invalidate_room_roles, resolve_room
+from ...domain.validators import (
+    validate_display_text,
+    validate_in_enum,
+    validate_int,
+    validate_user_logged_in,
+)
 from ...extensions import db
 from ...persistence.models import (
     Board,
-    BoardColumn,
-    Card,
     Invite,
     InviteRedemption,
     Room,
     RoomMember,
     User,
 )
+from ..boards.snapshot import load_board_snapshot
+from ..boards.templates import apply_board_template, resolve_board_template
 
-DEFAULT_BOARD_NAME = "Adventure Roadmap"
 DEFAULT_INVITE_VALID_FOR_HOURS = 24 * 7
 ALLOWED_INVITE_ROLES = {RoleType.VIEWER, RoleType.MEMBER}
 
@@ -34,78 +40,14 @@ ROLE_PRIORITY: dict[RoleType, int] = {
 }
 
 
-def _seed_default_board(room: Room) -> None:
-    board = Board(room_id=room.id, name=DEFAULT_BOARD_NAME)
-    db.session.add(board)
-    db.session.flush()
-
-    column_specs = [
-        {
-            "title": "Quest Backlog · Incoming Ideas",
-            "wip_limit": 6,
-            "cards": [
-                (
-                    "Capture Guild Requests",
-                    "List ideas, bug reports, or enhancements as soon as they appear so the guild never forgets them.",
-                ),
-                (
-                    "Prioritize This Week's Adventures",
-                    "Choose which quests move forward next and drag them into Active Quests when you're ready to work.",
-                ),
-            ],
-        },
-        {
-            "title": "Active Quests · In Progress",
-            "wip_limit": 4,
-            "cards": [
-                (
-                    "Craft the Perfect Story Card",
-                    "Use the description to explain the why, who, and victory condition for the quest you're tackling.",
-                ),
-                (
-                    "Co-op Sync",
-                    "Leave notes or links teammates will need while you collaborate on this adventure.",
-                ),
-            ],
-        },
-        {
-            "title": "Hall of Legends · Completed",
-            "wip_limit": None,
-            "cards": [
-                (
-                    "Celebrate a Win",
-                    "Move quests here when you finish them and jot down what went well so future heroes learn from it.",
-                )
-            ],
-        },
-    ]
-
-    for column_index, spec in enumerate(column_specs):
-        column = BoardColumn(
-            board_id=board.id,
-            title=spec["title"],
-            position=column_index,
-            wip_limit=spec["wip_limit"],
-            column_type="standard",
-        )
-        db.session.add(column)
-        db.session.flush()
-
-        for card_index, (title, description) in enumerate(spec["cards"]):
-            db.session.add(
-                Card(
-                    board_id=board.id,
-                    column_id=column.id,
-                    title=title,
-                    description=description,
-                    position=card_index,
-                )
-            )
-
-
 def create_room(
-    *, creator_user_id: int, name: str, room_type: RoomType = "Normal"
+    *,
+    creator_user_id: int,
+    name: str,
+    room_type: RoomType = "Normal",
+    template: str | None = None,
 ) -> Room:
+    board_template = resolve_board_template(template)
     room = Room(
         owner_id=creator_user_id,
         name=name.strip(),
@@ -120,23 +62,58 @@ def create_room(
             role=RoleType.OWNER,
         )
     )
-    _seed_default_board(room)
+    board = Board(room_id=room.id, name=board_template.board_name)
+    db.session.add(board)
+    apply_board_template(board, board_template)
     db.session.commit()
     return room
 
 
 def view_room(room_public_id: str) -> Room | None:
+    resolved = resolve_room(room_public_id)
     stmt = (
         select(Room)
         .options(
             selectinload(Room.boards),
             selectinload(Room.members).selectinload(RoomMember.user),
         )
-        .where(Room.public_id == room_public_id)
+        .where(Room.id == resolved.id)
     )
     return db.session.execute(stmt).scalars().unique().one_or_none()
 
 
+def get_room_bootstrap(
+    *, room_public_id: str, board_public_id: str | None = None
+) -> tuple[Room, dict | None]:
+    """
+    Everything the board page needs to open a room: the room with its active
+    boards and members, plus the snapshot of `board_public_id`, or of the
+    first board when that one is missing or archived. Membership comes from
+    the request's resolve_room(), so the whole response costs four queries.
+    """
+    resolved = resolve_room(room_public_id)
+    room = db.session.execute(
+        select(Room)
+        .options(
+            selectinload(Room.boards.and_(Board.deleted_at.is_(None))),
+            selectinload(Room.members).joinedload(RoomMember.user),
+        )
+        .where(Room.id == resolved.id)
+    ).scalar_one()
+
+    board_ids = [str(board.public_id) for board in room.boards]
+    if not board_ids:
+        return room, None
+    requested = (board_public_id or "").strip().lower()
+    active_board_id = requested if requested in board_ids else board_ids[0]
+    snapshot = load_board_snapshot(
+        room_id=room.id,
+        room_public_id=room.public_id,
+        board_public_id=active_board_id,
+    )
+    return room, snapshot
+
+
 def view_rooms(user_id: int) -> list[Room]:
     stmt = (
         select(Room)
@@ -151,20 +128,89 @@ def view_rooms(user_id: int) -> list[Room]:
     return rooms
 
 
+def view_room_summaries(user_id: int) -> list:
+    """
+    The caller's rooms without members or boards: member and active board
+    counts come from correlated COUNT subqueries and the caller's role from
+    the membership row the rooms are found through, so the cost stays flat
+    however large the rooms are.
+    """
+    member = aliased(RoomMember)
+    member_count = (
+        select(func.count())
+        .where(member.room_id == Room.id)
+        .correlate(Room)
+        .scalar_subquery()
+    )
+    board_count = (
+        select(func.count())
+        .where(Board.room_id == Room.id, Board.deleted_at.is_(None))
+        .correlate(Room)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(
+            Room.public_id,
+            Room.name,
+            RoomMember.role,
+            member_count.label("member_count"),
+            board_count.label("board_count"),
+        )
+        .join(RoomMember, RoomMember.room_id == Room.id)
+        .where(RoomMember.user_id == user_id)
+        .order_by(Room.id.asc())
+    )
+    return db.session.execute(stmt).all()
+
+
+def get_rooms_version(*, room_public_id: str | None = None) -> tuple:
+    """
+    Cheap fingerprint of what _serialize_room reads for the caller's rooms (or
+    one room): newest updated_at and row counts of the rooms, their
+    memberships, boards and member users.
+    """
+    user_id = validate_user_logged_in()
+    if room_public_id is None:
+        room_ids = select(RoomMember.room_id).where(RoomMember.user_id == user_id)
+    else:
+        room_ids = [resolve_room(room_public_id).id]
+    member_ids = select(RoomMember.user_id).where(RoomMember.room_id.in_(room_ids))
+
+    def aggregate(expression, model, *criteria):
+        return select(expression).select_from(model).where(*criteria).scalar_subquery()
+
+    row = db.session.execute(
+        select(
+            aggregate(func.max(Room.updated_at), Room, Room.id.in_(room_ids)),
+            aggregate(
+                func.max(RoomMember.updated_at),
+                RoomMember,
+                RoomMember.room_id.in_(room_ids),
+            ),
+            aggregate(func.count(), RoomMember, RoomMember.room_id.in_(room_ids)),
+            aggregate(func.max(Board.updated_at), Board, Board.room_id.in_(room_ids)),
+            aggregate(func.count(), Board, Board.room_id.in_(room_ids)),
+            aggregate(func.max(User.updated_at), User, User.id.in_(member_ids)),
+        )
+    ).one()
+    return (user_id, room_public_id, *row)
+
+
 def leave_room(*, room_public_id: str, user_id: int) -> None:
-    room = _get_room_by_public_id(room_public_id)
-    membership = db.session.execute(
-        select(RoomMember).where(
+    room = resolve_room(room_public_id)
+    if room.owner_id == user_id:
+        raise ForbiddenError("Room owners cannot leave their own room.")
+    result = db.session.execute(
+        delete(RoomMember).where(
             RoomMember.room_id == room.id,
             RoomMember.user_id == user_id,
         )
-    ).scalar_one_or_none()
-    if membership is None:
+    )
+    if result.rowcount == 0:
+        db.session.rollback()
         raise ForbiddenError("You are not a member of this room.")
-    if room.owner_id == user_id:
-        raise ForbiddenError("Room owners cannot leave their own room.")
-    db.session.delete(membership)
     db.session.commit()
+    invalidate_room_roles(room_public_id, user_id)
 
 
 def delete_room(*, room_public_id: str, actor_user_id: int) -> None:
@@ -177,15 +223,7 @@ def delete_room(*, room_public_id: str, actor_user_id: int) -> None:
         raise ForbiddenError("Only the room owner can delete this room.")
     db.session.delete(room)
     db.session.commit()
-
-
-def _get_room_by_public_id(room_public_id: str) -> Room:
-    room = db.session.execute(
-        select(Room).where(Room.public_id == room_public_id)
-    ).scalar_one_or_none()
-    if room is None:
-        raise NotFoundError(f"Room '{room_public_id}' not found.")
-    return room
+    invalidate_room_roles(room_public_id)
 
 
 def _generate_invite_code() -> str:
@@ -203,16 +241,86 @@ def _normalize_name(value: str | None) -> str:
     return " ".join((value or "").split()).strip()
 
 
-def list_room_members(room_public_id: str) -> list[tuple[RoomMember, User]]:
+def _member_sort_name():
+    """The key members are ordered and searched by; matches ix_users_sort_name."""
+    return func.lower(func.coalesce(User.display_name, User.name))
+
+
+def _encode_member_cursor(
+    role: RoleType, display_name_missing: bool, user_id: int, sort_name: str
+) -> str:
+    # The name goes last since it is the only part that may contain "|".
+    raw = f"{role.value}|{int(display_name_missing)}|{user_id}|{sort_name}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_member_cursor(cursor: str) -> tuple[RoleType, bool, int, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        role, display_name_missing, user_id, sort_name = (
+            base64.urlsafe_b64decode(padded.encode()).decode().split("|", 3)
+        )
+        return RoleType(role), bool(int(display_name_missing)), int(user_id), sort_name
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationError("'cursor' is not a valid members cursor.")
+
+
+def list_room_members(
+    room_public_id: str,
+    *,
+    cursor: str | None = None,
+    limit: int | None = None,
+    search: str | None = None,
+) -> tuple[list[tuple[RoomMember, User]], str | None]:
+    """
+    One page of a room's members ordered by role priority, then by display
+    name (members without one last), case-insensitively. `search` keeps
+    members whose display name, or name when they have none, starts with it.
+    Pass the returned cursor back for the next page; it is None on the last
+    page.
+    """
+    page_size = validate_int(
+        (
+            limit
+            if limit is not None
+            else current_app.config.get("ROOM_MEMBERS_PAGE_SIZE", 50)
+        ),
+        "limit",
+        required=True,
+        min_value=1,
+        max_value=current_app.config.get("ROOM_MEMBERS_MAX_PAGE_SIZE", 200),
+    )
+    prefix = validate_display_text(search, "q", required=False, min_len=1, max_len=128)
+    after = _decode_member_cursor(cursor) if cursor else None
+
+    room = resolve_room(room_public_id)
+    sort_name = _member_sort_name()
+    sort_key = (RoomMember.role, User.display_name.is_(None), sort_name, User.id)
     stmt = (
-        select(RoomMember, User)
-        .join(Room, Room.id == RoomMember.room_id)
+        select(RoomMember, User, sort_name.label("sort_name"))
         .join(User, User.id == RoomMember.user_id)
-        .where(Room.public_id == room_public_id)
-        .order_by(User.display_name.is_(None), User.display_name, User.name)
+        .where(RoomMember.room_id == room.id)
     )
-    rows = db.session.execute(stmt).all()
-    return rows
+    if prefix:
+        escaped = (
+            prefix.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        stmt = stmt.where(sort_name.like(f"{escaped}%"))
+    if after is not None:
+        role, display_name_missing, user_id, last_name = after
+        stmt = stmt.where(
+            tuple_(*sort_key) > tuple_(role, display_name_missing, last_name, user_id)
+        )
+    rows = db.session.execute(stmt.order_by(*sort_key).limit(page_size + 1)).all()
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        member, user, last_name = rows[-1]
+        next_cursor = _encode_member_cursor(
+            member.role, user.display_name is None, user.id, last_name
+        )
+    return [(member, user) for member, user, _ in rows], next_cursor
 
 
 def update_room_member_role(
@@ -227,16 +335,16 @@ def update_room_member_role(
     if desired_role == RoleType.OWNER:
         raise ValidationError("Owner role cannot be assigned manually.")
 
+    room = resolve_room(room_public_id)
     stmt = (
-        select(RoomMember, User, Room)
-        .join(Room, Room.id == RoomMember.room_id)
+        select(RoomMember, User)
         .join(User, User.id == RoomMember.user_id)
-        .where(Room.public_id == room_public_id, User.public_id == member_public_id)
+        .where(RoomMember.room_id == room.id, User.public_id == member_public_id)
     )
     record = db.session.execute(stmt).first()
     if not record:
         raise NotFoundError("Member not found in this room.")
-    member, user, room = record
+    member, user = record
 
     if member.role == RoleType.OWNER:
         raise ForbiddenError("Room owners cannot be demoted.")
@@ -265,15 +373,16 @@ def update_room_member_role(
 
     member.role = desired_role
     db.session.commit()
+    invalidate_room_roles(room_public_id, user.id)
     return member, user
 
 
 def list_room_invites(room_public_id: str) -> list[Invite]:
+    room = resolve_room(room_public_id)
     stmt = (
         select(Invite)
         .options(selectinload(Invite.redemptions))
-        .join(Room, Room.id == Invite.room_id)
-        .where(Invite.deleted_at.is_(None), Room.public_id == room_public_id)
+        .where(Invite.deleted_at.is_(None), Invite.room_id == room.id)
         .order_by(Invite.created_at.desc())
     )
     invites = db.session.execute(stmt).scalars().unique().all()
@@ -308,7 +417,7 @@ def create_room_invite(
         min_value=1,
         max_value=24 * 30,
     )
-    room = _get_room_by_public_id(room_public_id)
+    room = resolve_room(room_public_id)
 
     expires_at = None
     if expiry_hours is None:
@@ -337,14 +446,11 @@ def revoke_room_invite(
     cleaned_code = (invite_code or "").strip()
     if not cleaned_code:
         raise ValidationError("Invite code is required.")
-    stmt = (
-        select(Invite)
-        .join(Room, Room.id == Invite.room_id)
-        .where(
-            Invite.code == cleaned_code,
-            Invite.deleted_at.is_(None),
-            Room.public_id == room_public_id,
-        )
+    room = resolve_room(room_public_id)
+    stmt = select(Invite).where(
+        Invite.code == cleaned_code,
+        Invite.deleted_at.is_(None),
+        Invite.room_id == room.id,
     )
     invite = db.session.execute(stmt).scalar_one_or_none()
     if invite is None:
@@ -409,4 +515,5 @@ def accept_invite_code(*, code: str, user_id: int) -> tuple[RoomMember, Invite,
         db.session.add(redemption)
 
     db.session.commit()
+    invalidate_room_roles(room.public_id, user_id)
     return membership, invite, room
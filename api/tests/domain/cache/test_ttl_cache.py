@@ -0,0 +1,64 @@
+import pytest
+from domain.cache import TTLCache
+
+# ---------- Helpers / Fixtures ----------
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return TTLCache(30, max_entries=3, clock=clock)
+
+
+# --- get / set ---
+
+
+def test_ttl_cache_returns_value_before_expiry(cache, clock):
+    cache.set((1, "room"), "OWNER")
+    clock.now = 29.9
+    assert cache.get((1, "room")) == "OWNER"
+
+
+def test_ttl_cache_expires_value_after_ttl(cache, clock):
+    cache.set((1, "room"), "OWNER")
+    clock.now = 30
+    assert cache.get((1, "room")) is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_oldest_entry_when_full(cache):
+    for user_id in range(4):
+        cache.set((user_id, "room"), "MEMBER")
+    assert cache.get((0, "room")) is None
+    assert cache.get((3, "room")) == "MEMBER"
+
+
+def test_ttl_cache_disabled_with_zero_ttl(clock):
+    cache = TTLCache(0, clock=clock)
+    cache.set((1, "room"), "OWNER")
+    assert cache.get((1, "room")) is None
+
+
+# --- invalidation ---
+
+
+def test_ttl_cache_pop_where_only_drops_matching_keys(cache):
+    cache.set((1, "room-a"), "OWNER")
+    cache.set((2, "room-a"), "MEMBER")
+    cache.set((1, "room-b"), "VIEWER")
+    cache.pop_where(lambda key: key[1] == "room-a")
+    assert cache.get((1, "room-a")) is None
+    assert cache.get((2, "room-a")) is None
+    assert cache.get((1, "room-b")) == "VIEWER"
@@ -0,0 +1,33 @@
+from domain.ordering import POSITION_GAP, position_between, spaced_positions
+
+# --- position_between ---
+
+
+def test_position_between_empty_list_starts_one_gap_in():
+    assert position_between(None, None) == POSITION_GAP
+
+
+def test_position_between_appends_one_gap_after_last():
+    assert position_between(3 * POSITION_GAP, None) == 4 * POSITION_GAP
+
+
+def test_position_between_takes_midpoint():
+    assert position_between(POSITION_GAP, 2 * POSITION_GAP) == 1536
+
+
+def test_position_between_prepends_below_first():
+    assert position_between(None, POSITION_GAP) == 511
+    assert position_between(None, 1) == 0
+
+
+def test_position_between_returns_none_when_neighbours_are_adjacent():
+    assert position_between(5, 6) is None
+    assert position_between(None, 0) is None
+
+
+# --- spaced_positions ---
+
+
+def test_spaced_positions_are_gapped():
+    assert spaced_positions(3) == [POSITION_GAP, 2 * POSITION_GAP, 3 * POSITION_GAP]
+    assert spaced_positions(0) == []
@@ -0,0 +1,58 @@
+import sqlite3
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from persistence.engine import TimedQueuePool
+
+# ---------- Helpers / Fixtures ----------
+
+
+@pytest.fixture
+def pool():
+    pool = TimedQueuePool(
+        lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=1, timeout=0.05
+    )
+    yield pool
+    pool.dispose()
+
+
+# --- stats ---
+
+
+def test_fresh_pool_reports_empty_stats(pool):
+    stats = pool.stats()
+    assert stats["checked_out"] == 0
+    assert stats["overflow"] == 0
+    assert stats["checkouts"] == 0
+    assert stats["wait_ms_avg"] == 0.0
+
+
+def test_checkouts_and_overflow_are_counted(pool):
+    first = pool.connect()
+    second = pool.connect()
+    stats = pool.stats()
+    assert stats["checked_out"] == 2
+    assert stats["overflow"] == 1
+    assert stats["checkouts"] == 2
+    first.close()
+    second.close()
+    assert pool.stats()["checked_out"] == 0
+
+
+def test_exhausted_pool_counts_timeouts_and_wait(pool):
+    held = [pool.connect(), pool.connect()]
+    with pytest.raises(PoolTimeoutError):
+        pool.connect()
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["wait_ms_max"] >= 50
+    for connection in held:
+        connection.close()
+
+
+def test_recreated_pool_keeps_timing(pool):
+    recreated = pool.recreate()
+    assert isinstance(recreated, TimedQueuePool)
+    recreated.connect().close()
+    assert recreated.stats()["checkouts"] == 1
+    recreated.dispose()
@@ -0,0 +1,134 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from config import pooler_connect_args
+from persistence.engine import TimedQueuePool, install_request_timeouts
+
+# ---------- Helpers / Fixtures ----------
+
+# Postgres stands in for the pooler: a transaction pooler only breaks clients
+# that leave state on the server connection between transactions, so these
+# assert that none is left. With PGBOUNCER_URL set (e.g. the pgbouncer service
+# of docker/docker-compose.pooler.yml) the same traffic also runs through a
+# real transaction pooler.
+DATABASE_URL = os.getenv("DATABASE_URL")
+PGBOUNCER_URL = os.getenv("PGBOUNCER_URL")
+
+REPEATED_QUERY = "SELECT count(*) FROM users WHERE id > :floor"
+
+
+def make_engine(url: str, mode: str):
+    engine = create_engine(
+        url,
+        poolclass=TimedQueuePool,
+        pool_size=2,
+        max_overflow=0,
+        connect_args=pooler_connect_args(mode),
+    )
+    try:
+        engine.connect().close()
+    except OperationalError:
+        engine.dispose()
+        pytest.skip("database is unreachable")
+    return engine
+
+
+@pytest.fixture
+def engine_factory():
+    if not DATABASE_URL:
+        pytest.skip("DATABASE_URL is not set")
+    engines = []
+
+    def factory(mode: str, url: str = DATABASE_URL):
+        engine = make_engine(url, mode)
+        engines.append(engine)
+        return engine
+
+    yield factory
+    for engine in engines:
+        engine.dispose()
+
+
+def prepared_statement_count(connection) -> int:
+    for floor in range(10):
+        connection.execute(text(REPEATED_QUERY), {"floor": floor})
+    return connection.execute(
+        text("SELECT count(*) FROM pg_prepared_statements")
+    ).scalar_one()
+
+
+# --- connect arguments ---
+
+
+def test_session_mode_keeps_psycopg_defaults():
+    assert pooler_connect_args("session") == {}
+
+
+def test_transaction_mode_disables_prepared_statements():
+    assert pooler_connect_args("transaction") == {"prepare_threshold": None}
+
+
+def test_unknown_pooler_mode_is_rejected():
+    with pytest.raises(ValueError):
+        pooler_connect_args("statement")
+
+
+# --- server-side state ---
+
+
+def test_session_mode_prepares_repeated_statements(engine_factory):
+    # Guards the next test: psycopg does prepare once a query repeats.
+    with engine_factory("session").connect() as connection:
+        assert prepared_statement_count(connection) > 0
+
+
+def test_transaction_mode_leaves_no_prepared_statements(engine_factory):
+    with engine_factory("transaction").connect() as connection:
+        assert prepared_statement_count(connection) == 0
+
+
+def test_request_timeouts_end_with_the_transaction(engine_factory):
+    engine = engine_factory("transaction")
+    app = Flask(__name__)
+    app.config.update(DB_STATEMENT_TIMEOUT_MS=1234, DB_LOCK_TIMEOUT_MS=567)
+    Session = sessionmaker(engine)
+    install_request_timeouts(Session)
+
+    with app.test_request_context(), Session() as session:
+        show = "SELECT current_setting('statement_timeout'), pg_backend_pid()"
+        timeout, pid = session.execute(text(show)).one()
+        assert timeout == "1234ms"
+        session.commit()
+        # A plain transaction on the same server connection, as the next
+        # client of a pooler would get it.
+        with engine.connect() as connection:
+            timeout, next_pid = connection.execute(text(show)).one()
+        assert next_pid == pid
+        assert timeout != "1234ms"
+
+
+# --- through a real pooler ---
+
+
+def test_concurrent_transactions_through_pgbouncer(engine_factory):
+    if not PGBOUNCER_URL:
+        pytest.skip("PGBOUNCER_URL is not set")
+    engine = engine_factory("transaction", PGBOUNCER_URL)
+
+    def run(worker: int) -> int:
+        total = 0
+        for floor in range(25):
+            with engine.begin() as connection:
+                total += connection.execute(
+                    text(REPEATED_QUERY), {"floor": floor + worker}
+                ).scalar_one()
+        return total
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert len(list(executor.map(run, range(4)))) == 4
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+# ---------- Helpers / Fixtures ----------
+
+# These run against a migrated database; they are skipped without one.
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+
+SEED_STATEMENTS = (
+    "INSERT INTO users (name, display_name, last_login_at, public_id) "
+    "SELECT 'member probe ' || n, CASE WHEN n % 4 <> 0 THEN 'Probe ' || n END, "
+    "now(), gen_random_uuid() FROM generate_series(1, 2000) AS n",
+    "INSERT INTO rooms (owner_id, name, public_id) "
+    "SELECT min(u.id), 'member probe room ' || n, gen_random_uuid() FROM users u "
+    "CROSS JOIN generate_series(1, 100) AS n "
+    "WHERE u.name LIKE 'member probe %' GROUP BY n",
+    "INSERT INTO room_members (room_id, user_id, role) "
+    "SELECT r.id, u.id, "
+    "CASE WHEN u.id % 50 = 0 THEN 'ADMIN' ELSE 'MEMBER' END::role_type "
+    "FROM rooms r JOIN users u ON (u.id + r.id) % 10 = 0 "
+    "WHERE r.name LIKE 'member probe room %' AND u.name LIKE 'member probe %'",
+    "ANALYZE users, rooms, room_members",
+)
+
+
+@pytest.fixture(scope="module")
+def connection():
+    """
+    A connection holding a hundred seeded rooms of two hundred members each.
+    Everything is rolled back afterwards.
+    """
+    if not DATABASE_URL:
+        pytest.skip("DATABASE_URL is not set")
+    engine = create_engine(DATABASE_URL)
+    try:
+        conn = engine.connect()
+    except OperationalError:
+        engine.dispose()
+        pytest.skip("database is unreachable")
+    for statement in SEED_STATEMENTS:
+        conn.execute(text(statement))
+    yield conn
+    conn.rollback()
+    conn.close()
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def room_id(connection):
+    return connection.execute(text("SELECT currval('rooms_id_seq')")).scalar_one()
+
+
+def used_indexes(connection, sql: str) -> set[str]:
+    plan = connection.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+    found: set[str] = set()
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Index Name" in node:
+            found.add(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+    return found
+
+
+# --- member listing ---
+
+
+def test_member_page_uses_room_role_index(connection, room_id):
+    sql = (
+        "SELECT u.id FROM room_members m JOIN users u ON u.id = m.user_id "
+        f"WHERE m.room_id = {room_id} "
+        "ORDER BY m.role, u.display_name IS NULL, "
+        "lower(coalesce(u.display_name, u.name)), u.id LIMIT 51"
+    )
+    assert "ix_room_members_room_role" in used_indexes(connection, sql)
+
+
+def test_member_prefix_search_uses_sort_name_index(connection):
+    sql = (
+        "SELECT id FROM users "
+        "WHERE lower(coalesce(display_name, name)) LIKE 'probe 12%'"
+    )
+    assert "ix_users_sort_name" in used_indexes(connection, sql)
@@ -0,0 +1,148 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+# ---------- Helpers / Fixtures ----------
+
+# These run against a migrated database; they are skipped without one.
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+
+SEED_STATEMENTS = (
+    "INSERT INTO users (name, last_login_at, public_id) "
+    "VALUES ('index probe', now(), gen_random_uuid())",
+    "INSERT INTO rooms (owner_id, name, public_id) "
+    "SELECT currval('users_id_seq'), 'index probe ' || n, gen_random_uuid() "
+    "FROM generate_series(1, 200) AS n",
+    "INSERT INTO boards (room_id, name, public_id, deleted_at) "
+    "SELECT r.id, 'board ' || n, gen_random_uuid(), "
+    "CASE WHEN n = 1 THEN now() END "
+    "FROM rooms r CROSS JOIN generate_series(1, 3) AS n "
+    "WHERE r.owner_id = currval('users_id_seq')",
+    "INSERT INTO board_columns (board_id, title, position, deleted_at) "
+    "SELECT b.id, 'column ' || n, n, CASE WHEN n % 3 = 0 THEN now() END "
+    "FROM boards b JOIN rooms r ON r.id = b.room_id "
+    "CROSS JOIN generate_series(1, 9) AS n "
+    "WHERE r.owner_id = currval('users_id_seq')",
+    "INSERT INTO cards (board_id, column_id, title, position, public_id, deleted_at) "
+    "SELECT c.board_id, c.id, 'card ' || n, n * 1024, gen_random_uuid(), "
+    "CASE WHEN n % 2 = 0 THEN now() - n * interval '1 minute' END "
+    "FROM board_columns c JOIN boards b ON b.id = c.board_id "
+    "JOIN rooms r ON r.id = b.room_id CROSS JOIN generate_series(1, 12) AS n "
+    "WHERE r.owner_id = currval('users_id_seq')",
+    "INSERT INTO invites (room_id, code, role, public_id, deleted_at) "
+    "SELECT r.id, 'probe-' || r.id || '-' || n, 'MEMBER', gen_random_uuid(), "
+    "CASE WHEN n > 2 THEN now() END "
+    "FROM rooms r CROSS JOIN generate_series(1, 100) AS n "
+    "WHERE r.owner_id = currval('users_id_seq')",
+    "ANALYZE users, rooms, boards, board_columns, cards, invites",
+)
+
+
+@pytest.fixture(scope="module")
+def connection():
+    """
+    A connection holding a seeded, analyzed sample of boards, columns, cards
+    and invites, with a good share of them archived. Everything is rolled back
+    afterwards.
+    """
+    if not DATABASE_URL:
+        pytest.skip("DATABASE_URL is not set")
+    engine = create_engine(DATABASE_URL)
+    try:
+        conn = engine.connect()
+    except OperationalError:
+        engine.dispose()
+        pytest.skip("database is unreachable")
+    for statement in SEED_STATEMENTS:
+        conn.execute(text(statement))
+    yield conn
+    conn.rollback()
+    conn.close()
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def ids(connection):
+    return connection.execute(
+        text(
+            "SELECT b.room_id, b.id AS board_id, min(c.id) AS column_id "
+            "FROM boards b JOIN board_columns c ON c.board_id = b.id "
+            "WHERE b.name = 'board 2' AND b.room_id = ("
+            "  SELECT max(id) FROM rooms WHERE owner_id = currval('users_id_seq')"
+            ") GROUP BY b.room_id, b.id"
+        )
+    ).one()
+
+
+def used_indexes(connection, sql: str) -> set[str]:
+    plan = connection.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+    found: set[str] = set()
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Index Name" in node:
+            found.add(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+    return found
+
+
+# --- board read ---
+
+
+def test_board_columns_read_uses_active_index(connection, ids):
+    sql = (
+        f"SELECT id, title FROM board_columns WHERE board_id = {ids.board_id} "
+        "AND deleted_at IS NULL ORDER BY position"
+    )
+    assert "ix_board_columns_board_active" in used_indexes(connection, sql)
+
+
+def test_board_cards_read_uses_active_index(connection, ids):
+    sql = (
+        f"SELECT public_id, title, position FROM cards WHERE board_id = {ids.board_id} "
+        "AND deleted_at IS NULL ORDER BY column_id, position"
+    )
+    assert "ix_cards_board_active" in used_indexes(connection, sql)
+
+
+def test_room_boards_read_uses_active_index(connection, ids):
+    sql = (
+        f"SELECT public_id FROM boards WHERE room_id = {ids.room_id} "
+        "AND deleted_at IS NULL"
+    )
+    assert "ix_boards_room_active" in used_indexes(connection, sql)
+
+
+def test_room_invites_read_uses_active_index(connection, ids):
+    sql = (
+        f"SELECT code FROM invites WHERE room_id = {ids.room_id} "
+        "AND deleted_at IS NULL ORDER BY created_at DESC"
+    )
+    assert "ix_invites_room_active" in used_indexes(connection, sql)
+
+
+# --- WIP count ---
+
+
+def test_column_active_card_count_uses_active_index(connection, ids):
+    sql = (
+        f"SELECT count(*) FROM cards WHERE column_id = {ids.column_id} "
+        "AND deleted_at IS NULL"
+    )
+    assert "ix_cards_column_active" in used_indexes(connection, sql)
+
+
+# --- archive ---
+
+
+def test_archive_page_uses_archived_index(connection, ids):
+    sql = (
+        "SELECT id, public_id, title, column_id, deleted_at FROM cards "
+        f"WHERE board_id = {ids.board_id} AND deleted_at IS NOT NULL "
+        "AND (deleted_at, id) < (now(), 2147483647) "
+        "ORDER BY deleted_at DESC, id DESC LIMIT 51"
+    )
+    assert "ix_cards_board_archived" in used_indexes(connection, sql)
@@ -0,0 +1,95 @@
+import pytest
+
+# ---------- Helpers / Fixtures ----------
+
+
+@pytest.fixture
+def archive(client, board_url):
+    def archive(**params):
+        return client.get(f"{board_url}/archive", query_string=params)
+
+    return archive
+
+
+@pytest.fixture
+def archived(client, board_url, make_column, make_card):
+    """
+    Seven archived cards: five archived by one batch, so they share a
+    deleted_at and are ordered by id alone, then two more one at a time.
+    """
+    column = make_column("Archive source")
+    batch = [make_card(column, f"Batched {n}") for n in range(5)]
+    resp = client.post(
+        f"{board_url}/cards/batch",
+        json={"operations": [{"op": "archive", "card_id": c} for c in batch]},
+    )
+    assert resp.status_code == 200
+    singles = []
+    for n in range(2):
+        card = make_card(column, f"Single {n}")
+        client.delete(f"{board_url}/columns/{column}/cards/{card}")
+        singles.append(card)
+    return column, batch, singles
+
+
+def all_pages(archive, **params) -> list[dict]:
+    pages, cursor = [], None
+    while True:
+        resp = archive(cursor=cursor, **params) if cursor else archive(**params)
+        assert resp.status_code == 200
+        pages.append(resp.get_json())
+        cursor = pages[-1]["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+# --- keyset paging ---
+
+
+def test_pages_walk_the_archive_newest_first(archive, archived):
+    _, batch, singles = archived
+    pages = all_pages(archive, limit=2)
+
+    assert [len(page["cards"]) for page in pages] == [2, 2, 2, 1]
+    ids = [card["public_id"] for page in pages for card in page["cards"]]
+    assert ids[:2] == list(reversed(singles))
+    assert ids[2:] == list(reversed(batch))
+
+
+def test_archived_columns_come_with_the_first_page_only(
+    client, board_url, archive, archived, make_column
+):
+    gone = make_column("Archived column")
+    client.delete(f"{board_url}/columns/{gone}")
+    pages = all_pages(archive, limit=3)
+    assert [column["id"] for column in pages[0]["columns"]] == [gone]
+    assert all(page["columns"] == [] for page in pages[1:])
+
+
+def test_column_filter_pages_only_that_column(
+    client, board_url, archive, archived, make_column, make_card
+):
+    other = make_column("Other")
+    card = make_card(other)
+    client.delete(f"{board_url}/columns/{other}/cards/{card}")
+    pages = all_pages(archive, limit=1, column_id=other)
+    assert [c["public_id"] for page in pages for c in page["cards"]] == [card]
+
+
+def test_last_page_has_no_cursor(archive, archived):
+    page = archive(limit=50).get_json()
+    assert len(page["cards"]) == 7
+    assert page["next_cursor"] is None
+
+
+# --- validation ---
+
+
+@pytest.mark.parametrize("params", [{"cursor": "not-a-cursor"}, {"limit": 0}])
+def test_bad_paging_arguments_are_rejected(archive, params):
+    assert archive(**params).status_code == 422
+
+
+def test_limit_is_capped(app, archive):
+    too_big = app.config.get("ARCHIVE_MAX_PAGE_SIZE", 200) + 1
+    assert archive(limit=too_big).status_code == 422
@@ -0,0 +1,86 @@
+import pytest
+
+# ---------- Helpers / Fixtures ----------
+
+
+def columns_of(client, url) -> list[dict]:
+    return client.get(url).get_json()["columns"]
+
+
+def shape(columns: list[dict]) -> list[tuple]:
+    """Column layout without database ids, parents named by their index."""
+    index = {column["id"]: n for n, column in enumerate(columns)}
+    return [
+        (
+            column["title"],
+            column["wip_limit"],
+            index.get(column["parent_id"]),
+            [(card["title"], card["position"]) for card in column["cards"]],
+        )
+        for column in columns
+    ]
+
+
+@pytest.fixture
+def duplicate(client, room_id, board_url):
+    def duplicate(**body):
+        resp = client.post(f"{board_url}/duplicate", json=body)
+        assert resp.status_code == 201, resp.get_json()
+        payload = resp.get_json()
+        payload["url"] = f"/api/rooms/{room_id}/boards/{payload['board_id']}"
+        return payload
+
+    return duplicate
+
+
+# --- duplicate_board ---
+
+
+def test_duplicate_copies_active_columns_and_cards(
+    client, board_url, make_column, make_card, duplicate
+):
+    parent = make_column("Parent")
+    child = client.post(
+        f"{board_url}/columns", json={"title": "Child", "parent_id": parent}
+    ).get_json()["column"]["id"]
+    make_card(child, "Nested")
+    archived_card = make_card(parent, "Archived card")
+    client.delete(f"{board_url}/columns/{parent}/cards/{archived_card}")
+    archived_column = make_column("Archived column")
+    make_card(archived_column, "Gone with its column")
+    client.delete(f"{board_url}/columns/{archived_column}")
+    source = columns_of(client, board_url)
+
+    copy = duplicate()
+
+    copied = columns_of(client, copy["url"])
+    assert shape(copied) == shape(source)
+    assert copy["copied_cards"] == sum(len(column["cards"]) for column in source)
+    assert not {c["id"] for c in copied} & {c["id"] for c in source}
+    source_card_ids = {card["id"] for column in source for card in column["cards"]}
+    assert not {card["id"] for c in copied for card in c["cards"]} & source_card_ids
+    assert columns_of(client, board_url) == source
+
+
+def test_duplicate_is_named_after_the_source(client, board_url, duplicate):
+    name = client.get(board_url).get_json()["board"]["name"]
+    assert duplicate()["name"] == f"{name} (copy)"
+    assert duplicate(name="Second copy")["name"] == "Second copy"
+
+
+def test_copied_columns_keep_counters(client, duplicate):
+    copy = duplicate()
+    column = next(c for c in columns_of(client, copy["url"]) if c["cards"])
+    assert column["active_card_count"] == len(column["cards"])
+    resp = client.post(
+        f"{copy['url']}/columns/{column['id']}/cards", json={"title": "Appended"}
+    )
+    assert resp.status_code == 201
+    positions = [card["position"] for card in column["cards"]]
+    assert resp.get_json()["card"]["position"] > max(positions)
+
+
+def test_duplicate_name_must_be_free(client, board_url, duplicate):
+    duplicate(name="Taken name")
+    resp = client.post(f"{board_url}/duplicate", json={"name": "Taken name"})
+    assert resp.status_code == 409
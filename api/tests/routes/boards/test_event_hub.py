@@ -0,0 +1,114 @@
+import pytest
+
+from src.domain.exceptions import ServiceUnavailableError
+from src.routes.boards.events import BoardEventHub
+
+# ---------- Helpers / Fixtures ----------
+
+# Nothing listens on port 1, so the listener thread just keeps retrying.
+UNREACHABLE_DSN = "postgresql://nobody@127.0.0.1:1/none?connect_timeout=1"
+
+
+@pytest.fixture
+def hub():
+    hub = BoardEventHub(UNREACHABLE_DSN, max_streams=2, poll_seconds=0.01)
+    yield hub
+    # With nobody subscribed the listener thread exits on its next pass.
+    for board_id, inboxes in list(hub._subscribers.items()):
+        for inbox in list(inboxes):
+            hub.unsubscribe(board_id, inbox)
+    if hub._thread is not None:
+        hub._thread.join(timeout=1)
+
+
+# --- stream cap ---
+
+
+def test_streams_beyond_the_cap_are_refused(hub):
+    hub.subscribe(1)
+    hub.subscribe(2)
+    with pytest.raises(ServiceUnavailableError) as excinfo:
+        hub.subscribe(1)
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.retry_after >= 1
+
+
+def test_unsubscribing_frees_a_slot(hub):
+    first = hub.subscribe(1)
+    hub.subscribe(1)
+    hub.unsubscribe(1, first)
+    hub.unsubscribe(1, first)  # a second call must not free another slot
+    hub.subscribe(2)
+    with pytest.raises(ServiceUnavailableError):
+        hub.subscribe(3)
+
+
+# --- fan-out ---
+
+
+def test_publish_wakes_only_that_boards_subscribers(hub):
+    one = hub.subscribe(1)
+    two = hub.subscribe(2)
+    hub._publish(1)
+    assert one.get_nowait() == 1
+    assert two.empty()
+
+
+def test_listener_survives_unexpected_errors(hub, monkeypatch):
+    calls = []
+
+    def broken_connect(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        raise OSError("still down")
+
+    monkeypatch.setattr("src.routes.boards.events.psycopg.connect", broken_connect)
+    hub.subscribe(1)
+    hub._thread.join(timeout=0.2)
+    assert len(calls) >= 2
+    assert hub._thread.is_alive()
+
+
+def test_capacity_check_does_not_take_a_slot(hub):
+    hub.check_capacity()
+    hub.subscribe(1)
+    hub.check_capacity()
+    hub.subscribe(2)
+    with pytest.raises(ServiceUnavailableError):
+        hub.check_capacity()
+
+
+# --- streams ---
+
+
+def stream_count(app) -> int:
+    from src.routes.boards.events import EVENT_HUB_EXTENSION
+
+    return app.extensions[EVENT_HUB_EXTENSION]._stream_count
+
+
+def test_stream_closed_before_it_starts_holds_no_slot(
+    app, client, board_url, monkeypatch
+):
+    # The test client reads the first chunk itself, so drop the stream unread
+    # inside the view, as a server would when the client goes away first.
+    from src.routes.boards import routes
+
+    stream_board_events = routes.stream_board_events
+
+    def closed_unread(**kwargs):
+        stream_board_events(**kwargs).close()
+        return iter(())
+
+    monkeypatch.setattr(routes, "stream_board_events", closed_unread)
+    assert client.get(f"{board_url}/events").status_code == 200
+    assert stream_count(app) == 0
+
+
+def test_stream_releases_its_slot_when_closed(app, client, board_url):
+    resp = client.get(f"{board_url}/events", buffered=False)
+    assert next(resp.response).startswith(b"retry:")
+    assert stream_count(app) == 1
+    resp.close()
+    assert stream_count(app) == 0
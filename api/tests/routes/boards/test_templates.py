@@ -0,0 +1,26 @@
+import pytest
+
+from src.domain.exceptions import ValidationError
+from src.routes.boards.templates import DEFAULT_BOARD_TEMPLATE, resolve_board_template
+
+# --- resolve_board_template ---
+
+
+@pytest.mark.parametrize("key", [None, "", "   "])
+def test_missing_template_falls_back_to_default(key):
+    assert resolve_board_template(key).key == DEFAULT_BOARD_TEMPLATE
+
+
+def test_template_key_is_trimmed_and_case_insensitive():
+    assert resolve_board_template("  Kanban ").key == "kanban"
+
+
+@pytest.mark.parametrize("key", [5, ["kanban"], {"key": "kanban"}])
+def test_non_string_template_is_a_validation_error(key):
+    with pytest.raises(ValidationError):
+        resolve_board_template(key)
+
+
+def test_unknown_template_is_a_validation_error():
+    with pytest.raises(ValidationError, match="must be one of"):
+        resolve_board_template("nope")
@@ -0,0 +1,115 @@
+import json
+
+import pytest
+
+# ---------- Helpers / Fixtures ----------
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(app, monkeypatch):
+    # Force several INSERT and cursor chunks even for a template-sized board.
+    monkeypatch.setitem(app.config, "BOARD_TRANSFER_CHUNK_SIZE", 2)
+
+
+def export(client, board_url) -> list[dict]:
+    resp = client.get(f"{board_url}/export")
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/x-ndjson"
+    return [json.loads(line) for line in resp.get_data(as_text=True).splitlines()]
+
+
+def import_lines(client, room_id, records, **params):
+    body = "".join(json.dumps(record) + "\n" for record in records)
+    return client.post(
+        f"/api/rooms/{room_id}/boards/import",
+        data=body,
+        content_type="application/x-ndjson",
+        query_string=params,
+    )
+
+
+def normalized(records: list[dict]) -> list[dict]:
+    """Replace column refs, which are database ids, with their export order."""
+    order = {r["ref"]: n for n, r in enumerate(records) if r["type"] == "column"}
+    result = []
+    for record in records:
+        record = dict(record)
+        for key in ("ref", "parent_ref", "column_ref"):
+            if record.get(key) is not None:
+                record[key] = order[record[key]]
+        result.append(record)
+    return result
+
+
+# --- round trip ---
+
+
+def test_export_then_import_reproduces_the_board(
+    client, room_id, board_url, make_column, make_card
+):
+    column = make_column("Round trip")
+    kept, archived = make_card(column, "Kept"), make_card(column, "Archived")
+    client.delete(f"{board_url}/columns/{column}/cards/{archived}")
+    archived_column = make_column("Archived column")
+    make_card(archived_column, "Archived with its column")
+    client.delete(f"{board_url}/columns/{archived_column}")
+    original = export(client, board_url)
+
+    resp = import_lines(client, room_id, original, name="Imported copy")
+
+    assert resp.status_code == 201
+    body = resp.get_json()
+    assert body["name"] == "Imported copy"
+    copy_url = f"/api/rooms/{room_id}/boards/{body['board_id']}"
+    copied = export(client, copy_url)
+    assert copied[0] == {**original[0], "name": "Imported copy"}
+    assert normalized(copied[1:]) == normalized(original[1:])
+    assert sum(r["type"] == "card" and r["archived"] for r in copied) == 2
+    assert sum(r["type"] == "column" and r["archived"] for r in copied) == 1
+
+
+def test_imported_columns_accept_new_cards(client, room_id, board_url, make_card):
+    resp = import_lines(client, room_id, export(client, board_url), name="Appendable")
+    copy_url = f"/api/rooms/{room_id}/boards/{resp.get_json()['board_id']}"
+    column = client.get(copy_url).get_json()["columns"][0]
+    created = client.post(
+        f"{copy_url}/columns/{column['id']}/cards", json={"title": "After import"}
+    )
+    assert created.status_code == 201
+    assert created.get_json()["card"]["position"] > max(
+        card["position"] for card in column["cards"]
+    )
+
+
+# --- rejected imports ---
+
+
+def test_bad_line_leaves_no_partial_board(client, room_id, board_url):
+    boards_before = client.get(f"/api/rooms/{room_id}/boards").get_json()["boards"]
+    records = export(client, board_url)
+    records.append({"type": "card", "column_ref": -1, "title": "Orphan"})
+
+    resp = import_lines(client, room_id, records, name="Broken")
+
+    assert resp.status_code == 422
+    boards_after = client.get(f"/api/rooms/{room_id}/boards").get_json()["boards"]
+    assert boards_after == boards_before
+
+
+HEADER = {"type": "board", "format": 1, "name": "Rejected"}
+COLUMN = {"type": "column", "ref": 1, "title": "Column", "position": 0}
+
+
+@pytest.mark.parametrize(
+    "records, detail",
+    [
+        ([{"type": "column", "ref": 1}], "board header"),
+        ([{**HEADER, "format": 99}], "format"),
+        ([HEADER, {**COLUMN, "column_type": "swimlane"}], "Line 2: 'column_type'"),
+        ([HEADER, {**COLUMN, "column_type": 7}], "Line 2: 'column_type'"),
+    ],
+)
+def test_malformed_imports_are_rejected(client, room_id, records, detail):
+    resp = import_lines(client, room_id, records)
+    assert resp.status_code == 422
+    assert detail in resp.get_json()["detail"]
@@ -0,0 +1,124 @@
+import uuid
+
+import pytest
+
+# ---------- Helpers / Fixtures ----------
+
+
+@pytest.fixture
+def columns(make_column):
+    return make_column("Todo"), make_column("Done")
+
+
+@pytest.fixture
+def batch(client, board_url):
+    def batch(*operations):
+        return client.post(f"{board_url}/cards/batch", json={"operations": operations})
+
+    return batch
+
+
+@pytest.fixture
+def revision(client, board_url):
+    return lambda: client.get(board_url).get_json()["board"]["revision"]
+
+
+# --- applied batches ---
+
+
+def test_batch_applies_every_operation_in_one_revision(
+    batch, columns, make_card, column_cards, revision
+):
+    todo, done = columns
+    first, second = make_card(todo, "First"), make_card(todo, "Second")
+    before = revision()
+
+    resp = batch(
+        {"op": "create", "column_id": todo, "title": "Created"},
+        {"op": "move", "card_id": first, "column_id": done},
+        {"op": "archive", "card_id": second},
+    )
+
+    assert resp.status_code == 200
+    results = resp.get_json()["results"]
+    assert [r["status"] for r in results] == ["ok", "ok", "ok"]
+    created = results[0]["card"]["id"]
+    assert column_cards(todo) == [created]
+    assert column_cards(done) == [first]
+    assert revision() == before + 1
+
+
+def test_appends_after_a_batch_do_not_collide(batch, columns, make_card, column_cards):
+    todo, _ = columns
+    existing = make_card(todo, "Existing")
+    resp = batch(
+        {"op": "create", "column_id": todo, "title": "Batched"},
+        {"op": "move", "card_id": existing, "column_id": todo},
+    )
+    assert resp.status_code == 200
+    batched = resp.get_json()["results"][0]["card"]["id"]
+    appended = make_card(todo, "Appended")
+    assert column_cards(todo) == [batched, existing, appended]
+
+
+# --- failed batches ---
+
+
+def test_wip_limit_failure_rolls_back_the_whole_batch(
+    client, board_url, batch, columns, make_card, column_cards, revision
+):
+    todo, _ = columns
+    limited = client.post(
+        f"{board_url}/columns", json={"title": "Limited", "wip_limit": 1}
+    ).get_json()["column"]["id"]
+    card = make_card(todo, "Mover")
+    before = revision()
+
+    resp = batch(
+        {"op": "create", "column_id": todo, "title": "Not kept"},
+        {"op": "move", "card_id": card, "column_id": limited},
+        {"op": "create", "column_id": limited, "title": "Over the limit"},
+    )
+
+    assert resp.status_code == 409
+    results = resp.get_json()["results"]
+    assert [r["status"] for r in results] == ["not_applied", "not_applied", "error"]
+    assert all("card" not in r for r in results)
+    assert column_cards(todo) == [card]
+    assert column_cards(limited) == []
+    assert revision() == before
+
+
+def test_unknown_card_is_reported_per_item(batch, columns, make_card, column_cards):
+    todo, _ = columns
+    card = make_card(todo)
+    resp = batch(
+        {"op": "archive", "card_id": card},
+        {"op": "archive", "card_id": str(uuid.uuid4())},
+    )
+    assert resp.status_code == 404
+    assert [r["status"] for r in resp.get_json()["results"]] == [
+        "not_applied",
+        "error",
+    ]
+    assert column_cards(todo) == [card]
+
+
+def test_invalid_operations_are_rejected_before_any_write(batch, columns, revision):
+    todo, _ = columns
+    before = revision()
+    resp = batch(
+        {"op": "create", "column_id": todo, "title": "Fine"},
+        {"op": "explode"},
+        {"op": "move", "card_id": "not-a-uuid", "column_id": todo},
+    )
+    assert resp.status_code == 422
+    statuses = [r["status"] for r in resp.get_json()["results"]]
+    assert statuses == ["not_applied", "error", "error"]
+    assert revision() == before
+
+
+@pytest.mark.parametrize("operations", [None, [], "create"])
+def test_operations_must_be_a_non_empty_list(client, board_url, operations):
+    resp = client.post(f"{board_url}/cards/batch", json={"operations": operations})
+    assert resp.status_code == 422
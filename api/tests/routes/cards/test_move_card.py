@@ -0,0 +1,112 @@
+import pytest
+
+# ---------- Helpers / Fixtures ----------
+
+
+@pytest.fixture
+def column(make_column):
+    return make_column("Moves")
+
+
+@pytest.fixture
+def cards(column, make_card):
+    return [make_card(column, f"Card {n}") for n in range(3)]
+
+
+@pytest.fixture
+def move(client, board_url, column):
+    def move(card_id: str, **body):
+        return client.post(
+            f"{board_url}/columns/{column}/cards/{card_id}/move", json=body
+        )
+
+    return move
+
+
+# --- anchored moves ---
+
+
+def test_move_before_first_card(move, cards, column, column_cards):
+    resp = move(cards[2], before_id=cards[0])
+    assert resp.status_code == 200
+    assert resp.get_json()["rebalanced"] is False
+    assert column_cards(column) == [cards[2], cards[0], cards[1]]
+
+
+def test_move_after_middle_card(move, cards, column, column_cards):
+    assert move(cards[0], after_id=cards[1]).status_code == 200
+    assert column_cards(column) == [cards[1], cards[0], cards[2]]
+
+
+def test_move_to_end_then_append(move, cards, column, column_cards, make_card):
+    assert move(cards[0], after_id=cards[2]).status_code == 200
+    appended = make_card(column, "Appended")
+    assert column_cards(column) == [cards[1], cards[2], cards[0], appended]
+
+
+def test_move_to_end_of_another_column_then_append(
+    move, cards, column, column_cards, make_column, make_card
+):
+    other = make_column("Other")
+    last = make_card(other, "Last")
+    resp = move(cards[0], after_id=last)
+    assert resp.status_code == 200
+    assert resp.get_json()["card"]["column_id"] == other
+    appended = make_card(other, "Appended")
+    assert column_cards(other) == [last, cards[0], appended]
+    assert column_cards(column) == cards[1:]
+
+
+def test_crowded_slot_rebalances_the_column(move, cards, column, column_cards):
+    # Repeatedly moving into the slot before the first card halves the
+    # free space until the column has to be renumbered.
+    front, other = cards[0], cards[1]
+    rebalanced = False
+    for _ in range(20):
+        resp = move(other, before_id=front)
+        assert resp.status_code == 200
+        front, other = other, front
+        if resp.get_json()["rebalanced"]:
+            rebalanced = True
+            break
+    assert rebalanced
+    assert column_cards(column) == [front, other, cards[2]]
+
+
+def test_rebalanced_slot_equal_to_the_old_position_is_saved(
+    move, cards, column, column_cards, client, board_url, run_sql
+):
+    # A=1024, B=1025, C=1536: no room between A and B, so moving C after A
+    # renumbers the column to 1024/2048/3072 and lands C on 1536 again.
+    a, b, c = cards
+    set_position = "UPDATE cards SET position = :position WHERE public_id::text = :id"
+    run_sql(set_position, position=1536, id=c)
+    run_sql(set_position, position=1025, id=b)
+
+    resp = move(c, after_id=a)
+
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["rebalanced"] is True
+    assert body["card"]["position"] == 1536
+    assert column_cards(column) == [a, c, b]
+    stored = client.get(board_url).get_json()["columns"]
+    positions = {
+        card["id"]: card["position"]
+        for col in stored
+        if col["id"] == column
+        for card in col["cards"]
+    }
+    assert positions == {a: 1024, c: 1536, b: 2048}
+
+
+# --- validation ---
+
+
+def test_both_anchors_are_rejected(move, cards):
+    resp = move(cards[0], before_id=cards[1], after_id=cards[2])
+    assert resp.status_code == 422
+
+
+def test_moving_relative_to_itself_is_rejected(move, cards):
+    assert move(cards[0], after_id=cards[0]).status_code == 422
@@ -0,0 +1,163 @@
+import os
+import sys
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+# Route and service modules use package-relative imports, so these tests load
+# the application as the `src` package rather than from inside src/.
+API_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if API_DIR not in sys.path:
+    sys.path.insert(0, API_DIR)
+
+# The fixtures below run against a migrated database; tests that use them are
+# skipped without one.
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+
+@pytest.fixture(scope="session")
+def app():
+    if not DATABASE_URL:
+        pytest.skip("DATABASE_URL is not set")
+    os.environ.setdefault("SECRET_KEY", "test")
+    from src import create_app
+    from src.extensions import db
+
+    app = create_app()
+    app.config.update(TESTING=True, PROPAGATE_EXCEPTIONS=False)
+    with app.app_context():
+        try:
+            db.session.execute(text("SELECT 1"))
+        except OperationalError:
+            pytest.skip("database is unreachable")
+        finally:
+            db.session.remove()
+    return app
+
+
+@pytest.fixture
+def make_user(app):
+    """
+    Create users for one test. Every room they own, and the users themselves,
+    are deleted afterwards; other rows go with them by cascade.
+    """
+    from src.extensions import db
+    from src.persistence.models import User
+
+    created: list[int] = []
+
+    def make(name: str = "tester", **fields) -> User:
+        with app.app_context():
+            fields.setdefault("display_name", f"{name}_{uuid.uuid4().hex[:8]}")
+            user = User(name=name, last_login_at=datetime.now(timezone.utc), **fields)
+            db.session.add(user)
+            db.session.commit()
+            created.append(user.id)
+            db.session.expunge(user)
+            return user
+
+    yield make
+
+    with app.app_context():
+        if created:
+            ids = {"ids": created}
+            db.session.execute(
+                text("DELETE FROM rooms WHERE owner_id = ANY(:ids)"), ids
+            )
+            db.session.execute(text("DELETE FROM users WHERE id = ANY(:ids)"), ids)
+            db.session.commit()
+        db.session.remove()
+
+
+@pytest.fixture
+def run_sql(app):
+    """Run one committed statement; returns its rows, if any."""
+    from src.extensions import db
+
+    def run(sql: str, **params):
+        with app.app_context():
+            rows = db.session.execute(text(sql), params)
+            result = rows.all() if rows.returns_rows else None
+            db.session.commit()
+            return result
+
+    return run
+
+
+@pytest.fixture
+def login(app):
+    """Return a test client with `user` signed in."""
+
+    def login(user):
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session["public_id"] = str(user.public_id)
+        return client
+
+    return login
+
+
+@pytest.fixture
+def owner(make_user):
+    return make_user("owner")
+
+
+@pytest.fixture
+def client(login, owner):
+    return login(owner)
+
+
+@pytest.fixture
+def room_id(client):
+    """A fresh room owned by `owner`, with its default board."""
+    resp = client.post("/api/rooms", json={"name": "test_room"})
+    assert resp.status_code == 201, resp.get_json()
+    return resp.get_json()["public_id"]
+
+
+@pytest.fixture
+def board_url(client, room_id):
+    """URL of the room's default board."""
+    board_id = client.get(f"/api/rooms/{room_id}/boards").get_json()["boards"][0]
+    return f"/api/rooms/{room_id}/boards/{board_id}"
+
+
+@pytest.fixture
+def make_column(client, board_url):
+    """Add an empty column without a WIP limit; returns its id."""
+
+    def make(title: str = "Test column") -> int:
+        resp = client.post(f"{board_url}/columns", json={"title": title})
+        assert resp.status_code == 201, resp.get_json()
+        return resp.get_json()["column"]["id"]
+
+    return make
+
+
+@pytest.fixture
+def make_card(client, board_url):
+    """Append a card to a column; returns its public id."""
+
+    def make(column_id: int, title: str = "Test card") -> str:
+        resp = client.post(
+            f"{board_url}/columns/{column_id}/cards", json={"title": title}
+        )
+        assert resp.status_code == 201, resp.get_json()
+        return resp.get_json()["card"]["id"]
+
+    return make
+
+
+@pytest.fixture
+def column_cards(client, board_url):
+    """Card public ids of a column, in board order."""
+
+    def cards(column_id: int) -> list[str]:
+        board = client.get(board_url).get_json()
+        column = next(c for c in board["columns"] if c["id"] == column_id)
+        return [card["id"] for card in column["cards"]]
+
+    return cards
@@ -0,0 +1,118 @@
+from datetime import timedelta
+
+import pytest
+
+# ---------- Helpers / Fixtures ----------
+
+# Rows are backdated past RETENTION; the purge is global, so assertions stick
+# to this test's own board rather than overall totals.
+RETENTION = timedelta(days=365)
+EXPIRED = "now() - interval '400 days'"
+
+
+@pytest.fixture
+def purge(app):
+    from src.jobs.retention import purge_archived
+
+    def purge(**kwargs):
+        kwargs.setdefault("batch_size", 100)
+        with app.app_context():
+            return purge_archived(older_than=RETENTION, **kwargs)
+
+    return purge
+
+
+@pytest.fixture
+def board(client, board_url, make_column, make_card, run_sql):
+    """
+    A column with one active card, two expired archived cards and one card
+    archived today.
+    """
+    column = make_column("Purge source")
+    active = make_card(column, "Active")
+    expired = [make_card(column, f"Expired {n}") for n in range(2)]
+    recent = make_card(column, "Recent")
+    for card in [*expired, recent]:
+        client.delete(f"{board_url}/columns/{column}/cards/{card}")
+    run_sql(
+        f"UPDATE cards SET deleted_at = {EXPIRED} WHERE public_id::text = ANY(:ids)",
+        ids=expired,
+    )
+    return {"column": column, "active": active, "expired": expired, "recent": recent}
+
+
+def card_ids(run_sql, board_url) -> set[str]:
+    board_id = board_url.rsplit("/", 1)[1]
+    rows = run_sql(
+        "SELECT c.public_id::text FROM cards c JOIN boards b ON b.id = c.board_id "
+        "WHERE b.public_id::text = :board_id",
+        board_id=board_id,
+    )
+    return {row[0] for row in rows}
+
+
+def column_exists(run_sql, column_id: int) -> bool:
+    return bool(run_sql("SELECT 1 FROM board_columns WHERE id = :id", id=column_id))
+
+
+def board_revisions(client, board_url) -> int:
+    return client.get(board_url).get_json()["board"]["revision"]
+
+
+# --- purge_archived ---
+
+
+def test_dry_run_counts_without_deleting(purge, board, run_sql, board_url):
+    before = card_ids(run_sql, board_url)
+    result = purge(dry_run=True)
+    assert result.boards >= 1
+    assert result.cards == result.columns == 0
+    assert card_ids(run_sql, board_url) == before
+
+
+def test_only_cards_past_retention_are_deleted(
+    purge, board, run_sql, client, board_url
+):
+    revision = board_revisions(client, board_url)
+    result = purge(batch_size=1)
+    remaining = card_ids(run_sql, board_url)
+    assert result.cards >= 2
+    assert not remaining & set(board["expired"])
+    assert {board["active"], board["recent"]} <= remaining
+    # One revision per batch that deleted rows; empty batches roll back.
+    assert board_revisions(client, board_url) == revision + 2
+
+
+def test_column_is_kept_until_its_cards_are_gone(
+    purge, client, board_url, make_column, make_card, run_sql
+):
+    column = make_column("Archived column")
+    old, young = make_card(column, "Old"), make_card(column, "Young")
+    client.delete(f"{board_url}/columns/{column}")
+    run_sql(
+        f"UPDATE board_columns SET deleted_at = {EXPIRED} WHERE id = :id", id=column
+    )
+    run_sql(
+        f"UPDATE cards SET deleted_at = {EXPIRED} WHERE public_id::text = :id", id=old
+    )
+
+    purge()
+    assert column_exists(run_sql, column)
+    assert card_ids(run_sql, board_url) >= {young}
+    assert old not in card_ids(run_sql, board_url)
+
+    run_sql(
+        f"UPDATE cards SET deleted_at = {EXPIRED} WHERE public_id::text = :id",
+        id=young,
+    )
+    purge()
+    assert not column_exists(run_sql, column)
+    assert young not in card_ids(run_sql, board_url)
+
+
+def test_purge_marks_the_board_for_snapshot_reload(purge, board, client, board_url):
+    revision = board_revisions(client, board_url)
+    purge()
+    resp = client.get(f"{board_url}/changes", query_string={"since": revision})
+    assert resp.status_code == 200
+    assert resp.get_json()["mode"] == "snapshot"
@@ -0,0 +1,127 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, text
+
+# ---------- Helpers / Fixtures ----------
+
+EXPIRED = datetime.now(timezone.utc) - timedelta(days=1)
+
+
+@pytest.fixture
+def reap(app):
+    from src.jobs.guests import reap_expired_guests
+
+    def reap(batch_size: int = 50):
+        with app.app_context():
+            return reap_expired_guests(batch_size=batch_size)
+
+    return reap
+
+
+@pytest.fixture
+def guest(make_user):
+    return make_user("guest", is_guest=True, expires_at=EXPIRED)
+
+
+@pytest.fixture
+def guest_room(guest, run_sql):
+    """An expired guest room owned by `guest`."""
+    return run_sql(
+        "INSERT INTO rooms (owner_id, name, room_type, expires_at, public_id) "
+        "VALUES (:owner, 'expired guest room', 'GUEST', :expires, "
+        "gen_random_uuid()) RETURNING id",
+        owner=guest.id,
+        expires=EXPIRED,
+    )[0][0]
+
+
+@pytest.fixture
+def member_guest(make_user, room_id, run_sql):
+    """An expired guest who is a member of the owner's room."""
+    member = make_user("member guest", is_guest=True, expires_at=EXPIRED)
+    run_sql(
+        "INSERT INTO room_members (room_id, user_id, role) "
+        "SELECT id, :user_id, 'MEMBER' FROM rooms WHERE public_id::text = :room",
+        user_id=member.id,
+        room=room_id,
+    )
+    return member
+
+
+@pytest.fixture
+def reaper_lock():
+    """Hold the reaper's advisory lock from another connection."""
+    from src.jobs.guests import GUEST_REAPER_LOCK_KEY
+
+    engine = create_engine(os.environ["DATABASE_URL"])
+    with engine.connect() as conn:
+        conn.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": GUEST_REAPER_LOCK_KEY}
+        )
+        yield
+        conn.rollback()
+    engine.dispose()
+
+
+def exists(run_sql, table: str, row_id: int) -> bool:
+    return bool(run_sql(f"SELECT 1 FROM {table} WHERE id = :id", id=row_id))
+
+
+def cached_role_keys(app, room_id: str) -> list:
+    from src.domain.selectors.membership import ROLE_CACHE_EXTENSION
+
+    cache = app.extensions.get(ROLE_CACHE_EXTENSION)
+    keys = list(cache._entries) if cache is not None else []
+    return [key for key in keys if key[1] == room_id]
+
+
+# --- reap_expired_guests ---
+
+
+def test_expired_guest_rooms_then_their_owners_are_deleted(
+    reap, guest, guest_room, run_sql
+):
+    result = reap(batch_size=1)
+    assert not result.locked_out
+    assert result.rooms >= 1 and result.users >= 1
+    assert not exists(run_sql, "rooms", guest_room)
+    assert not exists(run_sql, "users", guest.id)
+
+
+def test_unexpired_guests_are_kept(reap, make_user, run_sql):
+    guest = make_user(
+        "fresh guest",
+        is_guest=True,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+    )
+    reap()
+    assert exists(run_sql, "users", guest.id)
+
+
+def test_rooms_losing_guest_members_are_bumped_and_uncached(
+    app, reap, client, room_id, member_guest, login, run_sql
+):
+    updated_at = "SELECT updated_at FROM rooms WHERE public_id::text = :id"
+    before = run_sql(updated_at, id=room_id)[0][0]
+    assert login(member_guest).get(f"/api/rooms/{room_id}").status_code == 200
+    assert client.get(f"/api/rooms/{room_id}").status_code == 200
+    etag = client.get("/api/rooms").headers["ETag"]
+
+    reap()
+
+    assert not exists(run_sql, "users", member_guest.id)
+    assert run_sql(updated_at, id=room_id)[0][0] > before
+    assert cached_role_keys(app, room_id) == []
+    assert client.get("/api/rooms").headers["ETag"] != etag
+
+
+def test_reaper_backs_off_while_another_worker_holds_the_lock(
+    reap, guest, guest_room, run_sql, reaper_lock
+):
+    result = reap()
+    assert result.locked_out
+    assert (result.rooms, result.users) == (0, 0)
+    assert exists(run_sql, "rooms", guest_room)
+    assert exists(run_sql, "users", guest.id)
@@ -0,0 +1,56 @@
+import pytest
+
+# ---------- Helpers / Fixtures ----------
+
+
+@pytest.fixture
+def boards(client, room_id):
+    """The room's default board and a second one, in board list order."""
+    resp = client.post(f"/api/rooms/{room_id}/boards", json={"name": "Second board"})
+    assert resp.status_code == 201
+    return client.get(f"/api/rooms/{room_id}/boards").get_json()["boards"]
+
+
+@pytest.fixture
+def bootstrap(client, room_id):
+    def bootstrap(**params):
+        resp = client.get(f"/api/rooms/{room_id}/bootstrap", query_string=params)
+        assert resp.status_code == 200
+        return resp.get_json()
+
+    return bootstrap
+
+
+def snapshot_board(payload: dict) -> str:
+    return payload["snapshot"]["board"]["public_id"]
+
+
+# --- board selection ---
+
+
+def test_requested_board_is_opened(bootstrap, boards):
+    first, second = boards
+    assert snapshot_board(bootstrap(board=second)) == second
+    assert snapshot_board(bootstrap(board=first)) == first
+
+
+def test_board_id_is_matched_case_insensitively(bootstrap, boards):
+    assert snapshot_board(bootstrap(board=boards[1].upper())) == boards[1]
+
+
+@pytest.mark.parametrize("board", [None, "", "not-a-uuid", "0" * 32])
+def test_unknown_board_falls_back_to_the_first(bootstrap, boards, board):
+    params = {} if board is None else {"board": board}
+    assert snapshot_board(bootstrap(**params)) == boards[0]
+
+
+def test_archived_board_falls_back_to_the_first(client, room_id, bootstrap, boards):
+    client.delete(f"/api/rooms/{room_id}/boards/{boards[1]}")
+    payload = bootstrap(board=boards[1])
+    assert snapshot_board(payload) == boards[0]
+    assert [b["public_id"] for b in payload["room"]["boards"]] == [boards[0]]
+
+
+def test_non_members_are_refused(make_user, login, room_id):
+    outsider = login(make_user("outsider"))
+    assert outsider.get(f"/api/rooms/{room_id}/bootstrap").status_code == 403
@@ -0,0 +1,167 @@
+import uuid
+
+import pytest
+
+# ---------- Helpers / Fixtures ----------
+
+ROLE_ORDER = ["OWNER", "ADMIN", "MEMBER", "VIEWER"]
+
+
+@pytest.fixture
+def add_member(run_sql):
+    def add(room_public_id: str, user, role: str = "MEMBER") -> None:
+        run_sql(
+            "INSERT INTO room_members (room_id, user_id, role) "
+            "SELECT id, :user_id, CAST(:role AS role_type) FROM rooms "
+            "WHERE public_id::text = :room",
+            user_id=user.id,
+            role=role,
+            room=room_public_id,
+        )
+
+    return add
+
+
+@pytest.fixture
+def members(room_id, make_user, add_member):
+    """
+    Nine members besides the owner across three roles, some without a display
+    name so they sort by name. A per-test tag keeps names unique.
+    """
+    tag = uuid.uuid4().hex[:6]
+    people = [
+        ("ADMIN", f"b{tag}", None),
+        ("ADMIN", f"a{tag}", f"A{tag} admin"),
+        ("MEMBER", f"c{tag}", f"c{tag}_first"),
+        ("MEMBER", f"d{tag}", f"C{tag}_second"),
+        ("MEMBER", f"e{tag}", None),
+        ("MEMBER", f"f{tag}", f"c{tag}xthird"),
+        ("VIEWER", f"g{tag}", f"G{tag} viewer"),
+        ("VIEWER", f"h{tag}", None),
+        ("VIEWER", f"i{tag}", f"I{tag} viewer"),
+    ]
+    for role, name, display_name in people:
+        add_member(room_id, make_user(name, display_name=display_name), role)
+    return tag
+
+
+def list_members(client, room_id, **params):
+    return client.get(f"/api/rooms/{room_id}/members", query_string=params)
+
+
+def walk(client, room_id, **params) -> list[dict]:
+    rows, cursor = [], None
+    while True:
+        page_params = {**params, "cursor": cursor} if cursor else params
+        resp = list_members(client, room_id, **page_params)
+        assert resp.status_code == 200
+        body = resp.get_json()
+        assert len(body["members"]) <= params.get("limit", 50)
+        rows.extend(body["members"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return rows
+
+
+def sort_key(member: dict) -> tuple:
+    display_name = member["display_name"]
+    return (
+        ROLE_ORDER.index(member["role"]),
+        display_name is None,
+        (display_name or member["name"]).lower(),
+    )
+
+
+# --- member paging ---
+
+
+def test_pages_cover_every_member_once_in_order(client, room_id, members):
+    everyone = walk(client, room_id, limit=200)
+    paged = walk(client, room_id, limit=2)
+    assert paged == everyone
+    assert len(everyone) == 10
+    assert len({m["user_public_id"] for m in paged}) == 10
+    assert [sort_key(m) for m in paged] == sorted(sort_key(m) for m in paged)
+
+
+def test_prefix_search_pages_too(client, room_id, members):
+    found = walk(client, room_id, q=f"c{members}_", limit=1)
+    assert [m["display_name"] for m in found] == [
+        f"c{members}_first",
+        f"C{members}_second",
+    ]
+
+
+def test_search_matches_names_of_members_without_display_names(
+    client, room_id, members
+):
+    found = walk(client, room_id, q=f"E{members}")
+    assert [m["name"] for m in found] == [f"e{members}"]
+
+
+@pytest.mark.parametrize("params", [{"cursor": "%%%"}, {"limit": 0}, {"limit": 10_000}])
+def test_bad_paging_arguments_are_rejected(client, room_id, params):
+    assert list_members(client, room_id, **params).status_code == 422
+
+
+# --- room summaries ---
+
+
+def test_summary_counts_match_the_full_view(client, room_id, owner, members):
+    boards = client.get(f"/api/rooms/{room_id}/boards").get_json()["boards"]
+    client.post(f"/api/rooms/{room_id}/boards", json={"name": "Kept board"})
+    archived = client.post(
+        f"/api/rooms/{room_id}/boards", json={"name": "Archived board"}
+    ).get_json()["board_id"]
+    client.delete(f"/api/rooms/{room_id}/boards/{archived}")
+    other_room = client.post("/api/rooms", json={"name": "second_room"})
+    other_room_id = other_room.get_json()["public_id"]
+
+    resp = client.get("/api/rooms", query_string={"view": "summary"})
+
+    assert resp.status_code == 200
+    summaries = {r["public_id"]: r for r in resp.get_json()["rooms"]}
+    assert set(summaries) == {room_id, other_room_id}
+    room = summaries[room_id]
+    assert room["member_count"] == 10
+    assert room["board_count"] == len(boards) + 1
+    assert room["membership"] == {
+        "role": "OWNER",
+        "user_public_id": str(owner.public_id),
+    }
+    assert summaries[other_room_id]["member_count"] == 1
+
+    full = {r["public_id"]: r for r in client.get("/api/rooms").get_json()["rooms"]}
+    assert len(full[room_id]["members"]) == room["member_count"]
+
+
+def test_summary_shows_the_callers_own_role(room_id, make_user, login, add_member):
+    viewer = make_user("viewer")
+    add_member(room_id, viewer, "VIEWER")
+    rooms = login(viewer).get("/api/rooms", query_string={"view": "summary"})
+    assert [
+        (r["public_id"], r["membership"]["role"]) for r in rooms.get_json()["rooms"]
+    ] == [(room_id, "VIEWER")]
+
+
+def test_unknown_view_is_rejected(client):
+    assert client.get("/api/rooms", query_string={"view": "tiny"}).status_code == 422
+
+
+def test_each_view_has_its_own_etag(client, room_id):
+    full = client.get("/api/rooms")
+    summary = client.get("/api/rooms", query_string={"view": "summary"})
+    assert full.headers["ETag"] != summary.headers["ETag"]
+
+    crossed = client.get(
+        "/api/rooms",
+        query_string={"view": "summary"},
+        headers={"If-None-Match": full.headers["ETag"]},
+    )
+    assert crossed.status_code == 200
+    same = client.get(
+        "/api/rooms",
+        query_string={"view": "summary"},
+        headers={"If-None-Match": summary.headers["ETag"]},
+    )
+    assert same.status_code == 304
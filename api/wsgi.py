@@ -1,3 +1,5 @@
 from src import create_app
+from src.jobs.scheduler import start_job_scheduler
 
 app = create_app()
+start_job_scheduler(app)
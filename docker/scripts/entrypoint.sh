@@ -6,4 +6,9 @@ if [ -z "$DATABASE_URL" ]; then
   exit 1
 fi
 
-exec gunicorn "wsgi:app" -b 0.0.0.0:${PORT:-8080} -w 4 --threads 4 --timeout 30
+# The app sizes its connection pool from these, so export the values used.
+export GUNICORN_WORKERS="${GUNICORN_WORKERS:-4}"
+export GUNICORN_THREADS="${GUNICORN_THREADS:-4}"
+
+exec gunicorn "wsgi:app" -b 0.0.0.0:${PORT:-8080} \
+  -w "$GUNICORN_WORKERS" --threads "$GUNICORN_THREADS" --timeout "${GUNICORN_TIMEOUT:-30}"
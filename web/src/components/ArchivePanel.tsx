@@ -16,6 +16,7 @@ interface ArchivePanelProps {
   onToggle: () => void;
   onRestore: (selection: ArchiveItemSelection) => Promise<void>;
   onHardDelete: (selection: ArchiveItemSelection) => Promise<void>;
+  onLoadMore: () => Promise<void>;
 }
 
 export default function ArchivePanel({
@@ -27,8 +28,10 @@ export default function ArchivePanel({
   onToggle,
   onRestore,
   onHardDelete,
+  onLoadMore,
 }: ArchivePanelProps) {
   const totalArchived = archive.columns.length + archive.cards.length;
+  const archivedLabel = archive.next_cursor ? `${totalArchived}+` : `${totalArchived}`;
   const [selectedColumnIds, setSelectedColumnIds] = useState<Set<number>>(new Set());
   const [selectedCardIds, setSelectedCardIds] = useState<Set<string>>(new Set());
   const [activeAction, setActiveAction] = useState<"restore" | "delete" | null>(null);
@@ -126,7 +129,7 @@ export default function ArchivePanel({
   return (
     <div className="fixed bottom-6 right-6 flex flex-col items-end gap-2">
       <RoundedButton size="sm" className="btn-sort" onClick={onToggle}>
-        {isOpen ? "Hide archived" : `Archived (${totalArchived})`}
+        {isOpen ? "Hide archived" : `Archived (${archivedLabel})`}
       </RoundedButton>
       {isOpen && (
         <div className="w-96 max-h-[28rem] overflow-y-auto rounded-2xl border border-amber-200 bg-white/95 p-4 shadow-xl">
@@ -216,6 +219,11 @@ export default function ArchivePanel({
                 ) : (
                   <p className="text-xs text-stone-500">No archived cards.</p>
                 )}
+                {archive.next_cursor && (
+                  <RoundedButton size="sm" className="btn-sort mt-2" onClick={() => void onLoadMore()}>
+                    Load more
+                  </RoundedButton>
+                )}
               </div>
             </div>
           )}
@@ -51,6 +51,19 @@ const ROLE_LABELS: Record<Role, string> = {
 
 const EDITABLE_ROLES: Role[] = ["VIEWER", "MEMBER", "ADMIN"];
 
+function draftsFor(members: RoomMember[]) {
+  const drafts: Record<string, MemberDraft> = {};
+  for (const member of members) {
+    drafts[member.user_public_id] = {
+      selectedRole: member.role,
+      confirmName: "",
+      isSaving: false,
+      error: null,
+    };
+  }
+  return drafts;
+}
+
 function formatDate(value: string | null) {
   if (!value) return "Never";
   try {
@@ -63,6 +76,10 @@ function formatDate(value: string | null) {
 
 export default function ManageRoomModal({ roomId, open, onClose }: Props) {
   const [members, setMembers] = useState<RoomMember[]>([]);
+  const [nextMemberCursor, setNextMemberCursor] = useState<string | null>(null);
+  const [memberSearch, setMemberSearch] = useState("");
+  const appliedMemberSearch = useRef("");
+  const [isLoadingMoreMembers, setLoadingMoreMembers] = useState(false);
   const [memberDrafts, setMemberDrafts] = useState<Record<string, MemberDraft>>({});
   const [invites, setInvites] = useState<RoomInvite[]>([]);
   const [isLoading, setLoading] = useState(false);
@@ -100,21 +117,15 @@ export default function ManageRoomModal({ roomId, open, onClose }: Props) {
     let cancelled = false;
     setLoading(true);
     setError(null);
+    setMemberSearch("");
+    appliedMemberSearch.current = "";
     Promise.all([fetchRoomMembers(roomId), fetchRoomInvites(roomId)])
       .then(([memberResp, inviteResp]) => {
         if (cancelled) return;
         const fetchedMembers = memberResp.members ?? [];
         setMembers(fetchedMembers);
-        const drafts: Record<string, MemberDraft> = {};
-        for (const member of fetchedMembers) {
-          drafts[member.user_public_id] = {
-            selectedRole: member.role,
-            confirmName: "",
-            isSaving: false,
-            error: null,
-          };
-        }
-        setMemberDrafts(drafts);
+        setNextMemberCursor(memberResp.next_cursor ?? null);
+        setMemberDrafts(draftsFor(fetchedMembers));
         setInvites(inviteResp.invites ?? []);
       })
       .catch((err: any) => {
@@ -132,11 +143,62 @@ export default function ManageRoomModal({ roomId, open, onClose }: Props) {
     };
   }, [open, roomId]);
 
+  useEffect(() => {
+    if (!open) {
+      return;
+    }
+    const search = memberSearch.trim();
+    if (search === appliedMemberSearch.current) {
+      return;
+    }
+    let cancelled = false;
+    const timeout = window.setTimeout(() => {
+      fetchRoomMembers(roomId, { search: search || undefined })
+        .then((resp) => {
+          if (cancelled) return;
+          appliedMemberSearch.current = search;
+          const fetchedMembers = resp.members ?? [];
+          setMembers(fetchedMembers);
+          setMemberDrafts(draftsFor(fetchedMembers));
+          setNextMemberCursor(resp.next_cursor ?? null);
+        })
+        .catch((err: any) => {
+          if (cancelled) return;
+          setError(err?.message || "Unable to search members right now.");
+        });
+    }, 250);
+
+    return () => {
+      cancelled = true;
+      window.clearTimeout(timeout);
+    };
+  }, [open, roomId, memberSearch]);
+
   const ownerId = useMemo(
     () => members.find((member) => member.role === "OWNER")?.user_public_id,
     [members]
   );
 
+  async function loadMoreMembers() {
+    if (nextMemberCursor === null) return;
+    setLoadingMoreMembers(true);
+    setError(null);
+    try {
+      const resp = await fetchRoomMembers(roomId, {
+        cursor: nextMemberCursor,
+        search: appliedMemberSearch.current || undefined,
+      });
+      const fetchedMembers = resp.members ?? [];
+      setMembers((prev) => [...prev, ...fetchedMembers]);
+      setMemberDrafts((prev) => ({ ...draftsFor(fetchedMembers), ...prev }));
+      setNextMemberCursor(resp.next_cursor ?? null);
+    } catch (err: any) {
+      setError(err?.message || "Unable to load more members right now.");
+    } finally {
+      setLoadingMoreMembers(false);
+    }
+  }
+
   function handleRoleChange(member: RoomMember, role: Role) {
     setMemberDrafts((prev) => {
       const existing = prev[member.user_public_id] ?? {
@@ -376,10 +438,29 @@ export default function ManageRoomModal({ roomId, open, onClose }: Props) {
             <p className="text-sm text-stone-600">
               Promote carefully — you&rsquo;ll need to type their name when giving someone more power.
             </p>
+            <TextField
+              label="Search members"
+              value={memberSearch}
+              onChange={setMemberSearch}
+              placeholder="Name starts with…"
+              maxLength={128}
+            />
             {members.length ? (
               <ul className="flex flex-col gap-3">{members.map(renderMember)}</ul>
             ) : (
-              <p className="text-sm text-stone-500">No other members yet.</p>
+              <p className="text-sm text-stone-500">
+                {memberSearch.trim() ? "No members match." : "No other members yet."}
+              </p>
+            )}
+            {nextMemberCursor !== null && (
+              <RoundedButton
+                size="sm"
+                className="btn-sort self-start"
+                disabled={isLoadingMoreMembers}
+                onClick={loadMoreMembers}
+              >
+                {isLoadingMoreMembers ? "Loading…" : "Load more members"}
+              </RoundedButton>
             )}
           </section>
 
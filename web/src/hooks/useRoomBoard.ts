@@ -1,10 +1,6 @@
 import { useCallback, useEffect, useRef, useState } from "react";
-import {
-  fetchBoardDetail,
-  fetchBoardIdsForRoom,
-  type BoardDetailResponse,
-} from "../services/boardService";
-import { fetchRoom, type RoomDto } from "../services/roomService";
+import { type BoardDetailResponse } from "../services/boardService";
+import { fetchRoomBootstrap, type RoomDto } from "../services/roomService";
 
 type State = {
   isLoading: boolean;
@@ -63,11 +59,11 @@ export function useRoomBoard(roomId: string | undefined) {
         room: isRoomChange ? null : prev.room,
       }));
       try {
-        const [roomData, boardsInRoom] = await Promise.all([
-          fetchRoom(activeRoomId),
-          fetchBoardIdsForRoom(activeRoomId),
-        ]);
-        if (!boardsInRoom.length) {
+        const { room: roomData, snapshot: detail } = await fetchRoomBootstrap(
+          activeRoomId,
+          previousBoardIdRef.current
+        );
+        if (!detail) {
           if (!cancelled) {
             hasLoadedOnce.current = true;
             previousBoardIdRef.current = null;
@@ -84,11 +80,7 @@ export function useRoomBoard(roomId: string | undefined) {
           return;
         }
 
-        const previousBoardId = previousBoardIdRef.current;
-        const boardId = previousBoardId && boardsInRoom.includes(previousBoardId)
-          ? previousBoardId
-          : boardsInRoom[0];
-        const detail = await fetchBoardDetail(activeRoomId, boardId);
+        const boardId = detail.board.public_id;
         const sortedColumns = detail.columns
           .slice()
           .sort((a, b) => a.position - b.position)
@@ -106,7 +98,7 @@ export function useRoomBoard(roomId: string | undefined) {
             activeBoardId: boardId,
             room: roomData,
           });
-          previousBoardIdRef.current = detail.board?.public_id ?? null;
+          previousBoardIdRef.current = boardId;
           setBoard(detail.board);
           setColumns(sortedColumns);
         }
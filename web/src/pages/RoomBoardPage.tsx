@@ -23,7 +23,7 @@ import {
   restoreColumn,
   restoreCard,
   reorderBoardColumns,
-  reorderColumnCards,
+  moveCard,
   fetchBoardArchive,
   type BoardArchiveResponse,
 } from "../services/boardService";
@@ -103,7 +103,7 @@ export default function RoomBoardPage() {
   });
   const [cardError, setCardError] = useState<string | null>(null);
   const [isCardSaving, setCardSaving] = useState(false);
-  const [archive, setArchive] = useState<BoardArchiveResponse>({ columns: [], cards: [] });
+  const [archive, setArchive] = useState<BoardArchiveResponse>({ columns: [], cards: [], next_cursor: null });
   const [archiveError, setArchiveError] = useState<string | null>(null);
   const [archiveNotice, setArchiveNotice] = useState<string | null>(null);
   const [isArchiveLoading, setArchiveLoading] = useState(false);
@@ -138,6 +138,21 @@ export default function RoomBoardPage() {
     }
   }, [roomId, board?.public_id]);
 
+  const loadMoreArchive = useCallback(async () => {
+    if (!roomId || !board?.public_id || !archive.next_cursor) return;
+    try {
+      const page = await fetchBoardArchive(roomId, board.public_id, { cursor: archive.next_cursor });
+      setArchive((prev) => ({
+        columns: prev.columns,
+        cards: [...prev.cards, ...page.cards],
+        next_cursor: page.next_cursor,
+      }));
+      setArchiveError(null);
+    } catch (err: any) {
+      setArchiveError(err?.message || "Could not load archived items.");
+    }
+  }, [roomId, board?.public_id, archive.next_cursor]);
+
   useEffect(() => {
     if (board) {
       void loadArchive();
@@ -302,6 +317,7 @@ export default function RoomBoardPage() {
           onToggle={() => setArchiveOpen((prev) => !prev)}
           onRestore={handleRestoreArchiveItems}
           onHardDelete={handleHardDeleteArchiveItems}
+          onLoadMore={loadMoreArchive}
         />
       </>
     );
@@ -468,7 +484,14 @@ export default function RoomBoardPage() {
     setCardReorderColumnId(columnId);
     setCardReorderError(null);
     try {
-      await reorderColumnCards(roomId, board.public_id, columnId, nextOrder);
+      const beforeId = nextOrder[targetIndex + 1];
+      await moveCard(
+        roomId,
+        board.public_id,
+        columnId,
+        cardId,
+        beforeId ? { before_id: beforeId } : { after_id: nextOrder[targetIndex - 1] }
+      );
       reload();
     } catch (err: any) {
       setCardReorderError(err?.message || "Could not reorder cards.");
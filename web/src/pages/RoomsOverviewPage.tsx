@@ -6,20 +6,12 @@ import TextField from "../components/TextField";
 import {
   acceptInvite,
   deleteRoom,
-  fetchRooms,
-  type RoomMember,
-  type RoomSummary,
+  fetchRoomSummaries,
+  type RoomListEntry,
   type Role,
 } from "../services/roomService";
 import { useNavigate } from "react-router-dom";
 
-const ROLE_LABELS: Record<Role, string> = {
-  OWNER: "Owner",
-  ADMIN: "Admin",
-  MEMBER: "Member",
-  VIEWER: "Viewer",
-};
-
 function describeMembershipRole(role: Role) {
   switch (role) {
     case "OWNER":
@@ -33,16 +25,16 @@ function describeMembershipRole(role: Role) {
   }
 }
 
-function memberDisplayName(member: RoomMember) {
-  return member.display_name?.trim() || member.name;
+function pluralize(count: number, noun: string) {
+  return `${count} ${noun}${count === 1 ? "" : "s"}`;
 }
 
 export default function RoomsOverviewPage() {
   const navigate = useNavigate();
-  const [rooms, setRooms] = useState<RoomSummary[]>([]);
+  const [rooms, setRooms] = useState<RoomListEntry[]>([]);
   const [error, setError] = useState<string | null>(null);
   const [isLoading, setLoading] = useState(true);
-  const [roomToDelete, setRoomToDelete] = useState<RoomSummary | null>(null);
+  const [roomToDelete, setRoomToDelete] = useState<RoomListEntry | null>(null);
   const [deleteConfirm, setDeleteConfirm] = useState("");
   const [deleteError, setDeleteError] = useState<string | null>(null);
   const [isDeleting, setDeleting] = useState(false);
@@ -54,7 +46,7 @@ export default function RoomsOverviewPage() {
   useEffect(() => {
     setLoading(true);
     setError(null);
-    fetchRooms()
+    fetchRoomSummaries()
       .then((data) => {
         setRooms(data.rooms ?? []);
       })
@@ -88,7 +80,7 @@ export default function RoomsOverviewPage() {
       const response = await acceptInvite(trimmed);
       setJoinNotice(`Joined ${response.room.name}.`);
       setInviteCode("");
-      const refreshed = await fetchRooms();
+      const refreshed = await fetchRoomSummaries();
       setRooms(refreshed.rooms ?? []);
     } catch (err: any) {
       setJoinError(err?.message || "Could not join the room.");
@@ -97,10 +89,7 @@ export default function RoomsOverviewPage() {
     }
   }
 
-  function renderRoomCard(room: RoomSummary) {
-    const currentUserId = room.membership?.user_public_id ?? null;
-    const visibleMembers = room.members.slice(0, 5);
-    const remainingMemberCount = room.members.length - visibleMembers.length;
+  function renderRoomCard(room: RoomListEntry) {
     const membershipLabel = describeMembershipRole(room.membership.role);
     const membershipBadgeTone =
       room.membership.role === "OWNER"
@@ -136,57 +125,9 @@ export default function RoomsOverviewPage() {
           Room ID: <code className="text-[11px]">{room.public_id}</code>
         </p>
 
-        <div>
-          <p className="text-xs uppercase tracking-wide text-stone-500">
-            Members ({room.members.length})
-          </p>
-          <ul className="mt-2 flex flex-wrap gap-2">
-            {visibleMembers.map((member) => {
-              const label =
-                member.user_public_id === currentUserId
-                  ? "You"
-                  : ROLE_LABELS[member.role];
-              return (
-                <li
-                  key={member.user_public_id}
-                  className="inline-flex items-center gap-2 rounded-full border border-stone-200 bg-stone-100 px-3 py-1 text-sm text-stone-700"
-                >
-                  <span className="font-medium text-stone-900">
-                    {memberDisplayName(member)}
-                  </span>
-                  <span className="text-[11px] uppercase tracking-wide text-stone-500">
-                    {label}
-                  </span>
-                </li>
-              );
-            })}
-            {remainingMemberCount > 0 && (
-              <li className="inline-flex items-center rounded-full border border-stone-200 bg-stone-50 px-3 py-1 text-sm text-stone-500">
-                +{remainingMemberCount} more
-              </li>
-            )}
-          </ul>
-        </div>
-
-        <div>
-          <p className="text-xs uppercase tracking-wide text-stone-500">
-            Boards
-          </p>
-          <ul className="mt-2 flex flex-col gap-2 text-sm text-stone-700">
-            {room.boards.length ? (
-              room.boards.map((board) => (
-                <li
-                  key={board.public_id}
-                  className="flex items-center justify-between gap-3"
-                >
-                  <span className="line-clamp-2 break-words">{board.name}</span>
-                </li>
-              ))
-            ) : (
-              <li className="text-stone-500">No boards yet.</li>
-            )}
-          </ul>
-        </div>
+        <p className="text-sm text-stone-700">
+          {pluralize(room.member_count, "member")} · {pluralize(room.board_count, "board")}
+        </p>
 
         {room.membership.role === "OWNER" && (
           <RoundedButton
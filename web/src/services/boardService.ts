@@ -17,6 +17,7 @@ export type BoardColumnDto = {
   wip_limit: number | null;
   column_type: string;
   parent_id: number | null;
+  active_card_count: number;
   cards: CardDto[];
 };
 
@@ -25,6 +26,7 @@ export type BoardDetailResponse = {
     public_id: string;
     name: string;
     room_id: string;
+    revision: number;
   };
   columns: BoardColumnDto[];
 };
@@ -32,6 +34,7 @@ export type BoardDetailResponse = {
 export type BoardArchiveResponse = {
   columns: { id: number; title: string; deleted_at: string | null }[];
   cards: { public_id: string; title: string; column_id: number; deleted_at: string | null }[];
+  next_cursor: string | null;
 };
 
 export async function fetchBoardIdsForRoom(roomId: string) {
@@ -119,6 +122,22 @@ export function reorderColumnCards(
   );
 }
 
+export function moveCard(
+  roomId: string,
+  boardId: string,
+  currentColumnId: number,
+  cardId: string,
+  payload: { column_id?: number; before_id?: string; after_id?: string }
+) {
+  return apiRequestJson<{ card: CardDto; rebalanced: boolean }>(
+    `/api/rooms/${roomId}/boards/${boardId}/columns/${currentColumnId}/cards/${cardId}/move`,
+    {
+      method: "POST",
+      body: JSON.stringify(payload),
+    }
+  );
+}
+
 export function updateCard(
   roomId: string,
   boardId: string,
@@ -198,9 +217,18 @@ export function hardDeleteArchivedCard(
   );
 }
 
-export function fetchBoardArchive(roomId: string, boardId: string) {
+export function fetchBoardArchive(
+  roomId: string,
+  boardId: string,
+  options?: { cursor?: string; columnId?: number; limit?: number }
+) {
+  const params = new URLSearchParams();
+  if (options?.cursor) params.set("cursor", options.cursor);
+  if (options?.columnId != null) params.set("column_id", String(options.columnId));
+  if (options?.limit != null) params.set("limit", String(options.limit));
+  const query = params.toString() ? `?${params.toString()}` : "";
   return apiRequestJson<BoardArchiveResponse>(
-    `/api/rooms/${roomId}/boards/${boardId}/archive`,
+    `/api/rooms/${roomId}/boards/${boardId}/archive${query}`,
     { method: "GET" }
   );
 }
@@ -1,3 +1,4 @@
+import type { BoardDetailResponse } from "./boardService";
 import { apiRequestJson } from "./http";
 
 export type Role = "OWNER" | "ADMIN" | "MEMBER" | "VIEWER";
@@ -27,11 +28,26 @@ export type RoomSummary = {
 
 export type RoomDto = RoomSummary;
 
+export type RoomListEntry = {
+  public_id: string;
+  name: string;
+  member_count: number;
+  board_count: number;
+  membership: RoomMembership;
+};
+
+export type RoomBootstrapResponse = {
+  room: RoomDto;
+  snapshot: BoardDetailResponse | null;
+};
+
 type CreateRoomResp = { public_id: string; name: string };
 
 type RoomsResponse = { rooms: RoomSummary[] };
 
-type MembersResponse = { members: RoomMember[] };
+type RoomListResponse = { rooms: RoomListEntry[] };
+
+type MembersResponse = { members: RoomMember[]; next_cursor: string | null };
 
 export type RoomInvite = {
   code: string;
@@ -44,10 +60,10 @@ export type RoomInvite = {
 
 type InvitesResponse = { invites: RoomInvite[] };
 
-export async function createRoom(name: string): Promise<string> {
+export async function createRoom(name: string, template?: string): Promise<string> {
   const data = await apiRequestJson<CreateRoomResp>("/api/rooms", {
     method: "POST",
-    body: JSON.stringify({ name }),
+    body: JSON.stringify(template ? { name, template } : { name }),
   });
 
   const id = data?.public_id;
@@ -61,10 +77,21 @@ export function fetchRoom(roomId: string) {
   return apiRequestJson<RoomDto>(`/api/rooms/${roomId}`, { method: "GET" });
 }
 
+export function fetchRoomBootstrap(roomId: string, boardId?: string | null) {
+  const query = boardId ? `?board=${encodeURIComponent(boardId)}` : "";
+  return apiRequestJson<RoomBootstrapResponse>(`/api/rooms/${roomId}/bootstrap${query}`, {
+    method: "GET",
+  });
+}
+
 export function fetchRooms() {
   return apiRequestJson<RoomsResponse>("/api/rooms", { method: "GET" });
 }
 
+export function fetchRoomSummaries() {
+  return apiRequestJson<RoomListResponse>("/api/rooms?view=summary", { method: "GET" });
+}
+
 export function deleteRoom(roomId: string) {
   return apiRequestJson<{ message: string }>(`/api/rooms/${roomId}`, {
     method: "DELETE",
@@ -77,8 +104,16 @@ export function leaveRoom(roomId: string) {
   });
 }
 
-export function fetchRoomMembers(roomId: string) {
-  return apiRequestJson<MembersResponse>(`/api/rooms/${roomId}/members`, {
+export function fetchRoomMembers(
+  roomId: string,
+  options?: { cursor?: string; limit?: number; search?: string }
+) {
+  const params = new URLSearchParams();
+  if (options?.cursor) params.set("cursor", options.cursor);
+  if (options?.limit != null) params.set("limit", String(options.limit));
+  if (options?.search) params.set("q", options.search);
+  const query = params.toString() ? `?${params.toString()}` : "";
+  return apiRequestJson<MembersResponse>(`/api/rooms/${roomId}/members${query}`, {
     method: "GET",
   });
 }